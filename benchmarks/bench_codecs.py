@@ -0,0 +1,132 @@
+import argparse
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from src.messaging import (
+    ClaudeRequest,
+    ClaudeResponse,
+    JsonCodec,
+    MessageSerializer,
+    MsgpackCodec,
+    decode_message,
+)
+from src.messaging.codecs import CODECS_BY_NAME
+
+logger = logging.getLogger(__name__)
+
+
+def build_samples() -> dict[str, BaseModel]:
+    now = datetime.now(tz=UTC)
+    plan = "\n".join(
+        f"{step}. Update module_{step}.py and cover the change with a focused test"
+        for step in range(1, 400)
+    )
+    return {
+        "text": ClaudeResponse(
+            request_id=str(uuid4()),
+            client_type="bot",
+            user_id=123456789,
+            response_type="text",
+            text="Reading the repository layout and the failing test output.",
+            timestamp=now,
+        ),
+        "plan_ready": ClaudeResponse(
+            request_id=str(uuid4()),
+            client_type="bot",
+            user_id=123456789,
+            response_type="plan_ready",
+            plan_content=plan,
+            accumulated_text=plan,
+            session_id=str(uuid4()),
+            timestamp=now,
+        ),
+        "request": ClaudeRequest(
+            request_id=str(uuid4()),
+            client_type="bot",
+            user_id=123456789,
+            project_id="agent_fleet",
+            project_path="/srv/projects/agent_fleet",
+            prompt="Refactor the messaging layer to support pluggable codecs.",
+            job_id=uuid4(),
+            timestamp=now,
+        ),
+    }
+
+
+def measure(operation: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def bench_codec(
+    serializer: MessageSerializer,
+    message: BaseModel,
+    iterations: int,
+) -> tuple[int, float, float]:
+    encoded = serializer.encode(message)
+    message_type = type(message)
+    encode_us = measure(lambda: serializer.encode(message), iterations)
+    decode_us = measure(
+        lambda: decode_message(
+            encoded.body,
+            encoded.content_type,
+            encoded.content_encoding,
+            message_type,
+        ),
+        iterations,
+    )
+    return len(encoded.body), encode_us, decode_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare messaging codecs")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--compress-threshold", type=int, default=4096)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    serializers = {
+        "json": MessageSerializer(JsonCodec()),
+        "json+deflate": MessageSerializer(
+            JsonCodec(), compress_threshold=args.compress_threshold
+        ),
+    }
+    if "msgpack" in CODECS_BY_NAME:
+        serializers["msgpack"] = MessageSerializer(MsgpackCodec())
+        serializers["msgpack+deflate"] = MessageSerializer(
+            MsgpackCodec(), compress_threshold=args.compress_threshold
+        )
+    else:
+        logger.info("msgpack is not installed, skipping the msgpack codec")
+
+    logger.info(
+        "%-11s %-16s %8s %12s %12s",
+        "message",
+        "codec",
+        "bytes",
+        "encode_us",
+        "decode_us",
+    )
+    for sample_name, message in build_samples().items():
+        for codec_name, serializer in serializers.items():
+            size, encode_us, decode_us = bench_codec(serializer, message, args.iterations)
+            logger.info(
+                "%-11s %-16s %8d %12.2f %12.2f",
+                sample_name,
+                codec_name,
+                size,
+                encode_us,
+                decode_us,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from src.bounded_context.agent_control.repos.async_redis_worker_registry import (
+    AsyncRedisWorkerRegistry,
+)
+
+__all__ = ["AsyncRedisWorkerRegistry"]
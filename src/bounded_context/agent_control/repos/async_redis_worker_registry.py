@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import time
+
+import redis.asyncio
+
+logger = logging.getLogger(__name__)
+
+# Keeps the current owner while it is alive, otherwise hands the project to
+# the candidate. Every routed request is counted so the owner can let go once
+# it has handled all of them.
+CLAIM_PROJECT_SCRIPT = """
+local owner = redis.call('HGET', KEYS[1], 'worker')
+if owner then
+    local seen = redis.call('ZSCORE', KEYS[2], owner)
+    if not seen or tonumber(seen) < tonumber(ARGV[2]) then
+        owner = false
+    end
+end
+if owner then
+    redis.call('HINCRBY', KEYS[1], 'pending', 1)
+else
+    owner = ARGV[1]
+    redis.call('HSET', KEYS[1], 'worker', owner, 'pending', 1)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return owner
+"""
+
+RELEASE_PROJECT_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'worker') ~= ARGV[1] then
+    return 0
+end
+if redis.call('HINCRBY', KEYS[1], 'pending', -1) <= 0 then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+
+class AsyncRedisWorkerRegistry:
+    WORKERS_KEY = "agent_fleet:claude_workers"
+    SESSIONS_KEY_PREFIX = "agent_fleet:project_sessions:"
+    SESSIONS_TTL_SECONDS = 86400
+    PROJECT_OWNER_KEY_PREFIX = "agent_fleet:project_owner:"
+    PROJECT_OWNER_TTL_SECONDS = 3600
+
+    def __init__(
+        self,
+        redis_client: redis.asyncio.Redis,
+        worker_id: str,
+        heartbeat_ttl_seconds: float = 15.0,
+    ) -> None:
+        self._redis = redis_client
+        self._worker_id = worker_id
+        self._heartbeat_ttl_seconds = heartbeat_ttl_seconds
+        self._claim_project = redis_client.register_script(CLAIM_PROJECT_SCRIPT)
+        self._release_project = redis_client.register_script(RELEASE_PROJECT_SCRIPT)
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    async def heartbeat(self) -> None:
+        now = time.time()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.WORKERS_KEY, {self._worker_id: now})
+            pipe.zremrangebyscore(
+                self.WORKERS_KEY, "-inf", now - self._heartbeat_ttl_seconds * 4
+            )
+            await pipe.execute()
+
+    async def run_heartbeat(self) -> None:
+        while True:
+            try:
+                await self.heartbeat()
+            except Exception:
+                logger.exception("Worker %s heartbeat failed", self._worker_id)
+            await asyncio.sleep(self._heartbeat_ttl_seconds / 3)
+
+    async def deregister(self) -> None:
+        await self._redis.zrem(self.WORKERS_KEY, self._worker_id)
+
+    async def get_live_workers(self) -> list[str]:
+        cutoff = time.time() - self._heartbeat_ttl_seconds
+        members = await self._redis.zrangebyscore(self.WORKERS_KEY, cutoff, "+inf")
+        return [member.decode("utf-8") for member in members]  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    async def register_session(self, project_id: str, session_id: str) -> None:
+        key = self._sessions_key(project_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, session_id, self._worker_id)
+            pipe.expire(key, self.SESSIONS_TTL_SECONDS)
+            await pipe.execute()
+
+    async def unregister_session(self, project_id: str, session_id: str) -> None:
+        await self._redis.hdel(self._sessions_key(project_id), session_id)  # pyright: ignore[reportGeneralTypeIssues]
+
+    async def get_session_owners(self, project_id: str) -> set[str]:
+        owners = await self._redis.hvals(self._sessions_key(project_id))  # pyright: ignore[reportGeneralTypeIssues]
+        if not owners:
+            return set()
+        live = set(await self.get_live_workers())
+        return {owner.decode("utf-8") for owner in owners} & live  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+
+    async def claim_project(self, project_id: str, candidate: str) -> str:
+        owner = await self._claim_project(
+            keys=[self._project_owner_key(project_id), self.WORKERS_KEY],
+            args=[
+                candidate,
+                time.time() - self._heartbeat_ttl_seconds,
+                self.PROJECT_OWNER_TTL_SECONDS,
+            ],
+        )
+        return owner.decode("utf-8") if isinstance(owner, bytes) else str(owner)
+
+    async def release_project(self, project_id: str) -> bool:
+        released = await self._release_project(
+            keys=[self._project_owner_key(project_id)],
+            args=[self._worker_id],
+        )
+        return bool(released)
+
+    def _project_owner_key(self, project_id: str) -> str:
+        return f"{self.PROJECT_OWNER_KEY_PREFIX}{project_id}"
+
+    def _sessions_key(self, project_id: str) -> str:
+        return f"{self.SESSIONS_KEY_PREFIX}{project_id}"
@@ -1,9 +1,17 @@
+import sys
+import time
 import uuid
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Literal
 
 from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
+from pydantic import BaseModel
 
+from src.bounded_context.agent_control.services.claude_client_pool import (
+    ClaudeClientPool,
+    ClientLease,
+)
 from src.bounded_context.task_execution.entities.execution_session import (
     ExecutionSession,
     SessionStatus,
@@ -12,10 +20,30 @@ from src.bounded_context.task_execution.entities.execution_session import (
 PermissionModeType = Literal["default", "acceptEdits", "plan"]
 
 
+class SessionManagerStats(BaseModel):
+    live_sessions: int
+    active_sessions: int
+    open_clients: int
+    projects_with_active_sessions: int
+    recent_sessions: int
+    approximate_memory_bytes: int
+
+
 class AgentSessionManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        history_size: int = 500,
+        history_ttl_seconds: float | None = None,
+        client_pool: ClaudeClientPool | None = None,
+    ) -> None:
         self._sessions: dict[str, ExecutionSession] = {}
         self._clients: dict[str, ClaudeSDKClient] = {}
+        self._leases: dict[str, ClientLease] = {}
+        self._client_pool = client_pool or ClaudeClientPool(size_per_key=0)
+        self._active_by_project: dict[str, dict[str, ExecutionSession]] = {}
+        self._history: OrderedDict[str, tuple[float, ExecutionSession]] = OrderedDict()
+        self._history_size = history_size
+        self._history_ttl_seconds = history_ttl_seconds
 
     def create_session(
         self,
@@ -42,12 +70,40 @@ class AgentSessionManager:
             status=SessionStatus.ACTIVE,
         )
 
-        self._sessions[session_id] = session
-        self._clients[session_id] = client
+        self._register(session, client)
+        return session
+
+    async def start_session(
+        self,
+        project_id: str,
+        working_directory: str,
+        task_id: str | None = None,
+        permission_mode: PermissionModeType = "default",
+        resume_session_id: str | None = None,
+    ) -> ExecutionSession:
+        lease = await self._client_pool.acquire(
+            working_directory=working_directory,
+            permission_mode=self._map_permission_mode(permission_mode),
+            resume_session_id=resume_session_id,
+        )
+        session = ExecutionSession(
+            id=str(uuid.uuid4()),
+            project_id=project_id,
+            task_id=task_id,
+            working_directory=working_directory,
+            status=SessionStatus.ACTIVE,
+        )
+        self._leases[session.id] = lease
+        self._register(session, lease.client)
         return session
 
     def get_session(self, session_id: str) -> ExecutionSession | None:
-        return self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
+        if session:
+            return session
+        self._prune_history()
+        entry = self._history.get(session_id)
+        return entry[1] if entry else None
 
     def get_client(self, session_id: str) -> ClaudeSDKClient | None:
         return self._clients.get(session_id)
@@ -60,28 +116,108 @@ class AgentSessionManager:
 
         await client.interrupt()
         session.status = SessionStatus.INTERRUPTED
+        self._remove_from_project_index(session)
         return True
 
     async def close_session(self, session_id: str) -> None:
-        client = self._clients.get(session_id)
-        session = self._sessions.get(session_id)
-
-        if client:
-            await client.disconnect()
-            del self._clients[session_id]
-
-        if session:
-            session.status = SessionStatus.COMPLETED
-            session.ended_at = datetime.now(tz=UTC)
+        client = self._clients.pop(session_id, None)
+        lease = self._leases.pop(session_id, None)
+        session = self._sessions.pop(session_id, None)
+
+        try:
+            if lease:
+                await self._client_pool.release(lease)
+            elif client:
+                await client.disconnect()
+        finally:
+            if session:
+                if session.status == SessionStatus.ACTIVE:
+                    session.status = SessionStatus.COMPLETED
+                session.ended_at = datetime.now(tz=UTC)
+                self._remove_from_project_index(session)
+                self._remember(session)
 
     def get_active_sessions(self) -> list[ExecutionSession]:
-        return [s for s in self._sessions.values() if s.status == SessionStatus.ACTIVE]
+        return [
+            session
+            for project_sessions in self._active_by_project.values()
+            for session in project_sessions.values()
+        ]
 
     def get_session_by_project(self, project_id: str) -> ExecutionSession | None:
-        for session in self._sessions.values():
-            if session.project_id == project_id and session.status == SessionStatus.ACTIVE:
-                return session
-        return None
+        project_sessions = self._active_by_project.get(project_id)
+        if not project_sessions:
+            return None
+        return next(iter(project_sessions.values()))
+
+    def get_recent_sessions(self) -> list[ExecutionSession]:
+        self._prune_history()
+        return [session for _, session in self._history.values()]
+
+    def get_stats(self) -> SessionManagerStats:
+        self._prune_history()
+        return SessionManagerStats(
+            live_sessions=len(self._sessions),
+            active_sessions=sum(len(s) for s in self._active_by_project.values()),
+            open_clients=len(self._clients),
+            projects_with_active_sessions=len(self._active_by_project),
+            recent_sessions=len(self._history),
+            approximate_memory_bytes=self._approximate_memory_bytes(),
+        )
+
+    async def close(self) -> None:
+        for session_id in list(self._sessions):
+            await self.close_session(session_id)
+        await self._client_pool.close()
+
+    def _register(self, session: ExecutionSession, client: ClaudeSDKClient) -> None:
+        self._sessions[session.id] = session
+        self._clients[session.id] = client
+        self._active_by_project.setdefault(session.project_id, {})[session.id] = session
+
+    def _remove_from_project_index(self, session: ExecutionSession) -> None:
+        project_sessions = self._active_by_project.get(session.project_id)
+        if project_sessions is None:
+            return
+        project_sessions.pop(session.id, None)
+        if not project_sessions:
+            del self._active_by_project[session.project_id]
+
+    def _remember(self, session: ExecutionSession) -> None:
+        if self._history_size <= 0:
+            return
+        self._history[session.id] = (time.monotonic(), session)
+        self._history.move_to_end(session.id)
+        while len(self._history) > self._history_size:
+            self._history.popitem(last=False)
+        self._prune_history()
+
+    def _prune_history(self) -> None:
+        if self._history_ttl_seconds is None:
+            return
+        cutoff = time.monotonic() - self._history_ttl_seconds
+        while self._history:
+            closed_at, _ = next(iter(self._history.values()))
+            if closed_at >= cutoff:
+                return
+            self._history.popitem(last=False)
+
+    def _approximate_memory_bytes(self) -> int:
+        sessions = list(self._sessions.values()) + [s for _, s in self._history.values()]
+        total = sum(
+            sys.getsizeof(container)
+            for container in (
+                self._sessions,
+                self._clients,
+                self._active_by_project,
+                self._history,
+            )
+        )
+        for session in sessions:
+            total += sys.getsizeof(session) + sum(
+                sys.getsizeof(value) for value in session.__dict__.values()
+            )
+        return total
 
     def _map_permission_mode(self, mode: PermissionModeType) -> PermissionModeType:
         return mode
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+PROC_DIR = Path("/proc")
+
+
+class CapacityState(Enum):
+    NORMAL = "normal"
+    CONSTRAINED = "constrained"
+    OVERLOADED = "overloaded"
+
+
+class CapacitySnapshot(BaseModel):
+    state: CapacityState
+    pressure: float
+    active_sessions: int
+    child_processes: int
+    child_rss_bytes: int
+    load_average: float
+    cpu_count: int
+
+
+class CapacityMonitor:
+    def __init__(
+        self,
+        active_sessions: Callable[[], int],
+        max_child_rss_bytes: int | None = None,
+        max_active_sessions: int | None = None,
+        max_load_per_cpu: float | None = 1.5,
+        constrained_pressure: float = 0.8,
+        relax_pressure: float = 0.7,
+        recover_pressure: float = 0.9,
+        interval_seconds: float = 5.0,
+    ) -> None:
+        self._active_sessions = active_sessions
+        self._max_child_rss_bytes = max_child_rss_bytes
+        self._max_active_sessions = max_active_sessions
+        self._max_load_per_cpu = max_load_per_cpu
+        self._constrained_pressure = constrained_pressure
+        self._relax_pressure = relax_pressure
+        self._recover_pressure = recover_pressure
+        self._interval_seconds = interval_seconds
+        self._cpu_count = os.cpu_count() or 1
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._state = CapacityState.NORMAL
+        self._last: CapacitySnapshot | None = None
+
+    @property
+    def state(self) -> CapacityState:
+        return self._state
+
+    def get_last_snapshot(self) -> CapacitySnapshot | None:
+        return self._last
+
+    async def sample(self) -> CapacitySnapshot:
+        child_processes, child_rss_bytes = await asyncio.to_thread(self._child_usage)
+        load_average = os.getloadavg()[0] if hasattr(os, "getloadavg") else 0.0
+        active_sessions = self._active_sessions()
+
+        pressures = [0.0]
+        if self._max_child_rss_bytes:
+            pressures.append(child_rss_bytes / self._max_child_rss_bytes)
+        if self._max_active_sessions:
+            pressures.append(active_sessions / self._max_active_sessions)
+        if self._max_load_per_cpu:
+            pressures.append(load_average / (self._cpu_count * self._max_load_per_cpu))
+        pressure = max(pressures)
+
+        self._state = self._next_state(pressure)
+        self._last = CapacitySnapshot(
+            state=self._state,
+            pressure=pressure,
+            active_sessions=active_sessions,
+            child_processes=child_processes,
+            child_rss_bytes=child_rss_bytes,
+            load_average=load_average,
+            cpu_count=self._cpu_count,
+        )
+        return self._last
+
+    async def run(
+        self,
+        on_change: Callable[[CapacitySnapshot], Awaitable[None]],
+    ) -> None:
+        previous: CapacityState | None = None
+        while True:
+            try:
+                snapshot = await self.sample()
+                if snapshot.state != previous:
+                    logger.info(
+                        "Capacity %s (pressure %.2f, %d sessions, %d MiB in %d child processes, load %.2f)",
+                        snapshot.state.value,
+                        snapshot.pressure,
+                        snapshot.active_sessions,
+                        snapshot.child_rss_bytes // (1024 * 1024),
+                        snapshot.child_processes,
+                        snapshot.load_average,
+                    )
+                    await on_change(snapshot)
+                    previous = snapshot.state
+            except Exception:
+                logger.exception("Capacity sampling failed")
+            await asyncio.sleep(self._interval_seconds)
+
+    def _next_state(self, pressure: float) -> CapacityState:
+        # Leaving a state needs pressure to drop below a lower threshold than
+        # the one that entered it (recover_pressure for OVERLOADED,
+        # relax_pressure for CONSTRAINED), so consumption does not flap.
+        if pressure >= 1.0:
+            return CapacityState.OVERLOADED
+        if self._state == CapacityState.OVERLOADED and pressure >= self._recover_pressure:
+            return CapacityState.OVERLOADED
+        if pressure >= self._constrained_pressure:
+            return CapacityState.CONSTRAINED
+        if self._state != CapacityState.NORMAL and pressure >= self._relax_pressure:
+            return CapacityState.CONSTRAINED
+        return CapacityState.NORMAL
+
+    def _child_usage(self) -> tuple[int, int]:
+        children: dict[int, list[int]] = {}
+        try:
+            entries = list(PROC_DIR.iterdir())
+        except OSError:
+            return 0, 0
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                stat = (entry / "stat").read_text()
+            except OSError:
+                continue
+            # The command name may contain spaces, so parse after its ')'.
+            ppid = int(stat[stat.rindex(")") + 2 :].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+
+        count = 0
+        rss_bytes = 0
+        pending = list(children.get(os.getpid(), []))
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                resident_pages = int((PROC_DIR / str(pid) / "statm").read_text().split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            count += 1
+            rss_bytes += resident_pages * self._page_size
+        return count, rss_bytes
@@ -0,0 +1,243 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import Literal, NamedTuple
+
+from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+PermissionModeType = Literal["default", "acceptEdits", "plan"]
+
+
+class ClientKey(NamedTuple):
+    working_directory: str
+    permission_mode: PermissionModeType
+
+
+class ClientPoolStats(BaseModel):
+    keys: int
+    idle_clients: int
+    leased_clients: int
+    hits: int
+    misses: int
+    bypassed: int
+    spawned: int
+    spawn_failures: int
+    retired: int
+
+
+class ClientLease:
+    def __init__(self, key: ClientKey, client: ClaudeSDKClient) -> None:
+        self.key = key
+        self.client = client
+        self.idle_since = time.monotonic()
+        self.task: asyncio.Task[None] | None = None
+        self._released = asyncio.Event()
+
+    @property
+    def is_alive(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def mark_released(self) -> None:
+        self._released.set()
+
+    async def release(self) -> None:
+        self.mark_released()
+        if self.task is not None:
+            with contextlib.suppress(Exception):
+                await self.task
+
+    async def wait_released(self) -> None:
+        await self._released.wait()
+
+
+class ClaudeClientPool:
+    def __init__(
+        self,
+        size_per_key: int = 1,
+        max_idle_clients: int = 8,
+        idle_timeout_seconds: float = 600.0,
+        reap_interval_seconds: float = 30.0,
+    ) -> None:
+        self._size_per_key = size_per_key
+        self._max_idle_clients = max_idle_clients
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._reap_interval_seconds = reap_interval_seconds
+        self._idle: dict[ClientKey, deque[ClientLease]] = {}
+        self._leased: set[ClientLease] = set()
+        self._refills: dict[ClientKey, asyncio.Task[None]] = {}
+        self._reaper: asyncio.Task[None] | None = None
+        self._closed = False
+        self._refill_paused = False
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._spawned = 0
+        self._spawn_failures = 0
+        self._retired = 0
+
+    def start(self) -> None:
+        if self._reaper is None and self._size_per_key > 0:
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def acquire(
+        self,
+        working_directory: str,
+        permission_mode: PermissionModeType,
+        resume_session_id: str | None = None,
+    ) -> ClientLease:
+        key = ClientKey(working_directory, permission_mode)
+        if resume_session_id is not None:
+            self._bypassed += 1
+            lease = await self._spawn(key, resume_session_id)
+        else:
+            lease = self._take_idle(key)
+            if lease is None:
+                self._misses += 1
+                lease = await self._spawn(key, None)
+            else:
+                self._hits += 1
+            self._schedule_refill(key)
+        self._leased.add(lease)
+        return lease
+
+    async def release(self, lease: ClientLease) -> None:
+        self._leased.discard(lease)
+        await lease.release()
+
+    def pause_refill(self) -> None:
+        self._refill_paused = True
+        self._cancel_refills()
+
+    def resume_refill(self) -> None:
+        self._refill_paused = False
+
+    @property
+    def is_refill_paused(self) -> bool:
+        return self._refill_paused
+
+    def _cancel_refills(self) -> None:
+        for task in self._refills.values():
+            task.cancel()
+        self._refills.clear()
+
+    def get_stats(self) -> ClientPoolStats:
+        return ClientPoolStats(
+            keys=len(self._idle),
+            idle_clients=self._idle_count(),
+            leased_clients=len(self._leased),
+            hits=self._hits,
+            misses=self._misses,
+            bypassed=self._bypassed,
+            spawned=self._spawned,
+            spawn_failures=self._spawn_failures,
+            retired=self._retired,
+        )
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        self._cancel_refills()
+        idle = [lease for leases in self._idle.values() for lease in leases]
+        self._idle.clear()
+        for lease in idle:
+            await lease.release()
+            self._retired += 1
+
+    def _take_idle(self, key: ClientKey) -> ClientLease | None:
+        leases = self._idle.get(key)
+        while leases:
+            lease = leases.popleft()
+            if lease.is_alive:
+                return lease
+            self._retired += 1
+        return None
+
+    def _schedule_refill(self, key: ClientKey) -> None:
+        if self._closed or self._refill_paused or self._size_per_key <= 0:
+            return
+        task = self._refills.get(key)
+        if task is not None and not task.done():
+            return
+        self._refills[key] = asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: ClientKey) -> None:
+        while (
+            not self._closed
+            and not self._refill_paused
+            and len(self._idle.get(key, ())) < self._size_per_key
+            and self._idle_count() < self._max_idle_clients
+        ):
+            try:
+                lease = await self._spawn(key, None)
+            except Exception:
+                logger.warning("Failed to pre-spawn Claude client for %s", key, exc_info=True)
+                return
+            lease.idle_since = time.monotonic()
+            self._idle.setdefault(key, deque()).append(lease)
+
+    async def _spawn(self, key: ClientKey, resume_session_id: str | None) -> ClientLease:
+        options = ClaudeCodeOptions(
+            cwd=key.working_directory,
+            permission_mode=key.permission_mode,
+            resume=resume_session_id,
+        )
+        lease = ClientLease(key, ClaudeSDKClient(options=options))
+        connected: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lease.task = asyncio.create_task(self._hold(lease, connected))
+        try:
+            await connected
+        except BaseException:
+            lease.mark_released()
+            self._spawn_failures += 1
+            raise
+        self._spawned += 1
+        return lease
+
+    async def _hold(self, lease: ClientLease, connected: asyncio.Future[None]) -> None:
+        # The SDK binds its reader task group to the task that connects, so the
+        # same task has to disconnect the client once the lease is released.
+        try:
+            await lease.client.connect()
+        except asyncio.CancelledError:
+            connected.cancel()
+            raise
+        except Exception as e:
+            if not connected.done():
+                connected.set_exception(e)
+            return
+        if not connected.done():
+            connected.set_result(None)
+        try:
+            await lease.wait_released()
+        finally:
+            with contextlib.suppress(Exception):
+                await lease.client.disconnect()
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._reap_interval_seconds)
+            await self._retire_idle()
+
+    async def _retire_idle(self) -> None:
+        cutoff = time.monotonic() - self._idle_timeout_seconds
+        expired: list[ClientLease] = []
+        for key, leases in list(self._idle.items()):
+            for lease in list(leases):
+                if not lease.is_alive or lease.idle_since < cutoff:
+                    leases.remove(lease)
+                    expired.append(lease)
+            if not leases:
+                del self._idle[key]
+        for lease in expired:
+            await lease.release()
+            self._retired += 1
+
+    def _idle_count(self) -> int:
+        return sum(len(leases) for leases in self._idle.values())
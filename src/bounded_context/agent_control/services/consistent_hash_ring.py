@@ -0,0 +1,39 @@
+import bisect
+import hashlib
+from collections.abc import Iterable
+
+
+class ConsistentHashRing:
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64) -> None:
+        self._replicas = replicas
+        self._nodes: frozenset[str] = frozenset()
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        self.set_nodes(nodes)
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        return self._nodes
+
+    def set_nodes(self, nodes: Iterable[str]) -> None:
+        node_set = frozenset(nodes)
+        if node_set == self._nodes and self._points:
+            return
+        ring = sorted(
+            (self._hash(f"{node}#{replica}"), node)
+            for node in node_set
+            for replica in range(self._replicas)
+        )
+        self._nodes = node_set
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+
+    def get_node(self, key: str) -> str | None:
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[index]
+
+    def _hash(self, value: str) -> int:
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
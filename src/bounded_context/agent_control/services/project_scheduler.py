@@ -0,0 +1,221 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Mapping
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+
+class ProjectQueueStats(BaseModel):
+    project_id: str
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    last_wait_seconds: float = 0.0
+
+
+class FlowQueueStats(BaseModel):
+    client_type: str
+    user_id: int
+    queued: int = 0
+    dispatched: int = 0
+
+
+class FlowKey(NamedTuple):
+    client_type: str
+    user_id: int
+
+
+class ScheduledRun:
+    def __init__(self, project_id: str, flow: FlowKey, ready: asyncio.Future[None]) -> None:
+        self.project_id = project_id
+        self.flow = flow
+        self.ready = ready
+        self.enqueued_at = time.monotonic()
+
+
+class ProjectScheduler:
+    DEFAULT_FLOW = FlowKey("default", 0)
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        class_weights: Mapping[str, int] | None = None,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+        self._max_concurrent = max_concurrent
+        self._concurrency_limit: int | None = None
+        self._class_weights = dict(class_weights or {})
+        self._flows: dict[FlowKey, deque[ScheduledRun]] = {}
+        self._flow_order: dict[str, OrderedDict[FlowKey, None]] = {}
+        self._class_credit: dict[str, int] = {}
+        self._waiting_count = 0
+        self._running_projects: set[str] = set()
+        self._stats: dict[str, ProjectQueueStats] = {}
+        self._flow_stats: dict[FlowKey, FlowQueueStats] = {}
+
+    async def run[R](
+        self,
+        project_id: str,
+        operation: Callable[[], Awaitable[R]],
+        client_type: str | None = None,
+        user_id: int | None = None,
+    ) -> R:
+        flow = (
+            FlowKey(client_type, user_id)
+            if client_type is not None and user_id is not None
+            else self.DEFAULT_FLOW
+        )
+        entry = ScheduledRun(project_id, flow, asyncio.get_running_loop().create_future())
+        self._get_stats(project_id).queued += 1
+        self._enqueue(entry)
+        self._dispatch()
+
+        try:
+            await entry.ready
+        except asyncio.CancelledError:
+            if self._discard(entry):
+                self._get_stats(project_id).queued -= 1
+            else:
+                self._release(project_id)
+            raise
+
+        try:
+            return await operation()
+        finally:
+            self._release(project_id)
+
+    def get_stats(self) -> list[ProjectQueueStats]:
+        return [stats.model_copy() for stats in self._stats.values()]
+
+    def get_project_stats(self, project_id: str) -> ProjectQueueStats | None:
+        stats = self._stats.get(project_id)
+        return stats.model_copy() if stats else None
+
+    def get_flow_stats(self) -> list[FlowQueueStats]:
+        return [stats.model_copy() for stats in self._flow_stats.values()]
+
+    def set_concurrency_limit(self, limit: int | None) -> None:
+        self._concurrency_limit = limit
+        self._dispatch()
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running_projects)
+
+    @property
+    def waiting_count(self) -> int:
+        return self._waiting_count
+
+    def _enqueue(self, entry: ScheduledRun) -> None:
+        queue = self._flows.get(entry.flow)
+        if queue is None:
+            queue = deque()
+            self._flows[entry.flow] = queue
+            self._flow_order.setdefault(entry.flow.client_type, OrderedDict())[
+                entry.flow
+            ] = None
+        queue.append(entry)
+        self._waiting_count += 1
+        self._get_flow_stats(entry.flow).queued += 1
+
+    def _discard(self, entry: ScheduledRun) -> bool:
+        queue = self._flows.get(entry.flow)
+        if queue is None or entry not in queue:
+            return False
+        queue.remove(entry)
+        self._waiting_count -= 1
+        self._get_flow_stats(entry.flow).queued -= 1
+        if not queue:
+            self._drop_flow(entry.flow)
+        return True
+
+    def _drop_flow(self, flow: FlowKey) -> None:
+        del self._flows[flow]
+        order = self._flow_order[flow.client_type]
+        del order[flow]
+        if not order:
+            del self._flow_order[flow.client_type]
+            self._class_credit.pop(flow.client_type, None)
+
+    def _dispatch(self) -> None:
+        capacity = self._max_concurrent
+        if self._concurrency_limit is not None:
+            capacity = max(1, min(capacity, self._concurrency_limit))
+        while len(self._running_projects) < capacity:
+            entry = self._next_entry()
+            if entry is None:
+                return
+            self._start(entry)
+
+    def _next_entry(self) -> ScheduledRun | None:
+        # Smooth weighted round-robin across client types, then plain
+        # round-robin across users within the chosen client type.
+        candidates = {
+            client_type: entry
+            for client_type in self._flow_order
+            if (entry := self._next_in_class(client_type)) is not None
+        }
+        if not candidates:
+            return None
+        total = 0
+        for client_type in candidates:
+            weight = self._class_weights.get(client_type, 1)
+            self._class_credit[client_type] = self._class_credit.get(client_type, 0) + weight
+            total += weight
+        chosen = max(candidates, key=lambda client_type: self._class_credit[client_type])
+        self._class_credit[chosen] -= total
+
+        entry = candidates[chosen]
+        self._flows[entry.flow].remove(entry)
+        self._waiting_count -= 1
+        self._flow_order[chosen].move_to_end(entry.flow)
+        if not self._flows[entry.flow]:
+            self._drop_flow(entry.flow)
+        return entry
+
+    def _next_in_class(self, client_type: str) -> ScheduledRun | None:
+        for flow in self._flow_order[client_type]:
+            for entry in self._flows[flow]:
+                if entry.project_id not in self._running_projects:
+                    return entry
+        return None
+
+    def _start(self, entry: ScheduledRun) -> None:
+        wait_seconds = time.monotonic() - entry.enqueued_at
+        stats = self._get_stats(entry.project_id)
+        stats.queued -= 1
+        stats.running += 1
+        stats.total_wait_seconds += wait_seconds
+        stats.last_wait_seconds = wait_seconds
+        stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+        flow_stats = self._get_flow_stats(entry.flow)
+        flow_stats.queued -= 1
+        flow_stats.dispatched += 1
+        self._running_projects.add(entry.project_id)
+        entry.ready.set_result(None)
+
+    def _release(self, project_id: str) -> None:
+        self._running_projects.discard(project_id)
+        stats = self._get_stats(project_id)
+        stats.running -= 1
+        stats.completed += 1
+        self._dispatch()
+
+    def _get_stats(self, project_id: str) -> ProjectQueueStats:
+        stats = self._stats.get(project_id)
+        if stats is None:
+            stats = ProjectQueueStats(project_id=project_id)
+            self._stats[project_id] = stats
+        return stats
+
+    def _get_flow_stats(self, flow: FlowKey) -> FlowQueueStats:
+        stats = self._flow_stats.get(flow)
+        if stats is None:
+            stats = FlowQueueStats(client_type=flow.client_type, user_id=flow.user_id)
+            self._flow_stats[flow] = stats
+        return stats
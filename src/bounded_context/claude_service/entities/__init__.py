@@ -1,4 +1,18 @@
 from src.bounded_context.claude_service.entities.job import Job, JobStatus
+from src.bounded_context.claude_service.entities.project_usage import (
+    DailyProjectUsage,
+    ProjectUsageSummary,
+)
 from src.bounded_context.claude_service.entities.session import Session
+from src.bounded_context.claude_service.entities.session_log_stats import SessionLogStats
+from src.bounded_context.claude_service.entities.session_usage import SessionUsage
 
-__all__ = ["Job", "JobStatus", "Session"]
+__all__ = [
+    "DailyProjectUsage",
+    "Job",
+    "JobStatus",
+    "ProjectUsageSummary",
+    "Session",
+    "SessionLogStats",
+    "SessionUsage",
+]
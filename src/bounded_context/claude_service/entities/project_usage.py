@@ -0,0 +1,24 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class ProjectUsageSummary(BaseModel):
+    project_id: str
+    jobs: int = 0
+    sessions: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: Decimal = Decimal("0")
+
+
+class DailyProjectUsage(BaseModel):
+    project_id: str
+    day: date
+    status: str
+    jobs: int = 0
+    sessions: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: Decimal = Decimal("0")
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SessionLogStats(BaseModel):
+    claude_session_id: str
+    project_dir: str
+    byte_offset: int = 0
+    turns: int = 0
+    assistant_messages: int = 0
+    tool_uses: int = 0
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+    human_pause_seconds: float = 0.0
+    model: str | None = None
+    first_message_at: datetime | None = None
+    last_message_at: datetime | None = None
+    last_assistant_at: datetime | None = None
+    last_assistant_message_id: str | None = None
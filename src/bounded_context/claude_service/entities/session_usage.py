@@ -0,0 +1,9 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class SessionUsage(BaseModel):
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: Decimal = Decimal("0")
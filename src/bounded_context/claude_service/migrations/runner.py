@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import time
 from pathlib import Path
 from typing import cast
 
@@ -7,47 +9,118 @@ from psycopg.sql import SQL
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS_LOCK_ID = 0x61676E745F6D6967
+
 
 def apply_migrations(database_url: str) -> None:
-    migrations_dir = Path(__file__).parent / "sql"
-
-    with psycopg.connect(database_url) as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS _migrations (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL UNIQUE,
-                    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-                )
-            """)
-            conn.commit()
-
-            cur.execute("SELECT name FROM _migrations ORDER BY name")
-            applied = {row[0] for row in cur.fetchall()}
-
-        migration_files = sorted(
-            f
-            for f in migrations_dir.glob("*.sql")
-            if not f.name.endswith(".rollback.sql")
+    started = time.perf_counter()
+    migrations = _load_migrations(Path(__file__).parent / "sql")
+
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        if _is_up_to_date(conn, migrations):
+            logger.info(
+                "Migrations up to date (%d checked in %.1f ms)",
+                len(migrations),
+                (time.perf_counter() - started) * 1000,
+            )
+            return
+
+        conn.execute("SELECT pg_advisory_lock(%s)", (MIGRATIONS_LOCK_ID,))
+        try:
+            applied_count = _apply_pending(conn, migrations)
+        finally:
+            conn.execute("SELECT pg_advisory_unlock(%s)", (MIGRATIONS_LOCK_ID,))
+
+    logger.info(
+        "Applied %d migration(s) in %.1f ms",
+        applied_count,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+def _load_migrations(migrations_dir: Path) -> dict[str, tuple[str, str]]:
+    migrations: dict[str, tuple[str, str]] = {}
+    for migration_file in sorted(migrations_dir.glob("*.sql")):
+        if migration_file.name.endswith(".rollback.sql"):
+            continue
+        content = migration_file.read_bytes()
+        migrations[migration_file.stem] = (
+            content.decode("utf-8"),
+            hashlib.sha256(content).hexdigest(),
         )
+    return migrations
 
-        for migration_file in migration_files:
-            migration_name = migration_file.stem
 
-            if migration_name in applied:
-                logger.debug("Migration %s already applied", migration_name)
-                continue
+def _is_up_to_date(
+    conn: psycopg.Connection,
+    migrations: dict[str, tuple[str, str]],
+) -> bool:
+    try:
+        rows = conn.execute("SELECT name, checksum FROM _migrations").fetchall()
+    except (psycopg.errors.UndefinedTable, psycopg.errors.UndefinedColumn):
+        return False
+    applied: dict[str, str | None] = dict(rows)
+    return all(
+        applied.get(name) == checksum for name, (_, checksum) in migrations.items()
+    )
 
-            logger.info("Applying migration: %s", migration_name)
 
-            sql_content = migration_file.read_text(encoding="utf-8")
+def _apply_pending(
+    conn: psycopg.Connection,
+    migrations: dict[str, tuple[str, str]],
+) -> int:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS _migrations (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL UNIQUE,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """)
+    conn.execute("ALTER TABLE _migrations ADD COLUMN IF NOT EXISTS checksum VARCHAR(64)")
+
+    rows = conn.execute("SELECT name, checksum FROM _migrations").fetchall()
+    applied: dict[str, str | None] = dict(rows)
 
-            with conn.cursor() as cur:
-                cur.execute(cast(SQL, sql_content))
-                cur.execute(
-                    "INSERT INTO _migrations (name) VALUES (%s)",
-                    (migration_name,),
-                )
-                conn.commit()
+    applied_count = 0
+    for migration_name, (sql_content, checksum) in migrations.items():
+        if migration_name in applied:
+            _verify_checksum(conn, migration_name, applied[migration_name], checksum)
+            continue
 
-            logger.info("Migration %s applied successfully", migration_name)
+        logger.info("Applying migration: %s", migration_name)
+        started = time.perf_counter()
+
+        with conn.transaction():
+            conn.execute(cast(SQL, sql_content))
+            conn.execute(
+                "INSERT INTO _migrations (name, checksum) VALUES (%s, %s)",
+                (migration_name, checksum),
+            )
+
+        applied_count += 1
+        logger.info(
+            "Migration %s applied successfully in %.1f ms",
+            migration_name,
+            (time.perf_counter() - started) * 1000,
+        )
+    return applied_count
+
+
+def _verify_checksum(
+    conn: psycopg.Connection,
+    migration_name: str,
+    applied_checksum: str | None,
+    checksum: str,
+) -> None:
+    if applied_checksum is None:
+        conn.execute(
+            "UPDATE _migrations SET checksum = %s WHERE name = %s",
+            (checksum, migration_name),
+        )
+    elif applied_checksum != checksum:
+        logger.warning(
+            "Migration %s was modified after it was applied (checksum %s, file %s)",
+            migration_name,
+            applied_checksum,
+            checksum,
+        )
@@ -0,0 +1,5 @@
+-- Rollback: Drop session_log_stats table
+
+DROP INDEX IF EXISTS idx_session_log_stats_project_dir;
+
+DROP TABLE IF EXISTS session_log_stats;
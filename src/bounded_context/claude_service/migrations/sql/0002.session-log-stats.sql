@@ -0,0 +1,24 @@
+-- Per-session aggregates indexed incrementally from Claude Code JSONL transcripts
+-- depends: 0001.claude-service-schema
+
+CREATE TABLE session_log_stats (
+    claude_session_id VARCHAR(255) PRIMARY KEY,
+    project_dir VARCHAR(512) NOT NULL,
+    byte_offset BIGINT NOT NULL DEFAULT 0,
+    turns INTEGER NOT NULL DEFAULT 0,
+    assistant_messages INTEGER NOT NULL DEFAULT 0,
+    tool_uses INTEGER NOT NULL DEFAULT 0,
+    input_tokens BIGINT NOT NULL DEFAULT 0,
+    cache_creation_input_tokens BIGINT NOT NULL DEFAULT 0,
+    cache_read_input_tokens BIGINT NOT NULL DEFAULT 0,
+    output_tokens BIGINT NOT NULL DEFAULT 0,
+    human_pause_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    model VARCHAR(255),
+    first_message_at TIMESTAMPTZ,
+    last_message_at TIMESTAMPTZ,
+    last_assistant_at TIMESTAMPTZ,
+    last_assistant_message_id VARCHAR(255),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_session_log_stats_project_dir ON session_log_stats(project_dir);
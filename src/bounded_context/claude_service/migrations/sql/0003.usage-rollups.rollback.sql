@@ -0,0 +1,12 @@
+-- Rollback: Drop project usage rollups
+
+DROP TRIGGER IF EXISTS jobs_project_usage_update ON jobs;
+DROP TRIGGER IF EXISTS jobs_project_usage_insert_delete ON jobs;
+
+DROP FUNCTION IF EXISTS maintain_project_usage();
+DROP FUNCTION IF EXISTS apply_project_usage_delta(
+    VARCHAR, DATE, VARCHAR, INTEGER, INTEGER, BIGINT, BIGINT, DECIMAL
+);
+
+DROP TABLE IF EXISTS project_usage_totals;
+DROP TABLE IF EXISTS project_usage_daily;
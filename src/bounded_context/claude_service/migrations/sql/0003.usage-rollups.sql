@@ -0,0 +1,144 @@
+-- Per-project usage rollups maintained from jobs by trigger
+-- depends: 0001.claude-service-schema
+
+CREATE TABLE project_usage_daily (
+    project_id VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    jobs INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    input_tokens BIGINT NOT NULL DEFAULT 0,
+    output_tokens BIGINT NOT NULL DEFAULT 0,
+    cost_usd DECIMAL(16, 6) NOT NULL DEFAULT 0,
+    PRIMARY KEY (project_id, day, status)
+);
+
+CREATE TABLE project_usage_totals (
+    project_id VARCHAR(255) PRIMARY KEY,
+    jobs INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    input_tokens BIGINT NOT NULL DEFAULT 0,
+    output_tokens BIGINT NOT NULL DEFAULT 0,
+    cost_usd DECIMAL(16, 6) NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE FUNCTION apply_project_usage_delta(
+    p_project_id VARCHAR,
+    p_day DATE,
+    p_status VARCHAR,
+    p_jobs INTEGER,
+    p_sessions INTEGER,
+    p_input_tokens BIGINT,
+    p_output_tokens BIGINT,
+    p_cost_usd DECIMAL
+) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO project_usage_daily AS d (
+        project_id, day, status, jobs, sessions,
+        input_tokens, output_tokens, cost_usd
+    )
+    VALUES (
+        p_project_id, p_day, p_status, p_jobs, p_sessions,
+        p_input_tokens, p_output_tokens, p_cost_usd
+    )
+    ON CONFLICT (project_id, day, status) DO UPDATE SET
+        jobs = d.jobs + EXCLUDED.jobs,
+        sessions = d.sessions + EXCLUDED.sessions,
+        input_tokens = d.input_tokens + EXCLUDED.input_tokens,
+        output_tokens = d.output_tokens + EXCLUDED.output_tokens,
+        cost_usd = d.cost_usd + EXCLUDED.cost_usd;
+
+    INSERT INTO project_usage_totals AS t (
+        project_id, jobs, sessions, input_tokens, output_tokens, cost_usd
+    )
+    VALUES (
+        p_project_id, p_jobs, p_sessions,
+        p_input_tokens, p_output_tokens, p_cost_usd
+    )
+    ON CONFLICT (project_id) DO UPDATE SET
+        jobs = t.jobs + EXCLUDED.jobs,
+        sessions = t.sessions + EXCLUDED.sessions,
+        input_tokens = t.input_tokens + EXCLUDED.input_tokens,
+        output_tokens = t.output_tokens + EXCLUDED.output_tokens,
+        cost_usd = t.cost_usd + EXCLUDED.cost_usd,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION maintain_project_usage() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_project_usage_delta(
+            OLD.project_id,
+            (OLD.created_at AT TIME ZONE 'UTC')::date,
+            OLD.status,
+            -1,
+            -COALESCE(OLD.total_sessions, 0),
+            -COALESCE(OLD.total_input_tokens, 0),
+            -COALESCE(OLD.total_output_tokens, 0),
+            -COALESCE(OLD.total_cost_usd, 0)
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_project_usage_delta(
+            NEW.project_id,
+            (NEW.created_at AT TIME ZONE 'UTC')::date,
+            NEW.status,
+            1,
+            COALESCE(NEW.total_sessions, 0),
+            COALESCE(NEW.total_input_tokens, 0),
+            COALESCE(NEW.total_output_tokens, 0),
+            COALESCE(NEW.total_cost_usd, 0)
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_project_usage_insert_delete
+    AFTER INSERT OR DELETE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION maintain_project_usage();
+
+CREATE TRIGGER jobs_project_usage_update
+    AFTER UPDATE OF
+        project_id, status, created_at, total_sessions,
+        total_input_tokens, total_output_tokens, total_cost_usd
+    ON jobs
+    FOR EACH ROW
+    WHEN (
+        (OLD.project_id, OLD.status, OLD.created_at, OLD.total_sessions,
+         OLD.total_input_tokens, OLD.total_output_tokens, OLD.total_cost_usd)
+        IS DISTINCT FROM
+        (NEW.project_id, NEW.status, NEW.created_at, NEW.total_sessions,
+         NEW.total_input_tokens, NEW.total_output_tokens, NEW.total_cost_usd)
+    )
+    EXECUTE FUNCTION maintain_project_usage();
+
+INSERT INTO project_usage_daily (
+    project_id, day, status, jobs, sessions, input_tokens, output_tokens, cost_usd
+)
+SELECT
+    project_id,
+    (created_at AT TIME ZONE 'UTC')::date,
+    status,
+    COUNT(*),
+    COALESCE(SUM(total_sessions), 0),
+    COALESCE(SUM(total_input_tokens), 0),
+    COALESCE(SUM(total_output_tokens), 0),
+    COALESCE(SUM(total_cost_usd), 0)
+FROM jobs
+GROUP BY project_id, (created_at AT TIME ZONE 'UTC')::date, status;
+
+INSERT INTO project_usage_totals (
+    project_id, jobs, sessions, input_tokens, output_tokens, cost_usd
+)
+SELECT
+    project_id,
+    SUM(jobs),
+    SUM(sessions),
+    SUM(input_tokens),
+    SUM(output_tokens),
+    SUM(cost_usd)
+FROM project_usage_daily
+GROUP BY project_id;
@@ -0,0 +1,33 @@
+-- Rollback: Return sessions to a plain table and restore single-column indexes
+
+ALTER TABLE sessions RENAME TO sessions_partitioned;
+
+CREATE TABLE sessions (
+    id UUID PRIMARY KEY,
+    job_id UUID NOT NULL REFERENCES jobs(id),
+    claude_session_id VARCHAR(255),
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    ended_at TIMESTAMPTZ,
+    input_tokens BIGINT DEFAULT 0,
+    output_tokens BIGINT DEFAULT 0,
+    cost_usd DECIMAL(10, 6) DEFAULT 0
+);
+
+INSERT INTO sessions (
+    id, job_id, claude_session_id, started_at, ended_at,
+    input_tokens, output_tokens, cost_usd
+)
+SELECT
+    id, job_id, claude_session_id, started_at, ended_at,
+    input_tokens, output_tokens, cost_usd
+FROM sessions_partitioned;
+
+DROP TABLE sessions_partitioned CASCADE;
+DROP FUNCTION IF EXISTS detach_sessions_partitions(DATE, BOOLEAN);
+DROP FUNCTION IF EXISTS create_sessions_partition(DATE);
+
+CREATE INDEX idx_sessions_job_id ON sessions(job_id);
+
+DROP INDEX IF EXISTS idx_jobs_active_by_project;
+DROP INDEX IF EXISTS idx_jobs_project_created;
+CREATE INDEX idx_jobs_project_id ON jobs(project_id);
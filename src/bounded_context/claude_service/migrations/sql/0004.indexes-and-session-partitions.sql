@@ -0,0 +1,96 @@
+-- Composite/partial indexes and monthly range partitioning of sessions
+-- depends: 0003.usage-rollups
+
+CREATE INDEX idx_jobs_project_created ON jobs(project_id, created_at DESC);
+CREATE INDEX idx_jobs_active_by_project ON jobs(project_id, created_at DESC)
+    WHERE status IN ('pending', 'running');
+DROP INDEX IF EXISTS idx_jobs_project_id;
+
+ALTER TABLE sessions RENAME TO sessions_legacy;
+ALTER TABLE sessions_legacy RENAME CONSTRAINT sessions_pkey TO sessions_legacy_pkey;
+DROP INDEX IF EXISTS idx_sessions_job_id;
+
+CREATE TABLE sessions (
+    id UUID NOT NULL,
+    job_id UUID NOT NULL REFERENCES jobs(id),
+    claude_session_id VARCHAR(255),
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    ended_at TIMESTAMPTZ,
+    input_tokens BIGINT DEFAULT 0,
+    output_tokens BIGINT DEFAULT 0,
+    cost_usd DECIMAL(10, 6) DEFAULT 0,
+    PRIMARY KEY (id, started_at)
+) PARTITION BY RANGE (started_at);
+
+CREATE TABLE sessions_default PARTITION OF sessions DEFAULT;
+
+CREATE FUNCTION create_sessions_partition(p_month DATE) RETURNS TEXT AS $$
+DECLARE
+    month_start DATE := date_trunc('month', p_month)::date;
+    partition_name TEXT := 'sessions_p' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF sessions '
+        'FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        month_start::timestamp AT TIME ZONE 'UTC',
+        (month_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC'
+    );
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION detach_sessions_partitions(
+    p_before DATE,
+    p_drop BOOLEAN DEFAULT FALSE
+) RETURNS SETOF TEXT AS $$
+DECLARE
+    partition_name TEXT;
+BEGIN
+    FOR partition_name IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = 'sessions'::regclass
+          AND child.relname ~ '^sessions_p[0-9]{4}_[0-9]{2}$'
+          AND to_date(substring(child.relname FROM 11), 'YYYY_MM')
+              + INTERVAL '1 month' <= date_trunc('month', p_before)
+        ORDER BY child.relname
+    LOOP
+        EXECUTE format('ALTER TABLE sessions DETACH PARTITION %I', partition_name);
+        IF p_drop THEN
+            EXECUTE format('DROP TABLE %I', partition_name);
+        END IF;
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_sessions_partition(month::date)
+FROM (
+    SELECT DISTINCT date_trunc('month', started_at AT TIME ZONE 'UTC') AS month
+    FROM sessions_legacy
+    UNION
+    SELECT generate_series(
+        date_trunc('month', NOW() AT TIME ZONE 'UTC'),
+        date_trunc('month', NOW() AT TIME ZONE 'UTC') + INTERVAL '2 months',
+        INTERVAL '1 month'
+    )
+) AS months
+ORDER BY month;
+
+INSERT INTO sessions (
+    id, job_id, claude_session_id, started_at, ended_at,
+    input_tokens, output_tokens, cost_usd
+)
+SELECT
+    id, job_id, claude_session_id, started_at, ended_at,
+    input_tokens, output_tokens, cost_usd
+FROM sessions_legacy;
+
+DROP TABLE sessions_legacy;
+
+CREATE INDEX idx_sessions_job_id ON sessions(job_id);
+CREATE INDEX idx_sessions_claude_session_id ON sessions(claude_session_id)
+    WHERE claude_session_id IS NOT NULL;
+CREATE INDEX idx_sessions_started_at ON sessions(started_at DESC);
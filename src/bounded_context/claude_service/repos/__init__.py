@@ -1,4 +1,37 @@
+from src.bounded_context.claude_service.repos.async_job_repo import AsyncJobRepo
+from src.bounded_context.claude_service.repos.async_session_finalizer import (
+    AsyncSessionFinalizer,
+)
+from src.bounded_context.claude_service.repos.async_session_log_stats_repo import (
+    AsyncSessionLogStatsRepo,
+)
+from src.bounded_context.claude_service.repos.async_session_partition_maintainer import (
+    AsyncSessionPartitionMaintainer,
+)
+from src.bounded_context.claude_service.repos.async_session_repo import (
+    AsyncSessionRepo,
+)
+from src.bounded_context.claude_service.repos.db_pool import (
+    PoolMetrics,
+    create_async_connection_pool,
+    create_connection_pool,
+    get_pool_metrics,
+)
 from src.bounded_context.claude_service.repos.job_repo import JobRepo
 from src.bounded_context.claude_service.repos.session_repo import SessionRepo
+from src.bounded_context.claude_service.repos.usage_rollup_repo import UsageRollupRepo
 
-__all__ = ["JobRepo", "SessionRepo"]
+__all__ = [
+    "AsyncJobRepo",
+    "AsyncSessionFinalizer",
+    "AsyncSessionLogStatsRepo",
+    "AsyncSessionPartitionMaintainer",
+    "AsyncSessionRepo",
+    "JobRepo",
+    "PoolMetrics",
+    "SessionRepo",
+    "UsageRollupRepo",
+    "create_async_connection_pool",
+    "create_connection_pool",
+    "get_pool_metrics",
+]
@@ -0,0 +1,64 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from psycopg.rows import class_row
+from psycopg_pool import AsyncConnectionPool
+
+from src.bounded_context.claude_service.entities.job import Job, JobStatus
+
+
+class AsyncJobRepo:
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def create(self, job: Job) -> None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    INSERT INTO jobs (
+                        id, external_task_id, project_id, status, created_at,
+                        total_input_tokens, total_output_tokens,
+                        total_cost_usd, total_sessions
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """,
+                    (
+                        str(job.id),
+                        job.external_task_id,
+                        job.project_id,
+                        job.status.value,
+                        job.created_at,
+                        job.total_input_tokens,
+                        job.total_output_tokens,
+                        job.total_cost_usd,
+                        job.total_sessions,
+                    ),
+                )
+
+    async def get_by_id(self, job_id: UUID) -> Job | None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor(row_factory=class_row(Job)) as cur:
+                await cur.execute(
+                    """
+                    SELECT id, external_task_id, project_id, status,
+                           created_at, completed_at, total_input_tokens,
+                           total_output_tokens, total_cost_usd, total_sessions
+                    FROM jobs WHERE id = %s
+                    """,
+                    (str(job_id),),
+                )
+                return await cur.fetchone()
+
+    async def update_status(self, job_id: UUID, status: JobStatus) -> None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                if status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                    await cur.execute(
+                        "UPDATE jobs SET status = %s, completed_at = %s WHERE id = %s",
+                        (status.value, datetime.now(tz=UTC), str(job_id)),
+                    )
+                else:
+                    await cur.execute(
+                        "UPDATE jobs SET status = %s WHERE id = %s",
+                        (status.value, str(job_id)),
+                    )
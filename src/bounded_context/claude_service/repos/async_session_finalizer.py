@@ -0,0 +1,93 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from psycopg_pool import AsyncConnectionPool
+
+from src.bounded_context.claude_service.entities.job import JobStatus
+from src.bounded_context.claude_service.entities.session_usage import SessionUsage
+
+
+class AsyncSessionFinalizer:
+    TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def finalize(
+        self,
+        session_id: UUID,
+        started_at: datetime,
+        claude_session_id: str | None,
+        usage: SessionUsage | None,
+        job_status: JobStatus | None = None,
+    ) -> None:
+        now = datetime.now(tz=UTC)
+        params = {
+            "session_id": str(session_id),
+            "started_at": started_at,
+            "claude_session_id": claude_session_id,
+            "ended_at": now,
+            "job_status": job_status.value if job_status else None,
+            "completed_at": now if job_status in self.TERMINAL_STATUSES else None,
+        }
+
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                if usage is None:
+                    await cur.execute(
+                        """
+                        WITH finalized_session AS (
+                            UPDATE sessions SET
+                                claude_session_id = COALESCE(
+                                    %(claude_session_id)s, claude_session_id
+                                ),
+                                ended_at = %(ended_at)s
+                            WHERE id = %(session_id)s AND started_at = %(started_at)s
+                            RETURNING job_id
+                        )
+                        UPDATE jobs SET
+                            status = COALESCE(%(job_status)s::varchar, jobs.status),
+                            completed_at = COALESCE(
+                                %(completed_at)s::timestamptz, jobs.completed_at
+                            )
+                        FROM finalized_session
+                        WHERE jobs.id = finalized_session.job_id
+                          AND %(job_status)s::varchar IS NOT NULL
+                        """,
+                        params,
+                    )
+                    return
+
+                await cur.execute(
+                    """
+                    WITH finalized_session AS (
+                        UPDATE sessions SET
+                            claude_session_id = COALESCE(
+                                %(claude_session_id)s, claude_session_id
+                            ),
+                            ended_at = %(ended_at)s,
+                            input_tokens = %(input_tokens)s,
+                            output_tokens = %(output_tokens)s,
+                            cost_usd = %(cost_usd)s
+                        WHERE id = %(session_id)s AND started_at = %(started_at)s
+                        RETURNING job_id
+                    )
+                    UPDATE jobs SET
+                        total_input_tokens = jobs.total_input_tokens + %(input_tokens)s,
+                        total_output_tokens = jobs.total_output_tokens + %(output_tokens)s,
+                        total_cost_usd = jobs.total_cost_usd + %(cost_usd)s,
+                        total_sessions = jobs.total_sessions + 1,
+                        status = COALESCE(%(job_status)s::varchar, jobs.status),
+                        completed_at = COALESCE(
+                            %(completed_at)s::timestamptz, jobs.completed_at
+                        )
+                    FROM finalized_session
+                    WHERE jobs.id = finalized_session.job_id
+                    """,
+                    {
+                        **params,
+                        "input_tokens": usage.input_tokens,
+                        "output_tokens": usage.output_tokens,
+                        "cost_usd": usage.cost_usd,
+                    },
+                )
@@ -0,0 +1,89 @@
+from psycopg.rows import class_row
+from psycopg_pool import AsyncConnectionPool
+
+from src.bounded_context.claude_service.entities.session_log_stats import (
+    SessionLogStats,
+)
+
+
+class AsyncSessionLogStatsRepo:
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def get_all(self) -> list[SessionLogStats]:
+        async with self._pool.connection() as conn:
+            async with conn.cursor(row_factory=class_row(SessionLogStats)) as cur:
+                await cur.execute(
+                    """
+                    SELECT
+                        claude_session_id, project_dir, byte_offset, turns,
+                        assistant_messages, tool_uses, input_tokens,
+                        cache_creation_input_tokens, cache_read_input_tokens,
+                        output_tokens, human_pause_seconds, model,
+                        first_message_at, last_message_at, last_assistant_at,
+                        last_assistant_message_id
+                    FROM session_log_stats
+                    """
+                )
+                return await cur.fetchall()
+
+    async def get_by_session_id(self, claude_session_id: str) -> SessionLogStats | None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor(row_factory=class_row(SessionLogStats)) as cur:
+                await cur.execute(
+                    """
+                    SELECT
+                        claude_session_id, project_dir, byte_offset, turns,
+                        assistant_messages, tool_uses, input_tokens,
+                        cache_creation_input_tokens, cache_read_input_tokens,
+                        output_tokens, human_pause_seconds, model,
+                        first_message_at, last_message_at, last_assistant_at,
+                        last_assistant_message_id
+                    FROM session_log_stats WHERE claude_session_id = %s
+                    """,
+                    (claude_session_id,),
+                )
+                return await cur.fetchone()
+
+    async def upsert_many(self, stats: list[SessionLogStats]) -> None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(
+                    """
+                    INSERT INTO session_log_stats (
+                        claude_session_id, project_dir, byte_offset, turns,
+                        assistant_messages, tool_uses, input_tokens,
+                        cache_creation_input_tokens, cache_read_input_tokens,
+                        output_tokens, human_pause_seconds, model,
+                        first_message_at, last_message_at, last_assistant_at,
+                        last_assistant_message_id
+                    )
+                    VALUES (
+                        %(claude_session_id)s, %(project_dir)s, %(byte_offset)s,
+                        %(turns)s, %(assistant_messages)s, %(tool_uses)s,
+                        %(input_tokens)s, %(cache_creation_input_tokens)s,
+                        %(cache_read_input_tokens)s, %(output_tokens)s,
+                        %(human_pause_seconds)s, %(model)s, %(first_message_at)s,
+                        %(last_message_at)s, %(last_assistant_at)s,
+                        %(last_assistant_message_id)s
+                    )
+                    ON CONFLICT (claude_session_id) DO UPDATE SET
+                        project_dir = EXCLUDED.project_dir,
+                        byte_offset = EXCLUDED.byte_offset,
+                        turns = EXCLUDED.turns,
+                        assistant_messages = EXCLUDED.assistant_messages,
+                        tool_uses = EXCLUDED.tool_uses,
+                        input_tokens = EXCLUDED.input_tokens,
+                        cache_creation_input_tokens = EXCLUDED.cache_creation_input_tokens,
+                        cache_read_input_tokens = EXCLUDED.cache_read_input_tokens,
+                        output_tokens = EXCLUDED.output_tokens,
+                        human_pause_seconds = EXCLUDED.human_pause_seconds,
+                        model = EXCLUDED.model,
+                        first_message_at = EXCLUDED.first_message_at,
+                        last_message_at = EXCLUDED.last_message_at,
+                        last_assistant_at = EXCLUDED.last_assistant_at,
+                        last_assistant_message_id = EXCLUDED.last_assistant_message_id,
+                        updated_at = NOW()
+                    """,
+                    [s.model_dump() for s in stats],
+                )
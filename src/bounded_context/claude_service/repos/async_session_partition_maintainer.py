@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from datetime import UTC, date, datetime
+
+from psycopg_pool import AsyncConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSessionPartitionMaintainer:
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        months_ahead: int = 2,
+        retention_months: int | None = None,
+        drop_detached: bool = False,
+    ) -> None:
+        self._pool = pool
+        self._months_ahead = months_ahead
+        self._retention_months = retention_months
+        self._drop_detached = drop_detached
+
+    async def ensure_partitions(self) -> list[str]:
+        current = self._month_start(0)
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT create_sessions_partition(month::date)
+                    FROM generate_series(
+                        %s::date,
+                        %s::date + make_interval(months => %s),
+                        INTERVAL '1 month'
+                    ) AS month
+                    """,
+                    (current, current, self._months_ahead),
+                )
+                return [row[0] for row in await cur.fetchall()]
+
+    async def detach_expired(self) -> list[str]:
+        if self._retention_months is None:
+            return []
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "SELECT detach_sessions_partitions(%s, %s)",
+                    (self._month_start(-self._retention_months), self._drop_detached),
+                )
+                return [row[0] for row in await cur.fetchall()]
+
+    async def maintain(self) -> None:
+        await self.ensure_partitions()
+        detached = await self.detach_expired()
+        if detached:
+            logger.info("Detached expired session partitions: %s", ", ".join(detached))
+
+    async def run(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.maintain()
+            except Exception:
+                logger.exception("Session partition maintenance failed")
+
+    def _month_start(self, offset: int) -> date:
+        today = datetime.now(tz=UTC).date()
+        months = today.year * 12 + today.month - 1 + offset
+        return date(months // 12, months % 12 + 1, 1)
@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from psycopg.rows import class_row
+from psycopg_pool import AsyncConnectionPool
+
+from src.bounded_context.claude_service.entities.session import Session
+
+
+class AsyncSessionRepo:
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def create(self, session: Session) -> None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    INSERT INTO sessions (
+                        id, job_id, claude_session_id, started_at,
+                        input_tokens, output_tokens, cost_usd
+                    )
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    """,
+                    (
+                        str(session.id),
+                        str(session.job_id),
+                        session.claude_session_id,
+                        session.started_at,
+                        session.input_tokens,
+                        session.output_tokens,
+                        session.cost_usd,
+                    ),
+                )
+
+    async def get_by_id(self, session_id: UUID) -> Session | None:
+        async with self._pool.connection() as conn:
+            async with conn.cursor(row_factory=class_row(Session)) as cur:
+                await cur.execute(
+                    """
+                    SELECT
+                        id, job_id, claude_session_id, started_at, ended_at,
+                        input_tokens, output_tokens, cost_usd
+                    FROM sessions WHERE id = %s
+                    """,
+                    (str(session_id),),
+                )
+                return await cur.fetchone()
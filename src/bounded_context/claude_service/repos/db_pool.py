@@ -0,0 +1,87 @@
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from pydantic import BaseModel
+
+
+class PoolMetrics(BaseModel):
+    name: str
+    pool_min: int
+    pool_max: int
+    pool_size: int
+    pool_available: int
+    requests_waiting: int
+    requests_num: int
+    requests_queued: int
+    requests_wait_ms: int
+    requests_errors: int
+    connections_num: int
+    connections_lost: int
+
+    @property
+    def avg_wait_ms(self) -> float:
+        if self.requests_num == 0:
+            return 0.0
+        return self.requests_wait_ms / self.requests_num
+
+
+def create_connection_pool(
+    database_url: str,
+    name: str,
+    min_size: int = 1,
+    max_size: int = 5,
+    max_lifetime_seconds: float = 1800.0,
+    max_idle_seconds: float = 300.0,
+    timeout_seconds: float = 10.0,
+) -> ConnectionPool:
+    return ConnectionPool(
+        database_url,
+        name=name,
+        min_size=min_size,
+        max_size=max_size,
+        max_lifetime=max_lifetime_seconds,
+        max_idle=max_idle_seconds,
+        timeout=timeout_seconds,
+        check=ConnectionPool.check_connection,
+        open=True,
+    )
+
+
+async def create_async_connection_pool(
+    database_url: str,
+    name: str,
+    min_size: int = 1,
+    max_size: int = 5,
+    max_lifetime_seconds: float = 1800.0,
+    max_idle_seconds: float = 300.0,
+    timeout_seconds: float = 10.0,
+) -> AsyncConnectionPool:
+    pool = AsyncConnectionPool(
+        database_url,
+        name=name,
+        min_size=min_size,
+        max_size=max_size,
+        max_lifetime=max_lifetime_seconds,
+        max_idle=max_idle_seconds,
+        timeout=timeout_seconds,
+        check=AsyncConnectionPool.check_connection,
+        open=False,
+    )
+    await pool.open()
+    return pool
+
+
+def get_pool_metrics(pool: ConnectionPool | AsyncConnectionPool) -> PoolMetrics:
+    stats = pool.get_stats()
+    return PoolMetrics(
+        name=pool.name,
+        pool_min=stats.get("pool_min", 0),
+        pool_max=stats.get("pool_max", 0),
+        pool_size=stats.get("pool_size", 0),
+        pool_available=stats.get("pool_available", 0),
+        requests_waiting=stats.get("requests_waiting", 0),
+        requests_num=stats.get("requests_num", 0),
+        requests_queued=stats.get("requests_queued", 0),
+        requests_wait_ms=stats.get("requests_wait_ms", 0),
+        requests_errors=stats.get("requests_errors", 0),
+        connections_num=stats.get("connections_num", 0),
+        connections_lost=stats.get("connections_lost", 0),
+    )
@@ -2,18 +2,18 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
-import psycopg
 from psycopg.rows import class_row
+from psycopg_pool import ConnectionPool
 
 from src.bounded_context.claude_service.entities.job import Job, JobStatus
 
 
 class JobRepo:
-    def __init__(self, database_url: str) -> None:
-        self._database_url = database_url
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
 
     def create(self, job: Job) -> None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -35,10 +35,9 @@ class JobRepo:
                         job.total_sessions,
                     ),
                 )
-                conn.commit()
 
     def get_by_id(self, job_id: UUID) -> Job | None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor(row_factory=class_row(Job)) as cur:
                 cur.execute(
                     """
@@ -52,7 +51,7 @@ class JobRepo:
                 return cur.fetchone()
 
     def update_status(self, job_id: UUID, status: JobStatus) -> None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 if status in (JobStatus.COMPLETED, JobStatus.FAILED):
                     cur.execute(
@@ -64,7 +63,6 @@ class JobRepo:
                         "UPDATE jobs SET status = %s WHERE id = %s",
                         (status.value, str(job_id)),
                     )
-                conn.commit()
 
     def increment_metrics(
         self,
@@ -73,7 +71,7 @@ class JobRepo:
         output_tokens: int,
         cost_usd: Decimal,
     ) -> None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -86,4 +84,3 @@ class JobRepo:
                     """,
                     (input_tokens, output_tokens, cost_usd, str(job_id)),
                 )
-                conn.commit()
@@ -2,18 +2,18 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
-import psycopg
 from psycopg.rows import class_row
+from psycopg_pool import ConnectionPool
 
 from src.bounded_context.claude_service.entities.session import Session
 
 
 class SessionRepo:
-    def __init__(self, database_url: str) -> None:
-        self._database_url = database_url
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
 
     def create(self, session: Session) -> None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -33,10 +33,9 @@ class SessionRepo:
                         session.cost_usd,
                     ),
                 )
-                conn.commit()
 
     def get_by_id(self, session_id: UUID) -> Session | None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor(row_factory=class_row(Session)) as cur:
                 cur.execute(
                     """
@@ -57,7 +56,7 @@ class SessionRepo:
         output_tokens: int,
         cost_usd: Decimal,
     ) -> None:
-        with psycopg.connect(self._database_url) as conn:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -78,4 +77,3 @@ class SessionRepo:
                         str(session_id),
                     ),
                 )
-                conn.commit()
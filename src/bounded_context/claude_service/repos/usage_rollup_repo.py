@@ -0,0 +1,87 @@
+from datetime import date
+
+from psycopg.rows import class_row
+from psycopg_pool import ConnectionPool
+
+from src.bounded_context.claude_service.entities.project_usage import (
+    DailyProjectUsage,
+    ProjectUsageSummary,
+)
+
+
+class UsageRollupRepo:
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    def get_project_summary(self, project_id: str) -> ProjectUsageSummary | None:
+        with self._pool.connection() as conn:
+            with conn.cursor(row_factory=class_row(ProjectUsageSummary)) as cur:
+                cur.execute(
+                    """
+                    SELECT project_id, jobs, sessions, input_tokens,
+                           output_tokens, cost_usd
+                    FROM project_usage_totals WHERE project_id = %s
+                    """,
+                    (project_id,),
+                )
+                return cur.fetchone()
+
+    def get_all_project_summaries(self) -> list[ProjectUsageSummary]:
+        with self._pool.connection() as conn:
+            with conn.cursor(row_factory=class_row(ProjectUsageSummary)) as cur:
+                cur.execute(
+                    """
+                    SELECT project_id, jobs, sessions, input_tokens,
+                           output_tokens, cost_usd
+                    FROM project_usage_totals
+                    ORDER BY cost_usd DESC, project_id
+                    """
+                )
+                return cur.fetchall()
+
+    def get_period_summary(
+        self,
+        project_id: str,
+        since: date,
+        until: date,
+    ) -> ProjectUsageSummary:
+        with self._pool.connection() as conn:
+            with conn.cursor(row_factory=class_row(ProjectUsageSummary)) as cur:
+                cur.execute(
+                    """
+                    SELECT
+                        %(project_id)s AS project_id,
+                        COALESCE(SUM(jobs), 0)::int AS jobs,
+                        COALESCE(SUM(sessions), 0)::int AS sessions,
+                        COALESCE(SUM(input_tokens), 0)::bigint AS input_tokens,
+                        COALESCE(SUM(output_tokens), 0)::bigint AS output_tokens,
+                        COALESCE(SUM(cost_usd), 0) AS cost_usd
+                    FROM project_usage_daily
+                    WHERE project_id = %(project_id)s
+                      AND day >= %(since)s AND day < %(until)s
+                    """,
+                    {"project_id": project_id, "since": since, "until": until},
+                )
+                row = cur.fetchone()
+        return row or ProjectUsageSummary(project_id=project_id)
+
+    def get_daily_usage(
+        self,
+        project_id: str,
+        since: date,
+        until: date,
+    ) -> list[DailyProjectUsage]:
+        with self._pool.connection() as conn:
+            with conn.cursor(row_factory=class_row(DailyProjectUsage)) as cur:
+                cur.execute(
+                    """
+                    SELECT project_id, day, status, jobs, sessions,
+                           input_tokens, output_tokens, cost_usd
+                    FROM project_usage_daily
+                    WHERE project_id = %s AND day >= %s AND day < %s
+                      AND jobs <> 0
+                    ORDER BY day, status
+                    """,
+                    (project_id, since, until),
+                )
+                return cur.fetchall()
@@ -0,0 +1,9 @@
+from src.bounded_context.claude_service.session_logs.session_log_indexer import (
+    SessionLogIndexer,
+)
+from src.bounded_context.claude_service.session_logs.transcript_parser import (
+    apply_entry,
+    scan_transcript,
+)
+
+__all__ = ["SessionLogIndexer", "apply_entry", "scan_transcript"]
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from pathlib import Path
+
+from src.bounded_context.claude_service.entities.session_log_stats import (
+    SessionLogStats,
+)
+from src.bounded_context.claude_service.repos.async_session_log_stats_repo import (
+    AsyncSessionLogStatsRepo,
+)
+from src.bounded_context.claude_service.session_logs.transcript_parser import (
+    scan_transcript,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLogIndexer:
+    def __init__(
+        self,
+        projects_dir: Path,
+        repo: AsyncSessionLogStatsRepo,
+    ) -> None:
+        self._projects_dir = projects_dir
+        self._repo = repo
+        self._stats: dict[str, SessionLogStats] | None = None
+
+    async def index_once(self) -> int:
+        if self._stats is None:
+            self._stats = {s.claude_session_id: s for s in await self._repo.get_all()}
+
+        changed = await asyncio.to_thread(self._scan_changed, dict(self._stats))
+        if changed:
+            await self._repo.upsert_many(changed)
+            for stats in changed:
+                self._stats[stats.claude_session_id] = stats
+        return len(changed)
+
+    async def run(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                indexed = await self.index_once()
+                if indexed:
+                    logger.info("Indexed %d session transcripts", indexed)
+            except Exception:
+                logger.exception("Session log indexing failed")
+            await asyncio.sleep(interval_seconds)
+
+    def _scan_changed(self, known: dict[str, SessionLogStats]) -> list[SessionLogStats]:
+        changed: list[SessionLogStats] = []
+        for path in self._projects_dir.glob("*/*.jsonl"):
+            session_id = path.stem
+            current = known.get(session_id) or SessionLogStats(
+                claude_session_id=session_id,
+                project_dir=path.parent.name,
+            )
+            try:
+                size = path.stat().st_size
+                if size == current.byte_offset:
+                    continue
+                updated = scan_transcript(path, current, size)
+            except OSError:
+                logger.warning("Failed to read transcript %s", path, exc_info=True)
+                continue
+            if updated != current:
+                changed.append(updated)
+        return changed
@@ -0,0 +1,162 @@
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from src.bounded_context.claude_service.entities.session_log_stats import (
+    SessionLogStats,
+)
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class AssistantUsage(NamedTuple):
+    message_id: str | None
+    model: str | None
+    tool_uses: int
+    input_tokens: int
+    cache_creation_input_tokens: int
+    cache_read_input_tokens: int
+    output_tokens: int
+
+
+def scan_transcript(path: Path, stats: SessionLogStats, size: int) -> SessionLogStats:
+    if size < stats.byte_offset:
+        logger.info("Transcript %s was truncated, reindexing from start", path)
+        stats = SessionLogStats(
+            claude_session_id=stats.claude_session_id,
+            project_dir=stats.project_dir,
+        )
+    else:
+        stats = stats.model_copy()
+
+    with path.open("rb") as f:
+        f.seek(stats.byte_offset)
+        pending = b""
+        while chunk := f.read(CHUNK_SIZE):
+            data = pending + chunk
+            end = data.rfind(b"\n")
+            if end < 0:
+                pending = data
+                continue
+            for line in data[:end].split(b"\n"):
+                _apply_line(stats, line)
+            stats.byte_offset += end + 1
+            pending = data[end + 1 :]
+    return stats
+
+
+def apply_entry(stats: SessionLogStats, entry: dict[str, Any]) -> None:
+    timestamp = parse_timestamp(entry.get("timestamp"))
+    if timestamp is not None:
+        if stats.first_message_at is None:
+            stats.first_message_at = timestamp
+        stats.last_message_at = timestamp
+
+    message = entry.get("message")
+    if not isinstance(message, dict):
+        return
+
+    entry_type = entry.get("type")
+    if entry_type == "assistant":
+        _apply_assistant(stats, message, timestamp)  # pyright: ignore[reportUnknownArgumentType]
+    elif entry_type == "user" and _is_human_message(entry, message):  # pyright: ignore[reportUnknownArgumentType]
+        stats.turns += 1
+        if stats.last_assistant_at is not None and timestamp is not None:
+            pause = (timestamp - stats.last_assistant_at).total_seconds()
+            stats.human_pause_seconds += max(pause, 0.0)
+        stats.last_assistant_at = None
+
+
+def parse_line(line: bytes) -> dict[str, Any] | None:
+    if not line.strip():
+        return None
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return entry if isinstance(entry, dict) else None  # pyright: ignore[reportUnknownVariableType]
+
+
+def parse_assistant_message(message: dict[str, Any]) -> AssistantUsage:
+    content = message.get("content")
+    tool_uses = 0
+    if isinstance(content, list):
+        tool_uses = sum(
+            1
+            for block in content  # pyright: ignore[reportUnknownVariableType]
+            if isinstance(block, dict) and block.get("type") == "tool_use"  # pyright: ignore[reportUnknownMemberType]
+        )
+    usage = message.get("usage") or {}
+    return AssistantUsage(
+        message_id=message.get("id"),
+        model=message.get("model") or None,
+        tool_uses=tool_uses,
+        input_tokens=usage.get("input_tokens", 0),
+        cache_creation_input_tokens=usage.get("cache_creation_input_tokens", 0),
+        cache_read_input_tokens=usage.get("cache_read_input_tokens", 0),
+        output_tokens=usage.get("output_tokens", 0),
+    )
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _apply_line(stats: SessionLogStats, line: bytes) -> None:
+    if not line.strip():
+        return
+    entry = parse_line(line)
+    if entry is None:
+        logger.warning("Skipping malformed transcript line in %s", stats.claude_session_id)
+        return
+    apply_entry(stats, entry)
+
+
+def _apply_assistant(
+    stats: SessionLogStats,
+    message: dict[str, Any],
+    timestamp: datetime | None,
+) -> None:
+    parsed = parse_assistant_message(message)
+    stats.tool_uses += parsed.tool_uses
+    if timestamp is not None:
+        stats.last_assistant_at = timestamp
+    if parsed.model:
+        stats.model = parsed.model
+
+    # One API response is written as several lines (one per content block)
+    # that repeat the same id and usage, so usage is counted once per id.
+    if parsed.message_id is not None and parsed.message_id == stats.last_assistant_message_id:
+        return
+    stats.last_assistant_message_id = parsed.message_id
+    stats.assistant_messages += 1
+
+    stats.input_tokens += parsed.input_tokens
+    stats.cache_creation_input_tokens += parsed.cache_creation_input_tokens
+    stats.cache_read_input_tokens += parsed.cache_read_input_tokens
+    stats.output_tokens += parsed.output_tokens
+
+
+def _is_human_message(entry: dict[str, Any], message: dict[str, Any]) -> bool:
+    if entry.get("isMeta") or entry.get("isSidechain"):
+        return False
+    content = message.get("content")
+    if isinstance(content, str):
+        return True
+    if not isinstance(content, list):
+        return False
+    block_types = {
+        block.get("type")  # pyright: ignore[reportUnknownMemberType]
+        for block in content  # pyright: ignore[reportUnknownVariableType]
+        if isinstance(block, dict)
+    }
+    return "tool_result" not in block_types and "text" in block_types
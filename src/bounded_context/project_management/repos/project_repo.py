@@ -1,4 +1,8 @@
+import logging
+import threading
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 
@@ -7,36 +11,114 @@ from src.bounded_context.project_management.entities.project import (
     TaskSystemConfig,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class ProjectSnapshot:
+    def __init__(self, projects: list[Project], mtime_ns: int) -> None:
+        by_adapter: dict[str, list[Project]] = {}
+        for project in projects:
+            if project.task_system is not None:
+                by_adapter.setdefault(project.task_system.adapter, []).append(project)
+
+        self.projects = tuple(projects)
+        self.mtime_ns = mtime_ns
+        self.by_id: Mapping[str, Project] = MappingProxyType({p.id: p for p in projects})
+        self.by_path: Mapping[str, Project] = MappingProxyType(
+            {_normalize_path(p.path): p for p in projects if p.path}
+        )
+        self.by_adapter: Mapping[str, tuple[Project, ...]] = MappingProxyType(
+            {adapter: tuple(items) for adapter, items in by_adapter.items()}
+        )
+
+
+def _normalize_path(path: str) -> str:
+    return str(Path(path).expanduser())
+
 
 class ProjectRepo:
-    def __init__(self, config_path: Path) -> None:
+    def __init__(self, config_path: Path, poll_interval_seconds: float = 2.0) -> None:
         self._config_path = config_path
-        self._projects: dict[str, Project] = {}
-        self._load_projects()
+        self._poll_interval_seconds = poll_interval_seconds
+        self._snapshot = self._load_snapshot()
+        self._stopping = threading.Event()
+        self._watcher: threading.Thread | None = None
 
-    def _load_projects(self) -> None:
+    def _load_snapshot(self) -> ProjectSnapshot:
+        mtime_ns = self._config_path.stat().st_mtime_ns
         with self._config_path.open() as f:
             data = yaml.safe_load(f)
 
+        projects: list[Project] = []
         environments = data.get("environments", {})
         for project_id, config in environments.items():
             task_system = None
             if "task_system" in config:
                 task_system = TaskSystemConfig(**config["task_system"])
 
-            self._projects[project_id] = Project(
-                id=project_id,
-                description=config.get("description", ""),
-                path=config.get("path", ""),
-                task_system=task_system,
+            projects.append(
+                Project(
+                    id=project_id,
+                    description=config.get("description", ""),
+                    path=config.get("path", ""),
+                    task_system=task_system,
+                )
             )
+        return ProjectSnapshot(projects, mtime_ns)
 
     def get_all(self) -> list[Project]:
-        return list(self._projects.values())
+        return list(self._snapshot.projects)
 
     def get_by_id(self, project_id: str) -> Project | None:
-        return self._projects.get(project_id)
+        return self._snapshot.by_id.get(project_id)
+
+    def get_by_path(self, path: str) -> Project | None:
+        return self._snapshot.by_path.get(_normalize_path(path))
+
+    def get_by_adapter(self, adapter: str) -> list[Project]:
+        return list(self._snapshot.by_adapter.get(adapter, ()))
 
     def reload(self) -> None:
-        self._projects.clear()
-        self._load_projects()
+        self._snapshot = self._load_snapshot()
+
+    def start_watching(self) -> None:
+        if self._watcher is not None:
+            return
+        self._stopping.clear()
+        self._watcher = threading.Thread(
+            target=self._watch,
+            name="project-config-watcher",
+            daemon=True,
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stopping.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self._poll_interval_seconds + 1)
+            self._watcher = None
+
+    def _watch(self) -> None:
+        failed_mtime_ns: int | None = None
+        while not self._stopping.wait(self._poll_interval_seconds):
+            try:
+                mtime_ns = self._config_path.stat().st_mtime_ns
+            except OSError:
+                logger.warning("Project config %s is not accessible", self._config_path)
+                continue
+            if mtime_ns in (self._snapshot.mtime_ns, failed_mtime_ns):
+                continue
+            try:
+                self.reload()
+            except Exception:
+                failed_mtime_ns = mtime_ns
+                logger.exception(
+                    "Failed to reload %s, keeping previous projects",
+                    self._config_path,
+                )
+                continue
+            logger.info(
+                "Reloaded %d projects from %s",
+                len(self._snapshot.projects),
+                self._config_path,
+            )
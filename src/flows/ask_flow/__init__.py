@@ -1,6 +1,3 @@
 from src.flows.ask_flow.factory import AskFlowFactory
-from src.flows.ask_flow.repos.redis_pending_prompt_storage import (
-    RedisPendingPromptStorage,
-)
 
-__all__ = ["AskFlowFactory", "RedisPendingPromptStorage"]
+__all__ = ["AskFlowFactory"]
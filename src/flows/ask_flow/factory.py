@@ -27,6 +27,7 @@ from src.messaging import SyncMessagePublisher
 from src.shared.protocols import (
     IMessageForReplaceStorage,
     IProjectSelectionStateStorage,
+    IUserStateScope,
 )
 
 
@@ -45,6 +46,7 @@ class AskFlowFactory:
         pending_prompt_storage: IPendingPromptStorage,
         message_for_replace_storage: IMessageForReplaceStorage,
         request_publisher: SyncMessagePublisher,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self._callback_answerer = callback_answerer
         self._message_service = message_service
@@ -57,6 +59,7 @@ class AskFlowFactory:
         self._pending_prompt_storage = pending_prompt_storage
         self._message_for_replace_storage = message_for_replace_storage
         self._request_publisher = request_publisher
+        self._user_state_scope = user_state_scope
 
         self._prompt_confirm_handler: PromptConfirmHandler | None = None
         self._prompt_cancel_handler: PromptCancelHandler | None = None
@@ -76,6 +79,7 @@ class AskFlowFactory:
             request_publisher=self._request_publisher,
             progress_presenter=self._create_progress_presenter(),
             job_repo=self._job_repo,
+            user_state_scope=self._user_state_scope,
         )
 
     def _create_confirmation_presenter(self) -> ConfirmationPresenter:
@@ -97,6 +101,7 @@ class AskFlowFactory:
                 project_repo=self._project_repo,
                 pending_prompt_storage=self._pending_prompt_storage,
                 prompt_executor=self._create_prompt_executor(),
+                user_state_scope=self._user_state_scope,
             )
         return self._prompt_confirm_handler
 
@@ -120,6 +125,7 @@ class AskFlowFactory:
             project_state_storage=self._project_state_storage,
             pending_prompt_storage=self._pending_prompt_storage,
             confirmation_presenter=self._create_confirmation_presenter(),
+            user_state_scope=self._user_state_scope,
         )
 
     def get_user_answer_handler(self) -> UserAnswerHandler:
@@ -133,6 +139,7 @@ class AskFlowFactory:
                 project_state_storage=self._project_state_storage,
                 job_session_storage=self._job_session_storage,
                 prompt_executor=self._create_prompt_executor(),
+                user_state_scope=self._user_state_scope,
             )
         return self._user_answer_handler
 
@@ -147,6 +154,7 @@ class AskFlowFactory:
                 project_state_storage=self._project_state_storage,
                 job_session_storage=self._job_session_storage,
                 prompt_executor=self._create_prompt_executor(),
+                user_state_scope=self._user_state_scope,
             )
         return self._execute_plan_handler
 
@@ -7,7 +7,7 @@ from bot_framework.role_management.repos.protocols.i_user_repo import IUserRepo
 from src.bounded_context.project_management.repos.project_repo import ProjectRepo
 from src.flows.ask_flow.repos.redis_job_session_storage import RedisJobSessionStorage
 from src.flows.ask_flow.services.prompt_executor import PromptExecutor
-from src.shared.protocols import IProjectSelectionStateStorage
+from src.shared.protocols import IProjectSelectionStateStorage, IUserStateScope
 
 
 class ExecutePlanHandler:
@@ -21,6 +21,7 @@ class ExecutePlanHandler:
         project_state_storage: IProjectSelectionStateStorage,
         job_session_storage: RedisJobSessionStorage,
         prompt_executor: PromptExecutor,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self.callback_answerer = callback_answerer
         self._message_service = message_service
@@ -30,10 +31,15 @@ class ExecutePlanHandler:
         self._project_state_storage = project_state_storage
         self._job_session_storage = job_session_storage
         self._prompt_executor = prompt_executor
+        self._user_state_scope = user_state_scope
         self.prefix = "execute_plan"
         self.allowed_roles: set[str] | None = None
 
     def handle(self, callback: BotCallback) -> None:
+        with self._user_state_scope.scope(callback.user_id):
+            self._handle(callback)
+
+    def _handle(self, callback: BotCallback) -> None:
         self.callback_answerer.answer(callback_query_id=callback.id)
 
         if not callback.data:
@@ -10,6 +10,7 @@ from bot_framework.role_management.repos.protocols.i_user_repo import IUserRepo
 from src.bounded_context.project_management.repos.project_repo import ProjectRepo
 from src.flows.ask_flow.protocols.i_pending_prompt_storage import IPendingPromptStorage
 from src.flows.ask_flow.services.prompt_executor import PromptExecutor
+from src.shared.protocols import IUserStateScope
 
 PermissionMode = Literal["default", "acceptEdits", "plan"]
 
@@ -30,6 +31,7 @@ class PromptConfirmHandler:
         project_repo: ProjectRepo,
         pending_prompt_storage: IPendingPromptStorage,
         prompt_executor: PromptExecutor,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self.callback_answerer = callback_answerer
         self._message_service = message_service
@@ -38,17 +40,22 @@ class PromptConfirmHandler:
         self._project_repo = project_repo
         self._pending_prompt_storage = pending_prompt_storage
         self._prompt_executor = prompt_executor
+        self._user_state_scope = user_state_scope
         self.prefix = uuid4().hex
         self.allowed_roles: set[str] | None = None
 
     def handle(self, callback: BotCallback) -> None:
+        with self._user_state_scope.scope(callback.user_id):
+            self._handle(callback)
+
+    def _handle(self, callback: BotCallback) -> None:
         self.callback_answerer.answer(callback_query_id=callback.id)
 
         permission_mode = self._parse_permission_mode(callback.data)
 
         user = self._user_repo.get_by_id(id=callback.user_id)
 
-        pending = self._pending_prompt_storage.get_pending_prompt(user.id)
+        pending = self._pending_prompt_storage.pop_pending_prompt(user.id)
         if not pending:
             text = self._phrase_repo.get_phrase(
                 key="ask.prompt_expired",
@@ -58,7 +65,6 @@ class PromptConfirmHandler:
             return
 
         project_id, prompt = pending
-        self._pending_prompt_storage.clear_pending_prompt(user.id)
 
         project = self._project_repo.get_by_id(project_id)
         if not project:
@@ -7,7 +7,7 @@ from bot_framework.role_management.repos.protocols.i_user_repo import IUserRepo
 from src.bounded_context.project_management.repos.project_repo import ProjectRepo
 from src.flows.ask_flow.presenters.confirmation_presenter import ConfirmationPresenter
 from src.flows.ask_flow.protocols.i_pending_prompt_storage import IPendingPromptStorage
-from src.shared.protocols import IProjectSelectionStateStorage
+from src.shared.protocols import IProjectSelectionStateStorage, IUserStateScope
 
 
 class TextMessageHandler(IMessageHandler):
@@ -22,6 +22,7 @@ class TextMessageHandler(IMessageHandler):
         project_state_storage: IProjectSelectionStateStorage,
         pending_prompt_storage: IPendingPromptStorage,
         confirmation_presenter: ConfirmationPresenter,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self._message_service = message_service
         self._phrase_repo = phrase_repo
@@ -30,12 +31,17 @@ class TextMessageHandler(IMessageHandler):
         self._project_state_storage = project_state_storage
         self._pending_prompt_storage = pending_prompt_storage
         self._confirmation_presenter = confirmation_presenter
+        self._user_state_scope = user_state_scope
 
     def handle(self, message: BotMessage) -> None:
         if not message.from_user:
             raise ValueError("message.from_user is required but was None")
 
-        user = self._user_repo.get_by_id(id=message.from_user.id)
+        with self._user_state_scope.scope(message.from_user.id):
+            self._handle(message, message.from_user.id)
+
+    def _handle(self, message: BotMessage, user_id: int) -> None:
+        user = self._user_repo.get_by_id(id=user_id)
 
         if not message.text:
             return
@@ -42,10 +42,9 @@ class ExecutionProgressPresenter:
         self._message_for_replace_storage.save(chat_id, bot_message)
 
     def _delete_stored_message(self, chat_id: int) -> None:
-        stored_message = self._message_for_replace_storage.get(chat_id)
+        stored_message = self._message_for_replace_storage.pop(chat_id)
         if stored_message:
             self._message_service.delete(chat_id, stored_message.message_id)
-            self._message_for_replace_storage.clear(chat_id)
 
     def send_completed(self, chat_id: int, language_code: str) -> None:
         text = self._phrase_repo.get_phrase(
@@ -8,4 +8,6 @@ class IPendingPromptStorage(Protocol):
 
     def get_pending_prompt(self, user_id: int) -> tuple[str, str] | None: ...
 
+    def pop_pending_prompt(self, user_id: int) -> tuple[str, str] | None: ...
+
     def clear_pending_prompt(self, user_id: int) -> None: ...
@@ -1,8 +1,11 @@
+from src.flows.ask_flow.repos.async_redis_job_session_storage import (
+    AsyncRedisJobSessionStorage,
+)
 from src.flows.ask_flow.repos.redis_job_session_storage import (
     RedisJobSessionStorage,
 )
-from src.flows.ask_flow.repos.redis_pending_prompt_storage import (
-    RedisPendingPromptStorage,
-)
 
-__all__ = ["RedisJobSessionStorage", "RedisPendingPromptStorage"]
+__all__ = [
+    "AsyncRedisJobSessionStorage",
+    "RedisJobSessionStorage",
+]
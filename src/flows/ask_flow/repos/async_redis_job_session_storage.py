@@ -0,0 +1,28 @@
+from uuid import UUID
+
+import redis.asyncio
+
+from src.flows.ask_flow.repos.redis_job_session_storage import RedisJobSessionStorage
+
+
+class AsyncRedisJobSessionStorage:
+    KEY_PREFIX = RedisJobSessionStorage.KEY_PREFIX
+    TTL_SECONDS = RedisJobSessionStorage.TTL_SECONDS
+
+    def __init__(self, redis_client: redis.asyncio.Redis) -> None:
+        self._redis = redis_client
+
+    def _get_key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    async def save_job_id(self, session_id: str, job_id: UUID) -> None:
+        key = self._get_key(session_id)
+        await self._redis.set(key, str(job_id), ex=self.TTL_SECONDS)
+
+    async def get_job_id(self, session_id: str) -> UUID | None:
+        key = self._get_key(session_id)
+        value = await self._redis.get(key)
+        if value:
+            decoded = value.decode("utf-8")  # pyright: ignore[reportAttributeAccessIssue]
+            return UUID(decoded)
+        return None
@@ -7,8 +7,8 @@ class RedisJobSessionStorage:
     KEY_PREFIX = "agent_fleet:job_session:"
     TTL_SECONDS = 3600
 
-    def __init__(self, redis_url: str) -> None:
-        self._redis = redis.from_url(redis_url)  # pyright: ignore[reportUnknownMemberType]
+    def __init__(self, redis_client: redis.Redis) -> None:
+        self._redis = redis_client
 
     def _get_key(self, session_id: str) -> str:
         return f"{self.KEY_PREFIX}{session_id}"
@@ -9,6 +9,7 @@ from src.flows.ask_flow.presenters.execution_progress_presenter import (
     ExecutionProgressPresenter,
 )
 from src.messaging import ClaudeRequest, SyncMessagePublisher
+from src.shared.protocols import IUserStateScope
 
 PermissionMode = Literal["default", "acceptEdits", "plan"]
 
@@ -19,10 +20,12 @@ class PromptExecutor:
         request_publisher: SyncMessagePublisher,
         progress_presenter: ExecutionProgressPresenter,
         job_repo: JobRepo,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self._request_publisher = request_publisher
         self._progress_presenter = progress_presenter
         self._job_repo = job_repo
+        self._user_state_scope = user_state_scope
 
     def execute(
         self,
@@ -64,6 +67,9 @@ class PromptExecutor:
             timestamp=datetime.now(tz=UTC),
         )
 
+        # Responses are rendered by another process that reads the stored
+        # progress message, so pending state must reach Redis first.
+        self._user_state_scope.flush()
         self._request_publisher.publish(
             message=request,
             routing_key="claude.request",
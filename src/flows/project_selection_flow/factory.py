@@ -16,7 +16,11 @@ from src.flows.project_selection_flow.handlers.project_select_handler import (
 from src.flows.project_selection_flow.presenters.project_list_presenter import (
     ProjectListPresenter,
 )
-from src.shared.protocols import IMessageForReplaceStorage, IProjectSelectionStateStorage
+from src.shared.protocols import (
+    IMessageForReplaceStorage,
+    IProjectSelectionStateStorage,
+    IUserStateScope,
+)
 
 
 class ProjectSelectionFlowFactory:
@@ -29,6 +33,7 @@ class ProjectSelectionFlowFactory:
         state_storage: IProjectSelectionStateStorage,
         message_for_replace_storage: IMessageForReplaceStorage,
         user_repo: IUserRepo,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self._callback_answerer = callback_answerer
         self._message_service = message_service
@@ -37,6 +42,7 @@ class ProjectSelectionFlowFactory:
         self._state_storage = state_storage
         self._message_for_replace_storage = message_for_replace_storage
         self._user_repo = user_repo
+        self._user_state_scope = user_state_scope
 
         self._project_select_handler: ProjectSelectHandler | None = None
         self._project_list_callback_handler: ProjectListCallbackHandler | None = None
@@ -51,6 +57,7 @@ class ProjectSelectionFlowFactory:
                 state_storage=self._state_storage,
                 message_for_replace_storage=self._message_for_replace_storage,
                 user_repo=self._user_repo,
+                user_state_scope=self._user_state_scope,
             )
         return self._project_select_handler
 
@@ -7,7 +7,11 @@ from bot_framework.protocols.i_message_service import IMessageService
 from bot_framework.role_management.repos.protocols.i_user_repo import IUserRepo
 
 from src.bounded_context.project_management.repos.project_repo import ProjectRepo
-from src.shared.protocols import IMessageForReplaceStorage, IProjectSelectionStateStorage
+from src.shared.protocols import (
+    IMessageForReplaceStorage,
+    IProjectSelectionStateStorage,
+    IUserStateScope,
+)
 
 
 class ProjectSelectHandler:
@@ -20,6 +24,7 @@ class ProjectSelectHandler:
         state_storage: IProjectSelectionStateStorage,
         message_for_replace_storage: IMessageForReplaceStorage,
         user_repo: IUserRepo,
+        user_state_scope: IUserStateScope,
     ) -> None:
         self.callback_answerer = callback_answerer
         self._message_service = message_service
@@ -28,10 +33,15 @@ class ProjectSelectHandler:
         self._state_storage = state_storage
         self._message_for_replace_storage = message_for_replace_storage
         self._user_repo = user_repo
+        self._user_state_scope = user_state_scope
         self.prefix = uuid4().hex
         self.allowed_roles: set[str] | None = None
 
     def handle(self, callback: BotCallback) -> None:
+        with self._user_state_scope.scope(callback.user_id):
+            self._handle(callback)
+
+    def _handle(self, callback: BotCallback) -> None:
         self.callback_answerer.answer(callback_query_id=callback.id)
 
         if not callback.data:
@@ -59,13 +69,12 @@ class ProjectSelectHandler:
             language_code=user.language_code,
         ).format(project_name=project.id)
 
-        stored_message = self._message_for_replace_storage.get(callback.user_id)
+        stored_message = self._message_for_replace_storage.pop(callback.user_id)
         if stored_message:
             self._message_service.replace(
                 chat_id=callback.user_id,
                 message_id=stored_message.message_id,
                 text=text,
             )
-            self._message_for_replace_storage.clear(callback.user_id)
         else:
             self._message_service.send(chat_id=callback.user_id, text=text)
@@ -1,13 +1,31 @@
+from src.messaging.channel_pool import ChannelPool, ChannelStats
+from src.messaging.codecs import (
+    JsonCodec,
+    MessageCodec,
+    MessageSerializer,
+    MsgpackCodec,
+    decode_message,
+)
 from src.messaging.connection import RabbitMQConnection
 from src.messaging.consumer import MessageConsumer
+from src.messaging.errors import PermanentMessageError, TransientMessageError
 from src.messaging.messages import ClaudeRequest, ClaudeResponse, StopRequest
 from src.messaging.publisher import MessagePublisher, SyncMessagePublisher
 
 __all__ = [
+    "ChannelPool",
+    "ChannelStats",
+    "JsonCodec",
+    "MessageCodec",
+    "MessageSerializer",
+    "MsgpackCodec",
+    "decode_message",
     "RabbitMQConnection",
     "MessagePublisher",
     "SyncMessagePublisher",
     "MessageConsumer",
+    "PermanentMessageError",
+    "TransientMessageError",
     "ClaudeRequest",
     "ClaudeResponse",
     "StopRequest",
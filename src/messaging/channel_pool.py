@@ -0,0 +1,111 @@
+import asyncio
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractExchange
+from pydantic import BaseModel
+
+from src.messaging.connection import RabbitMQConnection
+
+
+class ChannelStats(BaseModel):
+    index: int
+    published: int = 0
+    failed: int = 0
+    nacked: int = 0
+    outstanding: int = 0
+    opened: int = 0
+    last_published_at: datetime | None = None
+
+
+class PooledChannel:
+    def __init__(self, index: int) -> None:
+        self.stats = ChannelStats(index=index)
+        self.channel: AbstractChannel | None = None
+        self.exchange: AbstractExchange | None = None
+        self.open_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.channel is not None and not self.channel.is_closed
+
+    def get_exchange(self) -> AbstractExchange:
+        if self.exchange is None:
+            raise RuntimeError(f"Channel {self.stats.index} is not open")
+        return self.exchange
+
+    def record_published(self) -> None:
+        self.stats.published += 1
+        self.stats.last_published_at = datetime.now(tz=UTC)
+
+    def record_failed(self) -> None:
+        self.stats.failed += 1
+
+    def record_nacked(self) -> None:
+        self.stats.nacked += 1
+
+
+class ChannelPool:
+    def __init__(
+        self,
+        connection: RabbitMQConnection,
+        exchange_name: str,
+        size: int = 4,
+        publisher_confirms: bool = True,
+    ) -> None:
+        self._connection = connection
+        self._publisher_confirms = publisher_confirms
+        self._exchange_name = exchange_name
+        self._channels = [PooledChannel(index) for index in range(size)]
+        self._idle: asyncio.Queue[PooledChannel] = asyncio.Queue()
+        for pooled in self._channels:
+            self._idle.put_nowait(pooled)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledChannel]:
+        pooled = await self._idle.get()
+        try:
+            if not pooled.is_open:
+                await self.reopen(pooled)
+            yield pooled
+        finally:
+            self._idle.put_nowait(pooled)
+
+    async def get_pinned(self, key: str) -> PooledChannel:
+        pooled = self._channels[zlib.crc32(key.encode()) % len(self._channels)]
+        await self.ensure_open(pooled)
+        return pooled
+
+    async def ensure_open(self, pooled: PooledChannel) -> None:
+        if pooled.is_open:
+            return
+        async with pooled.open_lock:
+            if not pooled.is_open:
+                await self.reopen(pooled)
+
+    async def reopen(self, pooled: PooledChannel) -> None:
+        if pooled.channel is not None and not pooled.channel.is_closed:
+            await pooled.channel.close()
+        channel = await self._connection.get_channel(
+            publisher_confirms=self._publisher_confirms
+        )
+        pooled.exchange = await channel.declare_exchange(
+            self._exchange_name,
+            aio_pika.ExchangeType.TOPIC,
+            durable=True,
+        )
+        pooled.channel = channel
+        pooled.stats.opened += 1
+
+    def get_stats(self) -> list[ChannelStats]:
+        return [pooled.stats.model_copy() for pooled in self._channels]
+
+    async def close(self) -> None:
+        for pooled in self._channels:
+            if pooled.channel is not None and not pooled.channel.is_closed:
+                await pooled.channel.close()
+            pooled.channel = None
+            pooled.exchange = None
@@ -0,0 +1,115 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple, Self
+
+from pydantic import BaseModel
+
+# msgpack is optional: without it only the JSON codec is available.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+DEFLATE_ENCODING = "deflate"
+
+
+class EncodedBody(NamedTuple):
+    body: bytes
+    content_type: str
+    content_encoding: str | None
+
+
+class MessageCodec(ABC):
+    content_type: str
+
+    @abstractmethod
+    def encode(self, message: BaseModel) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode[T: BaseModel](self, body: bytes, message_type: type[T]) -> T:
+        pass
+
+
+class JsonCodec(MessageCodec):
+    content_type = "application/json"
+
+    def encode(self, message: BaseModel) -> bytes:
+        return message.model_dump_json().encode()
+
+    def decode[T: BaseModel](self, body: bytes, message_type: type[T]) -> T:
+        return message_type.model_validate_json(body)
+
+
+class MsgpackCodec(MessageCodec):
+    content_type = "application/msgpack"
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise RuntimeError("The msgpack codec requires the msgpack package")
+
+    def encode(self, message: BaseModel) -> bytes:
+        return msgpack.packb(message.model_dump(mode="json", exclude_defaults=True))
+
+    def decode[T: BaseModel](self, body: bytes, message_type: type[T]) -> T:
+        data: dict[str, Any] = msgpack.unpackb(body)
+        return message_type.model_validate(data)
+
+
+CODECS_BY_NAME: dict[str, MessageCodec] = {"json": JsonCodec()}
+if msgpack is not None:
+    CODECS_BY_NAME["msgpack"] = MsgpackCodec()
+CODECS: dict[str, MessageCodec] = {
+    codec.content_type: codec for codec in CODECS_BY_NAME.values()
+}
+
+
+class MessageSerializer:
+    def __init__(
+        self,
+        codec: MessageCodec | None = None,
+        compress_threshold: int | None = None,
+        compress_level: int = 1,
+    ) -> None:
+        self._codec = codec or CODECS[JsonCodec.content_type]
+        self._compress_threshold = compress_threshold
+        self._compress_level = compress_level
+
+    @classmethod
+    def from_name(
+        cls,
+        codec_name: str,
+        compress_threshold: int | None = None,
+    ) -> Self:
+        codec = CODECS_BY_NAME.get(codec_name)
+        if codec is None and codec_name == "msgpack":
+            raise ValueError("The msgpack codec requires the msgpack package")
+        if codec is None:
+            raise ValueError(f"Unknown message codec: {codec_name}")
+        return cls(codec=codec, compress_threshold=compress_threshold)
+
+    def encode(self, message: BaseModel) -> EncodedBody:
+        body = self._codec.encode(message)
+        if self._compress_threshold is not None and len(body) >= self._compress_threshold:
+            return EncodedBody(
+                zlib.compress(body, self._compress_level),
+                self._codec.content_type,
+                DEFLATE_ENCODING,
+            )
+        return EncodedBody(body, self._codec.content_type, None)
+
+
+def decode_message[T: BaseModel](
+    body: bytes,
+    content_type: str | None,
+    content_encoding: str | None,
+    message_type: type[T],
+) -> T:
+    if content_encoding == DEFLATE_ENCODING:
+        body = zlib.decompress(body)
+    elif content_encoding:
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+    codec = CODECS.get(content_type or JsonCodec.content_type)
+    if codec is None:
+        raise ValueError(f"Unsupported content type: {content_type}")
+    return codec.decode(body, message_type)
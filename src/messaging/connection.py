@@ -11,12 +11,12 @@ class RabbitMQConnection:
         self._connection = await connect_robust(self._url)
         return self._connection
 
-    async def get_channel(self) -> AbstractChannel:
+    async def get_channel(self, publisher_confirms: bool = True) -> AbstractChannel:
         if not self._connection:
             await self.connect()
         if not self._connection:
             raise RuntimeError("Failed to establish RabbitMQ connection")
-        return await self._connection.channel()
+        return await self._connection.channel(publisher_confirms=publisher_confirms)
 
     async def close(self) -> None:
         if self._connection:
@@ -1,48 +1,260 @@
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 import aio_pika
-from aio_pika.abc import AbstractIncomingMessage
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
 from pydantic import BaseModel
 
+from src.messaging.codecs import decode_message
 from src.messaging.connection import RabbitMQConnection
+from src.messaging.errors import PermanentMessageError, TransientMessageError
+
+logger = logging.getLogger(__name__)
+
+RETRY_ATTEMPT_HEADER = "x-retry-attempt"
+ORIGINAL_EXCHANGE_HEADER = "x-original-exchange"
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+DEATH_REASON_HEADER = "x-death-reason"
 
 
 class MessageConsumer[T: BaseModel](ABC):
+    TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+        TransientMessageError,
+        ConnectionError,
+        TimeoutError,
+    )
+
     def __init__(
         self,
         connection: RabbitMQConnection,
+        message_type: type[T],
         exchange_name: str,
         queue_name: str,
         routing_key: str,
         prefetch_count: int = 10,
+        durable: bool = True,
+        auto_delete: bool = False,
+        queue_arguments: dict[str, Any] | None = None,
+        retry_delays_seconds: Sequence[float] = (),
+        retry_target_queue: str | None = None,
     ) -> None:
         self._connection = connection
+        self._message_type = message_type
         self._exchange_name = exchange_name
         self._queue_name = queue_name
         self._routing_key = routing_key
         self._prefetch_count = prefetch_count
+        self._durable = durable
+        self._auto_delete = auto_delete
+        self._queue_arguments = queue_arguments
+        self._retry_delays_seconds = tuple(retry_delays_seconds)
+        # Retried messages re-enter through this queue, and its retry and
+        # dead queues are the ones used. Consumers of short-lived queues point
+        # it at a long-lived queue so they share one set of retry queues.
+        self._retry_target_queue = retry_target_queue or queue_name
+        self._channel: AbstractChannel | None = None
+        self._queue: AbstractQueue | None = None
+        self._consumer_tag: str | None = None
+        self._in_flight: set[asyncio.Task[Any]] = set()
+
+    @property
+    def dead_letter_queue_name(self) -> str:
+        return f"{self._retry_target_queue}.dead"
+
+    def retry_queue_name(self, attempt: int) -> str:
+        return f"{self._retry_target_queue}.retry.{attempt}"
 
     async def start(self) -> None:
         channel = await self._connection.get_channel()
-        await channel.set_qos(prefetch_count=self._prefetch_count)
+        # Each consumer has its own channel, so a channel-wide limit is the
+        # consumer's limit, and unlike a per-consumer one it can be changed
+        # without re-registering the consumer.
+        await channel.set_qos(prefetch_count=self._prefetch_count, global_=True)
+        self._channel = channel
+
+        self._queue = await self._declare_queue(channel)
+        if self._retry_delays_seconds:
+            await self._declare_retry_topology(channel)
+        self._consumer_tag = await self._queue.consume(self._process_message)
+
+    @property
+    def is_paused(self) -> bool:
+        return self._queue is not None and self._consumer_tag is None
 
-        queue = await channel.declare_queue(self._queue_name, durable=True)
+    async def pause(self) -> None:
+        if self._queue is None or self._consumer_tag is None:
+            return
+        consumer_tag, self._consumer_tag = self._consumer_tag, None
+        await self._queue.cancel(consumer_tag)
+
+    async def wait_idle(self) -> None:
+        current = asyncio.current_task()
+        pending = [task for task in self._in_flight if task is not current]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def resume(self) -> None:
+        if self._queue is None or self._consumer_tag is not None:
+            return
+        if self._channel is not None:
+            # A queue with x-expires may have been deleted while nothing
+            # consumed from it.
+            self._queue = await self._declare_queue(self._channel)
+        self._consumer_tag = await self._queue.consume(self._process_message)
+
+    async def set_prefetch(self, prefetch_count: int) -> None:
+        if prefetch_count == self._prefetch_count:
+            return
+        self._prefetch_count = prefetch_count
+        if self._channel is None:
+            return
+        await self._channel.set_qos(prefetch_count=prefetch_count, global_=True)
+
+    async def _declare_queue(self, channel: AbstractChannel) -> AbstractQueue:
+        queue = await channel.declare_queue(
+            self._queue_name,
+            durable=self._durable,
+            auto_delete=self._auto_delete,
+            arguments=self._queue_arguments,
+        )
         exchange = await channel.declare_exchange(
             self._exchange_name,
             aio_pika.ExchangeType.TOPIC,
             durable=True,
         )
         await queue.bind(exchange, routing_key=self._routing_key)
-        await queue.consume(self._process_message)
+        return queue
+
+    async def _declare_retry_topology(self, channel: AbstractChannel) -> None:
+        # Each attempt gets its own queue with a fixed TTL, so a long delay
+        # never holds back shorter ones. Expired messages go straight back
+        # to the retried queue through the default exchange.
+        for attempt, delay in enumerate(self._retry_delays_seconds, start=1):
+            await channel.declare_queue(
+                self.retry_queue_name(attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": int(delay * 1000),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self._retry_target_queue,
+                },
+            )
+        await channel.declare_queue(self.dead_letter_queue_name, durable=True)
 
     async def _process_message(self, message: AbstractIncomingMessage) -> None:
-        async with message.process():
-            parsed = self._parse_message(message.body)
+        task = asyncio.current_task()
+        if task is not None:
+            self._in_flight.add(task)
+        parsed: T | None = None
+        try:
+            parsed = self._parse_message(message)
             await self._handle_message(parsed)
+        except Exception as error:
+            await self._handle_failure(message, parsed, error)
+        else:
+            await message.ack()
+        finally:
+            self._in_flight.discard(task)  # pyright: ignore[reportArgumentType]
 
-    @abstractmethod
-    def _parse_message(self, body: bytes) -> T:
-        pass
+    async def _handle_failure(
+        self,
+        message: AbstractIncomingMessage,
+        parsed: T | None,
+        error: Exception,
+    ) -> None:
+        if not self._retry_delays_seconds or self._channel is None:
+            logger.exception("Failed to process message from %s", self._queue_name)
+            await message.reject(requeue=False)
+            return
+
+        attempt = int(message.headers.get(RETRY_ATTEMPT_HEADER) or 0)  # pyright: ignore[reportArgumentType]
+        # Retries come back through the default exchange, so the destination
+        # is only recorded on the first failure and then carried along.
+        origin: dict[str, Any] = {}
+        if ORIGINAL_EXCHANGE_HEADER not in message.headers:
+            if self._retry_target_queue != self._queue_name:
+                origin = {
+                    ORIGINAL_EXCHANGE_HEADER: "",
+                    ORIGINAL_ROUTING_KEY_HEADER: self._retry_target_queue,
+                }
+            else:
+                origin = {
+                    ORIGINAL_EXCHANGE_HEADER: message.exchange or "",
+                    ORIGINAL_ROUTING_KEY_HEADER: message.routing_key or self._queue_name,
+                }
+        if self._is_transient(error) and attempt < len(self._retry_delays_seconds):
+            logger.warning(
+                "Transient failure on %s, retry %d in %.0fs: %s",
+                self._queue_name,
+                attempt + 1,
+                self._retry_delays_seconds[attempt],
+                error,
+            )
+            await self._republish(
+                message,
+                self.retry_queue_name(attempt + 1),
+                {**origin, RETRY_ATTEMPT_HEADER: attempt + 1},
+            )
+        else:
+            logger.error(
+                "Dead-lettering message from %s after %d attempt(s)",
+                self._queue_name,
+                attempt + 1,
+                exc_info=error,
+            )
+            await self._republish(
+                message,
+                self.dead_letter_queue_name,
+                {
+                    **origin,
+                    RETRY_ATTEMPT_HEADER: attempt,
+                    DEATH_REASON_HEADER: f"{type(error).__name__}: {error}"[:1000],
+                },
+            )
+            try:
+                await self._on_dead_letter(parsed, error)
+            except Exception:
+                logger.exception("Dead-letter hook failed for %s", self._queue_name)
+        await message.ack()
+
+    async def _republish(
+        self,
+        message: AbstractIncomingMessage,
+        queue_name: str,
+        headers: dict[str, Any],
+    ) -> None:
+        if self._channel is None:
+            raise RuntimeError("Consumer is not started")
+        await self._channel.default_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers={**message.headers, **headers},
+                content_type=message.content_type,
+                content_encoding=message.content_encoding,
+                priority=message.priority,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=queue_name,
+        )
+
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, PermanentMessageError):
+            return False
+        return isinstance(error, self.TRANSIENT_ERRORS)
+
+    async def _on_dead_letter(self, message: T | None, error: Exception) -> None:
+        logger.debug("No dead-letter hook for %s: %s", self._queue_name, error)
+
+    def _parse_message(self, message: AbstractIncomingMessage) -> T:
+        return decode_message(
+            message.body,
+            message.content_type,
+            message.content_encoding,
+            self._message_type,
+        )
 
     @abstractmethod
     async def _handle_message(self, message: T) -> None:
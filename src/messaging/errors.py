@@ -0,0 +1,6 @@
+class TransientMessageError(Exception):
+    pass
+
+
+class PermanentMessageError(Exception):
+    pass
@@ -1,37 +1,392 @@
+import asyncio
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any
+
 import aio_pika
 import pika
+from aio_pika.exceptions import ChannelClosed, ChannelInvalidStateError, DeliveryError
+from pika.adapters.blocking_connection import BlockingChannel, BlockingConnection
+from pika.exceptions import NackError
 from pydantic import BaseModel
 
+from src.messaging.channel_pool import ChannelPool, ChannelStats, PooledChannel
+from src.messaging.codecs import EncodedBody, MessageSerializer
 from src.messaging.connection import RabbitMQConnection
 
+logger = logging.getLogger(__name__)
+
+
+class PendingConfirm:
+    def __init__(self, amqp_message: aio_pika.Message, routing_key: str) -> None:
+        self.amqp_message = amqp_message
+        self.routing_key = routing_key
+        self.result: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.send: asyncio.Task[Any] | None = None
+        self.confirmed = False
+        self.failed = False
+        self.failures = 0
+
+
+class ConfirmStream:
+    def __init__(self, pooled: PooledChannel) -> None:
+        self.pooled = pooled
+        self.pending: deque[PendingConfirm] = deque()
+        self.resending = False
+
 
 class MessagePublisher:
-    def __init__(self, connection: RabbitMQConnection, exchange_name: str) -> None:
-        self._connection = connection
-        self._exchange_name = exchange_name
+    RETRY_DELAY_SECONDS = 0.2
 
-    async def publish(self, message: BaseModel, routing_key: str) -> None:
-        channel = await self._connection.get_channel()
-        exchange = await channel.declare_exchange(
-            self._exchange_name,
-            aio_pika.ExchangeType.TOPIC,
-            durable=True,
+    def __init__(
+        self,
+        connection: RabbitMQConnection,
+        exchange_name: str,
+        pool_size: int = 4,
+        confirm_delivery: bool = False,
+        max_outstanding: int = 1000,
+        max_publish_attempts: int = 3,
+        serializer: MessageSerializer | None = None,
+    ) -> None:
+        self._pool = ChannelPool(
+            connection,
+            exchange_name,
+            size=pool_size,
+            publisher_confirms=confirm_delivery,
+        )
+        self._serializer = serializer or MessageSerializer()
+        self._confirm_delivery = confirm_delivery
+        self._max_publish_attempts = max_publish_attempts
+        self._window = asyncio.Semaphore(max_outstanding)
+        self._outstanding: set[asyncio.Future[None]] = set()
+        self._streams: dict[str, ConfirmStream] = {}
+        self._resends: set[asyncio.Task[None]] = set()
+        self._unordered = itertools.count()
+
+    async def publish(
+        self,
+        message: BaseModel,
+        routing_key: str,
+        ordering_key: str | None = None,
+        wait_for_confirm: bool = False,
+        priority: int | None = None,
+    ) -> None:
+        if self._confirm_delivery:
+            confirmation = await self._publish_pipelined(
+                message, routing_key, ordering_key, priority
+            )
+            if wait_for_confirm:
+                await confirmation
+            return
+
+        amqp_message = self._build_message(message, persistent=False, priority=priority)
+        async with self._pool.acquire() as pooled:
+            try:
+                await pooled.get_exchange().publish(
+                    amqp_message, routing_key=routing_key
+                )
+            except (ChannelClosed, ChannelInvalidStateError):
+                pooled.record_failed()
+                await self._pool.reopen(pooled)
+                await pooled.get_exchange().publish(
+                    amqp_message, routing_key=routing_key
+                )
+            pooled.record_published()
+
+    async def flush(self) -> None:
+        while self._outstanding:
+            await asyncio.gather(*self._outstanding, return_exceptions=True)
+
+    def get_channel_stats(self) -> list[ChannelStats]:
+        return self._pool.get_stats()
+
+    async def close(self) -> None:
+        await self.flush()
+        await self._pool.close()
+
+    def _build_message(
+        self,
+        message: BaseModel,
+        persistent: bool,
+        priority: int | None = None,
+    ) -> aio_pika.Message:
+        encoded = self._serializer.encode(message)
+        return aio_pika.Message(
+            body=encoded.body,
+            content_type=encoded.content_type,
+            content_encoding=encoded.content_encoding,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT if persistent else None,
+            priority=priority,
+        )
+
+    async def _publish_pipelined(
+        self,
+        message: BaseModel,
+        routing_key: str,
+        ordering_key: str | None,
+        priority: int | None,
+    ) -> asyncio.Future[None]:
+        # Messages sharing an ordering key go out back to back on one pinned
+        # channel, which keeps them in order without waiting for each confirm.
+        # Messages without a key get a stream of their own, so they spread
+        # over the pool instead of all landing on the channel of their
+        # routing key.
+        amqp_message = self._build_message(message, persistent=True, priority=priority)
+        if ordering_key is None:
+            ordering_key = f"#{next(self._unordered)}"
+        await self._window.acquire()
+        try:
+            stream = self._streams.get(ordering_key)
+            if stream is None:
+                pooled = await self._pool.get_pinned(ordering_key)
+                stream = self._streams.setdefault(ordering_key, ConfirmStream(pooled))
+        except BaseException:
+            self._window.release()
+            raise
+
+        entry = PendingConfirm(amqp_message, routing_key)
+        stream.pending.append(entry)
+        stream.pooled.stats.outstanding += 1
+        self._outstanding.add(entry.result)
+        entry.result.add_done_callback(
+            lambda result: self._on_settled(result, stream.pooled)
+        )
+        if not stream.resending:
+            self._send(ordering_key, stream, entry)
+        return entry.result
+
+    def _send(
+        self, ordering_key: str, stream: ConfirmStream, entry: PendingConfirm
+    ) -> None:
+        # aio-pika writes the frames before its first suspension point, so
+        # sends started in this order reach the channel in this order.
+        send = asyncio.create_task(
+            stream.pooled.get_exchange().publish(
+                entry.amqp_message, routing_key=entry.routing_key
+            )
         )
-        await exchange.publish(
-            aio_pika.Message(
-                body=message.model_dump_json().encode(),
-                content_type="application/json",
-            ),
-            routing_key=routing_key,
+        entry.send = send
+        send.add_done_callback(
+            lambda done: self._on_confirm(ordering_key, stream, entry, done)
         )
 
+    def _on_confirm(
+        self,
+        ordering_key: str,
+        stream: ConfirmStream,
+        entry: PendingConfirm,
+        done: asyncio.Task[Any],
+    ) -> None:
+        if done is not entry.send:
+            # Superseded by a resend, whose confirm is the one that counts.
+            return
+        error = None if done.cancelled() else done.exception()
+        if error is None and not done.cancelled():
+            entry.confirmed = True
+            stream.pooled.record_published()
+            self._settle(ordering_key, stream)
+            return
+
+        if isinstance(error, DeliveryError):
+            stream.pooled.record_nacked()
+        else:
+            stream.pooled.record_failed()
+        entry.failed = True
+        entry.failures += 1
+        if stream.resending:
+            return
+        stream.resending = True
+        task = asyncio.create_task(self._resend(ordering_key, stream))
+        self._resends.add(task)
+        task.add_done_callback(self._resends.discard)
+
+    async def _resend(self, ordering_key: str, stream: ConfirmStream) -> None:
+        # A failed message is sent again together with everything published
+        # behind it on the same key, so the broker still sees them in order.
+        try:
+            while head := next((e for e in stream.pending if e.failed), None):
+                if head.failures >= self._max_publish_attempts:
+                    stream.pending.remove(head)
+                    head.result.set_exception(
+                        RuntimeError(
+                            f"Broker did not confirm message for {head.routing_key} "
+                            f"after {head.failures} attempts"
+                        )
+                    )
+                    continue
+                await asyncio.sleep(self.RETRY_DELAY_SECONDS * head.failures)
+                try:
+                    await self._pool.ensure_open(stream.pooled)
+                except Exception:
+                    logger.warning("Failed to reopen publisher channel", exc_info=True)
+                    head.failures += 1
+                    continue
+                break
+
+            resend_from = next(
+                (
+                    index
+                    for index, entry in enumerate(stream.pending)
+                    if entry.failed or entry.send is None
+                ),
+                len(stream.pending),
+            )
+            for entry in list(stream.pending)[resend_from:]:
+                entry.failed = False
+                entry.confirmed = False
+                self._send(ordering_key, stream, entry)
+        finally:
+            stream.resending = False
+            self._settle(ordering_key, stream)
+
+    def _settle(self, ordering_key: str, stream: ConfirmStream) -> None:
+        # Confirms are reported in publish order: a message only counts as
+        # delivered once nothing ahead of it can still be resent.
+        while stream.pending and stream.pending[0].confirmed:
+            stream.pending.popleft().result.set_result(None)
+        if (
+            not stream.pending
+            and not stream.resending
+            and self._streams.get(ordering_key) is stream
+        ):
+            del self._streams[ordering_key]
+
+    def _on_settled(self, result: asyncio.Future[None], pooled: PooledChannel) -> None:
+        self._outstanding.discard(result)
+        self._window.release()
+        pooled.stats.outstanding -= 1
+        if not result.cancelled() and result.exception() is not None:
+            logger.error("Confirmed publish failed", exc_info=result.exception())
+
 
 class SyncMessagePublisher:
-    def __init__(self, rabbitmq_url: str, exchange_name: str) -> None:
+    IDLE_POLL_SECONDS = 1.0
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+    CLOSE_TIMEOUT_SECONDS = 10.0
+    MAX_NACK_RETRIES = 3
+
+    def __init__(
+        self,
+        rabbitmq_url: str,
+        exchange_name: str,
+        confirm_delivery: bool = False,
+        serializer: MessageSerializer | None = None,
+    ) -> None:
         self._rabbitmq_url = rabbitmq_url
         self._exchange_name = exchange_name
+        self._confirm_delivery = confirm_delivery
+        self._serializer = serializer or MessageSerializer()
+        self._outgoing: queue.Queue[tuple[str, EncodedBody]] = queue.Queue()
+        self._stopping = threading.Event()
+        self._close_deadline = 0.0
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
 
     def publish(self, message: BaseModel, routing_key: str) -> None:
+        if self._stopping.is_set():
+            raise RuntimeError("Publisher is closed")
+        self._ensure_started()
+        self._outgoing.put((routing_key, self._serializer.encode(message)))
+
+    def pending_count(self) -> int:
+        return self._outgoing.qsize()
+
+    def close(self) -> None:
+        self._close_deadline = time.monotonic() + self.CLOSE_TIMEOUT_SECONDS
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.CLOSE_TIMEOUT_SECONDS)
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"amqp-publisher:{self._exchange_name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        connection: BlockingConnection | None = None
+        channel: BlockingChannel | None = None
+        pending: tuple[str, EncodedBody] | None = None
+        nacks = 0
+        reconnect_delay = self.RECONNECT_DELAY_SECONDS
+
+        while True:
+            if pending is None:
+                try:
+                    pending = self._outgoing.get(timeout=self.IDLE_POLL_SECONDS)
+                except queue.Empty:
+                    if self._stopping.is_set():
+                        break
+
+            try:
+                if connection is None or channel is None or connection.is_closed:
+                    connection, channel = self._connect()
+                if pending is None:
+                    connection.process_data_events(time_limit=0)
+                    continue
+                routing_key, encoded = pending
+                channel.basic_publish(
+                    exchange=self._exchange_name,
+                    routing_key=routing_key,
+                    body=encoded.body,
+                    properties=pika.BasicProperties(
+                        content_type=encoded.content_type,
+                        content_encoding=encoded.content_encoding,
+                        delivery_mode=pika.DeliveryMode.Persistent
+                        if self._confirm_delivery
+                        else None,
+                    ),
+                )
+                pending = None
+                nacks = 0
+                reconnect_delay = self.RECONNECT_DELAY_SECONDS
+            except NackError:
+                nacks += 1
+                if nacks > self.MAX_NACK_RETRIES:
+                    logger.error(
+                        "Broker rejected message for %s %d times, dropping it",
+                        self._exchange_name,
+                        nacks,
+                    )
+                    pending = None
+                    nacks = 0
+                else:
+                    time.sleep(self.RECONNECT_DELAY_SECONDS * nacks)
+            except Exception:
+                logger.exception(
+                    "Publishing to %s failed, reconnecting in %.1fs",
+                    self._exchange_name,
+                    reconnect_delay,
+                )
+                self._close_quietly(connection)
+                connection, channel = None, None
+                if self._stopping.is_set() and time.monotonic() >= self._close_deadline:
+                    break
+                time.sleep(reconnect_delay)
+                reconnect_delay = min(
+                    reconnect_delay * 2,
+                    self.MAX_RECONNECT_DELAY_SECONDS,
+                )
+
+        if pending is not None or not self._outgoing.empty():
+            logger.warning(
+                "Publisher for %s stopped with %d undelivered messages",
+                self._exchange_name,
+                self._outgoing.qsize() + (pending is not None),
+            )
+        self._close_quietly(connection)
+
+    def _connect(self) -> tuple[BlockingConnection, BlockingChannel]:
         params = pika.URLParameters(self._rabbitmq_url)
         connection = pika.BlockingConnection(params)
         channel = connection.channel()
@@ -40,10 +395,14 @@ class SyncMessagePublisher:
             exchange_type="topic",
             durable=True,
         )
-        channel.basic_publish(
-            exchange=self._exchange_name,
-            routing_key=routing_key,
-            body=message.model_dump_json().encode(),
-            properties=pika.BasicProperties(content_type="application/json"),
-        )
-        connection.close()
+        if self._confirm_delivery:
+            channel.confirm_delivery()
+        return connection, channel
+
+    def _close_quietly(self, connection: BlockingConnection | None) -> None:
+        if connection is None or connection.is_closed:
+            return
+        try:
+            connection.close()
+        except Exception:
+            logger.debug("Error while closing connection to %s", self._exchange_name)
@@ -2,16 +2,20 @@ from src.shared.protocols.i_message_for_replace_storage import IMessageForReplac
 from src.shared.protocols.i_project_selection_state_storage import (
     IProjectSelectionStateStorage,
 )
-from src.shared.repos.redis_message_for_replace_storage import (
-    RedisMessageForReplaceStorage,
-)
-from src.shared.repos.redis_project_selection_state_storage import (
-    RedisProjectSelectionStateStorage,
+from src.shared.protocols.i_user_state_scope import IUserStateScope
+from src.shared.repos.cached_phrase_repo import CachedPhraseRepo
+from src.shared.repos.redis_client_factory import (
+    create_async_redis_client,
+    create_redis_client,
 )
+from src.shared.repos.redis_user_state_storage import RedisUserStateStorage
 
 __all__ = [
+    "CachedPhraseRepo",
     "IMessageForReplaceStorage",
     "IProjectSelectionStateStorage",
-    "RedisMessageForReplaceStorage",
-    "RedisProjectSelectionStateStorage",
+    "IUserStateScope",
+    "RedisUserStateStorage",
+    "create_async_redis_client",
+    "create_redis_client",
 ]
@@ -2,8 +2,10 @@ from src.shared.protocols.i_message_for_replace_storage import IMessageForReplac
 from src.shared.protocols.i_project_selection_state_storage import (
     IProjectSelectionStateStorage,
 )
+from src.shared.protocols.i_user_state_scope import IUserStateScope
 
 __all__ = [
     "IMessageForReplaceStorage",
     "IProjectSelectionStateStorage",
+    "IUserStateScope",
 ]
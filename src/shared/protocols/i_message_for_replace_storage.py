@@ -8,4 +8,6 @@ class IMessageForReplaceStorage(Protocol):
 
     def get(self, user_id: int) -> BotMessage | None: ...
 
+    def pop(self, user_id: int) -> BotMessage | None: ...
+
     def clear(self, user_id: int) -> None: ...
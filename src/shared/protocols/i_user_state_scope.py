@@ -0,0 +1,8 @@
+from contextlib import AbstractContextManager
+from typing import Any, Protocol
+
+
+class IUserStateScope(Protocol):
+    def scope(self, user_id: int) -> AbstractContextManager[Any]: ...
+
+    def flush(self) -> None: ...
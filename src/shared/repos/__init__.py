@@ -1,11 +1,15 @@
-from src.shared.repos.redis_message_for_replace_storage import (
-    RedisMessageForReplaceStorage,
-)
-from src.shared.repos.redis_project_selection_state_storage import (
-    RedisProjectSelectionStateStorage,
+from src.shared.repos.cached_phrase_repo import CachedPhraseRepo, PhraseCacheStats
+from src.shared.repos.redis_client_factory import (
+    create_async_redis_client,
+    create_redis_client,
 )
+from src.shared.repos.redis_user_state_storage import RedisUserStateStorage, UserState
 
 __all__ = [
-    "RedisMessageForReplaceStorage",
-    "RedisProjectSelectionStateStorage",
+    "CachedPhraseRepo",
+    "PhraseCacheStats",
+    "RedisUserStateStorage",
+    "UserState",
+    "create_async_redis_client",
+    "create_redis_client",
 ]
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+
+import redis
+from bot_framework.language_management.repos.protocols.i_phrase_repo import IPhraseRepo
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class PhraseCacheStats(BaseModel):
+    entries: int
+    hits: int
+    misses: int
+    reloads: int
+    version: str | None
+
+
+class CachedPhraseRepo:
+    VERSION_KEY = "agent_fleet:phrases:version"
+    INVALIDATION_CHANNEL = "agent_fleet:phrases:invalidated"
+    DIGEST_KEY = "agent_fleet:phrases:digest"
+
+    def __init__(
+        self,
+        phrase_repo: IPhraseRepo,
+        redis_client: redis.Redis,
+        phrases_json_path: Path,
+        languages_json_path: Path,
+        poll_interval_seconds: float = 5.0,
+    ) -> None:
+        self._phrase_repo = phrase_repo
+        self._redis = redis_client
+        self._phrases_json_path = phrases_json_path
+        self._languages_json_path = languages_json_path
+        self._poll_interval_seconds = poll_interval_seconds
+        self._cache: dict[tuple[str, str], str] = {}
+        self._version: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def get_phrase(self, key: str, language_code: str) -> str:
+        phrase = self._cache.get((key, language_code))
+        if phrase is not None:
+            self._hits += 1
+            return phrase
+        self._misses += 1
+        phrase = self._phrase_repo.get_phrase(key=key, language_code=language_code)
+        self._cache[(key, language_code)] = phrase
+        return phrase
+
+    def preload(self) -> None:
+        version = self._read_version()
+        phrase_keys = json.loads(self._phrases_json_path.read_text(encoding="utf-8"))
+        languages = json.loads(self._languages_json_path.read_text(encoding="utf-8"))
+        language_codes = [language["code"] for language in languages["languages"]]
+
+        cache: dict[tuple[str, str], str] = {}
+        for key in phrase_keys:
+            for language_code in language_codes:
+                cache[(key, language_code)] = self._phrase_repo.get_phrase(
+                    key=key,
+                    language_code=language_code,
+                )
+        self._cache = cache
+        self._version = version
+        self._reloads += 1
+        logger.info("Loaded %d phrases (version %s)", len(cache), version)
+
+    def publish_invalidation(self) -> None:
+        version = self._redis.incr(self.VERSION_KEY)
+        self._redis.publish(self.INVALIDATION_CHANNEL, str(version))
+        self._version = str(version)
+
+    def publish_if_changed(self) -> bool:
+        # Compares the preloaded phrases with the digest left by the last
+        # publisher, so restarting the bot with unchanged phrases does not
+        # make every consumer reload its cache.
+        digest = self._digest()
+        previous = self._redis.getset(self.DIGEST_KEY, digest)
+        if previous is not None and str(previous, "utf-8") == digest:  # pyright: ignore[reportArgumentType]
+            return False
+        self.publish_invalidation()
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._watch,
+            name="phrase-cache-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_interval_seconds + 1)
+            self._thread = None
+
+    def get_stats(self) -> PhraseCacheStats:
+        return PhraseCacheStats(
+            entries=len(self._cache),
+            hits=self._hits,
+            misses=self._misses,
+            reloads=self._reloads,
+            version=self._version,
+        )
+
+    def _watch(self) -> None:
+        # The subscription blocks its connection for as long as the watcher
+        # runs, so it gets a dedicated one instead of a slot in the shared pool.
+        shared_pool = self._redis.connection_pool
+        pool = redis.ConnectionPool(
+            connection_class=shared_pool.connection_class,
+            max_connections=1,
+            **shared_pool.connection_kwargs,
+        )
+        subscriber = redis.Redis(connection_pool=pool)
+        pubsub = subscriber.pubsub(ignore_subscribe_messages=True)
+        try:
+            while not self._stopping.is_set():
+                try:
+                    if not pubsub.subscribed:
+                        pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                    pubsub.get_message(timeout=self._poll_interval_seconds)
+                    if self._read_version() != self._version:
+                        self.preload()
+                except Exception:
+                    logger.warning("Failed to refresh phrase cache", exc_info=True)
+                    self._stopping.wait(self._poll_interval_seconds)
+        finally:
+            pubsub.close()
+            pool.disconnect()
+
+    def _digest(self) -> str:
+        digest = hashlib.sha256()
+        for (key, language_code), phrase in sorted(self._cache.items()):
+            digest.update(f"{key}\0{language_code}\0{phrase}\0".encode())
+        return digest.hexdigest()
+
+    def _read_version(self) -> str | None:
+        value = self._redis.get(self.VERSION_KEY)
+        if not value:
+            return None
+        return str(value, "utf-8")  # pyright: ignore[reportArgumentType]
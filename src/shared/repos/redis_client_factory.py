@@ -0,0 +1,34 @@
+import redis
+import redis.asyncio
+
+
+def create_redis_client(
+    redis_url: str,
+    max_connections: int = 16,
+    socket_timeout_seconds: float = 5.0,
+    health_check_interval_seconds: int = 30,
+) -> redis.Redis:
+    pool = redis.BlockingConnectionPool.from_url(  # pyright: ignore[reportUnknownMemberType]
+        redis_url,
+        max_connections=max_connections,
+        socket_timeout=socket_timeout_seconds,
+        socket_connect_timeout=socket_timeout_seconds,
+        health_check_interval=health_check_interval_seconds,
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+def create_async_redis_client(
+    redis_url: str,
+    max_connections: int = 16,
+    socket_timeout_seconds: float = 5.0,
+    health_check_interval_seconds: int = 30,
+) -> redis.asyncio.Redis:
+    pool = redis.asyncio.BlockingConnectionPool.from_url(  # pyright: ignore[reportUnknownMemberType]
+        redis_url,
+        max_connections=max_connections,
+        socket_timeout=socket_timeout_seconds,
+        socket_connect_timeout=socket_timeout_seconds,
+        health_check_interval=health_check_interval_seconds,
+    )
+    return redis.asyncio.Redis(connection_pool=pool)
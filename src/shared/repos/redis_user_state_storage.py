@@ -0,0 +1,283 @@
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import redis
+from bot_framework.entities.bot_message import BotMessage
+
+
+class UserState:
+    def __init__(self, user_id: int, fields: dict[str, bytes]) -> None:
+        self.user_id = user_id
+        self._fields = fields
+        self._dirty: set[str] = set()
+
+    def get(self, field: str) -> bytes | None:
+        return self._fields.get(field)
+
+    def set(self, field: str, value: str) -> None:
+        self._fields[field] = value.encode("utf-8")
+        self._dirty.add(field)
+
+    def delete(self, field: str) -> None:
+        self._fields.pop(field, None)
+        self._dirty.add(field)
+
+    def is_dirty(self, field: str) -> bool:
+        return field in self._dirty
+
+    def forget(self, field: str) -> None:
+        self._fields.pop(field, None)
+
+    def take_changes(self) -> tuple[dict[str, bytes], list[str]]:
+        updated = {f: self._fields[f] for f in self._dirty if f in self._fields}
+        deleted = [f for f in self._dirty if f not in self._fields]
+        self._dirty.clear()
+        return updated, deleted
+
+
+_current_state: ContextVar[UserState | None] = ContextVar(
+    "agent_fleet_user_state",
+    default=None,
+)
+
+
+class RedisUserStateStorage:
+    KEY_PREFIX = "agent_fleet:user_state:"
+    TTL_SECONDS = 86400
+    PENDING_PROMPT_TTL_SECONDS = 300
+
+    SELECTED_PROJECT_FIELD = "selected_project"
+    MESSAGE_FOR_REPLACE_FIELD = "message_for_replace"
+    PENDING_PROMPT_FIELD = "pending_prompt"
+
+    # Keys written by the per-field storages this class replaced. Values
+    # still there are moved into the hash on first read; the fallback can be
+    # dropped once TTL_SECONDS have passed since the deploy.
+    LEGACY_KEY_PREFIXES = {
+        SELECTED_PROJECT_FIELD: "agent_fleet:selected_project:",
+        MESSAGE_FOR_REPLACE_FIELD: "agent_fleet:message_for_replace:",
+        PENDING_PROMPT_FIELD: "agent_fleet:pending_prompt:",
+    }
+
+    def __init__(self, redis_client: redis.Redis, legacy_fallback: bool = True) -> None:
+        self._redis = redis_client
+        self._legacy_fallback = legacy_fallback
+
+    def _get_key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    @contextmanager
+    def scope(self, user_id: int) -> Iterator[UserState]:
+        current = _current_state.get()
+        if current is not None and current.user_id == user_id:
+            yield current
+            return
+
+        raw: dict[bytes, bytes] = self._redis.hgetall(self._get_key(user_id))  # pyright: ignore[reportAssignmentType]
+        fields = {k.decode("utf-8"): v for k, v in raw.items()}
+        missing = [field for field in self.LEGACY_KEY_PREFIXES if field not in fields]
+        fields.update(self._migrate_legacy(user_id, missing))
+        state = UserState(user_id, fields)
+        token = _current_state.set(state)
+        try:
+            yield state
+        finally:
+            _current_state.reset(token)
+            self._write_back(state)
+
+    def flush(self) -> None:
+        state = _current_state.get()
+        if state is not None:
+            self._write_back(state)
+
+    def save_selected_project(self, user_id: int, project_id: str) -> None:
+        self._set_field(user_id, self.SELECTED_PROJECT_FIELD, project_id)
+
+    def get_selected_project(self, user_id: int) -> str | None:
+        data = self._get_field(user_id, self.SELECTED_PROJECT_FIELD)
+        if not data:
+            return None
+        return str(data, "utf-8")
+
+    def clear_selection(self, user_id: int) -> None:
+        self._delete_field(user_id, self.SELECTED_PROJECT_FIELD)
+
+    def save(self, user_id: int, message: BotMessage) -> None:
+        self._set_field(user_id, self.MESSAGE_FOR_REPLACE_FIELD, message.model_dump_json())
+
+    def get(self, user_id: int) -> BotMessage | None:
+        data = self._get_field(user_id, self.MESSAGE_FOR_REPLACE_FIELD)
+        if not data:
+            return None
+        return BotMessage.model_validate_json(data)
+
+    def pop(self, user_id: int) -> BotMessage | None:
+        data = self._pop_field(user_id, self.MESSAGE_FOR_REPLACE_FIELD)
+        if not data:
+            return None
+        return BotMessage.model_validate_json(data)
+
+    def clear(self, user_id: int) -> None:
+        self._delete_field(user_id, self.MESSAGE_FOR_REPLACE_FIELD)
+
+    def save_pending_prompt(
+        self, user_id: int, project_id: str, prompt: str
+    ) -> None:
+        data = json.dumps(
+            {
+                "project_id": project_id,
+                "prompt": prompt,
+                "expires_at": time.time() + self.PENDING_PROMPT_TTL_SECONDS,
+            }
+        )
+        self._set_field(user_id, self.PENDING_PROMPT_FIELD, data)
+
+    def get_pending_prompt(self, user_id: int) -> tuple[str, str] | None:
+        return self._parse_pending_prompt(
+            self._get_field(user_id, self.PENDING_PROMPT_FIELD)
+        )
+
+    def pop_pending_prompt(self, user_id: int) -> tuple[str, str] | None:
+        return self._parse_pending_prompt(
+            self._pop_field(user_id, self.PENDING_PROMPT_FIELD)
+        )
+
+    def clear_pending_prompt(self, user_id: int) -> None:
+        self._delete_field(user_id, self.PENDING_PROMPT_FIELD)
+
+    def _parse_pending_prompt(self, data: bytes | None) -> tuple[str, str] | None:
+        if not data:
+            return None
+        parsed = json.loads(str(data, "utf-8"))
+        if parsed.get("expires_at", 0) < time.time():
+            return None
+        return (parsed["project_id"], parsed["prompt"])
+
+    def _scoped_state(self, user_id: int) -> UserState | None:
+        state = _current_state.get()
+        if state is not None and state.user_id == user_id:
+            return state
+        return None
+
+    def _get_field(self, user_id: int, field: str) -> bytes | None:
+        state = self._scoped_state(user_id)
+        if state is not None:
+            return state.get(field)
+        value: bytes | None = self._redis.hget(self._get_key(user_id), field)  # pyright: ignore[reportAssignmentType]
+        if value is None:
+            value = self._migrate_legacy(user_id, [field]).get(field)
+        return value
+
+    def _set_field(self, user_id: int, field: str, value: str) -> None:
+        state = self._scoped_state(user_id)
+        if state is not None:
+            state.set(field, value)
+            return
+        key = self._get_key(user_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, field, value)
+        pipe.expire(key, self.TTL_SECONDS)
+        self._delete_legacy(pipe, user_id, [field])
+        pipe.execute()
+
+    def _delete_field(self, user_id: int, field: str) -> None:
+        state = self._scoped_state(user_id)
+        if state is not None:
+            state.delete(field)
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hdel(self._get_key(user_id), field)
+        self._delete_legacy(pipe, user_id, [field])
+        pipe.execute()
+
+    def _pop_field(self, user_id: int, field: str) -> bytes | None:
+        state = self._scoped_state(user_id)
+        if state is not None and state.is_dirty(field):
+            # Changed in this scope and not written back yet, so the local
+            # value is the current one.
+            value = state.get(field)
+            state.delete(field)
+            return value
+        # Pop against Redis even inside a scope, so two scopes for the same
+        # user cannot both take the value they loaded at entry.
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hget(self._get_key(user_id), field)
+        pipe.hdel(self._get_key(user_id), field)
+        value, _ = pipe.execute()
+        if value is None:
+            value = self._pop_legacy(user_id, field)
+        if state is not None:
+            state.forget(field)
+        return value
+
+    def _migrate_legacy(self, user_id: int, fields: list[str]) -> dict[str, bytes]:
+        fields = [field for field in fields if field in self.LEGACY_KEY_PREFIXES]
+        if not self._legacy_fallback or not fields:
+            return {}
+        pipe = self._redis.pipeline(transaction=False)
+        for field in fields:
+            pipe.getdel(self._legacy_key(field, user_id))
+        values: list[bytes | None] = pipe.execute()
+        migrated = {
+            field: self._from_legacy(field, value)
+            for field, value in zip(fields, values, strict=True)
+            if value
+        }
+        if migrated:
+            key = self._get_key(user_id)
+            pipe = self._redis.pipeline(transaction=False)
+            for field, value in migrated.items():
+                pipe.hsetnx(key, field, value)
+            pipe.expire(key, self.TTL_SECONDS)
+            pipe.execute()
+        return migrated
+
+    def _pop_legacy(self, user_id: int, field: str) -> bytes | None:
+        if not self._legacy_fallback or field not in self.LEGACY_KEY_PREFIXES:
+            return None
+        value: bytes | None = self._redis.getdel(self._legacy_key(field, user_id))  # pyright: ignore[reportAssignmentType]
+        return self._from_legacy(field, value) if value else None
+
+    def _delete_legacy(
+        self,
+        pipe: redis.client.Pipeline,
+        user_id: int,
+        fields: list[str],
+    ) -> None:
+        if not self._legacy_fallback:
+            return
+        keys = [
+            self._legacy_key(field, user_id)
+            for field in fields
+            if field in self.LEGACY_KEY_PREFIXES
+        ]
+        if keys:
+            pipe.delete(*keys)
+
+    def _legacy_key(self, field: str, user_id: int) -> str:
+        return f"{self.LEGACY_KEY_PREFIXES[field]}{user_id}"
+
+    def _from_legacy(self, field: str, value: bytes) -> bytes:
+        if field != self.PENDING_PROMPT_FIELD:
+            return value
+        # The old pending prompt had no expiry inside the value, only a key TTL.
+        parsed = json.loads(str(value, "utf-8"))
+        parsed["expires_at"] = time.time() + self.PENDING_PROMPT_TTL_SECONDS
+        return json.dumps(parsed).encode("utf-8")
+
+    def _write_back(self, state: UserState) -> None:
+        updated, deleted = state.take_changes()
+        if not updated and not deleted:
+            return
+        key = self._get_key(state.user_id)
+        pipe = self._redis.pipeline(transaction=False)
+        if updated:
+            pipe.hset(key, mapping=updated)  # pyright: ignore[reportArgumentType]
+        if deleted:
+            pipe.hdel(key, *deleted)
+            self._delete_legacy(pipe, state.user_id, deleted)
+        pipe.expire(key, self.TTL_SECONDS)
+        pipe.execute()
@@ -0,0 +1,8 @@
+from src.shared.services.outbound_dispatcher import OutboundDispatcher, OutboundStats
+from src.shared.services.token_bucket import TokenBucket
+
+__all__ = [
+    "OutboundDispatcher",
+    "OutboundStats",
+    "TokenBucket",
+]
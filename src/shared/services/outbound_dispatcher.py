@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.shared.services.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundStats(BaseModel):
+    submitted: int = 0
+    sent: int = 0
+    collapsed: int = 0
+    rate_limited: int = 0
+    failed: int = 0
+    pending: int = 0
+    active_chats: int = 0
+
+
+class OutboundJob:
+    def __init__(self, action: Callable[[], Any], collapse_key: str | None) -> None:
+        self.action = action
+        self.collapse_key = collapse_key
+        # A collapsed job hands its waiters to the job that replaced it.
+        self.waiters: list[asyncio.Future[None]] = [
+            asyncio.get_running_loop().create_future()
+        ]
+
+    def finish(self) -> None:
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class OutboundDispatcher:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        global_rate_per_second: float = 25.0,
+        chat_rate_per_second: float = 1.0,
+        chat_burst: int = 3,
+        max_retries: int = 3,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="telegram-outbound",
+        )
+        self._global_bucket = TokenBucket(
+            rate_per_second=global_rate_per_second,
+            capacity=global_rate_per_second,
+        )
+        self._chat_rate_per_second = chat_rate_per_second
+        self._chat_burst = chat_burst
+        self._max_retries = max_retries
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._queues: dict[int, deque[OutboundJob]] = {}
+        self._drainers: dict[int, asyncio.Task[None]] = {}
+        self._stats = OutboundStats()
+
+    def submit(
+        self,
+        chat_id: int,
+        action: Callable[[], Any],
+        collapse_key: str | None = None,
+    ) -> asyncio.Future[None]:
+        # The future resolves once the action was sent or failed for good,
+        # including when it was collapsed into a later job.
+        self._stats.submitted += 1
+        queue = self._queues.setdefault(chat_id, deque())
+        job = OutboundJob(action, collapse_key)
+        delivered = job.waiters[0]
+        if collapse_key is not None and queue and queue[-1].collapse_key == collapse_key:
+            job.waiters.extend(queue[-1].waiters)
+            queue[-1] = job
+            self._stats.collapsed += 1
+        else:
+            queue.append(job)
+
+        if chat_id not in self._drainers:
+            self._drainers[chat_id] = asyncio.create_task(self._drain(chat_id))
+        return delivered
+
+    def get_stats(self) -> OutboundStats:
+        stats = self._stats.model_copy()
+        stats.pending = sum(len(queue) for queue in self._queues.values())
+        stats.active_chats = len(self._drainers)
+        return stats
+
+    async def close(self) -> None:
+        if self._drainers:
+            await asyncio.gather(*self._drainers.values(), return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def _drain(self, chat_id: int) -> None:
+        queue = self._queues[chat_id]
+        try:
+            while queue:
+                job = queue.popleft()
+                try:
+                    await self._send(chat_id, job)
+                finally:
+                    job.finish()
+        finally:
+            del self._drainers[chat_id]
+            if not queue:
+                del self._queues[chat_id]
+                bucket = self._chat_buckets.get(chat_id)
+                if bucket is not None and bucket.is_full:
+                    del self._chat_buckets[chat_id]
+
+    async def _send(self, chat_id: int, job: OutboundJob) -> None:
+        chat_bucket = self._get_chat_bucket(chat_id)
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self._max_retries + 1):
+            await chat_bucket.acquire()
+            await self._global_bucket.acquire()
+            try:
+                await loop.run_in_executor(self._executor, job.action)
+            except Exception as e:
+                retry_after = self._get_retry_after(e)
+                if retry_after is None or attempt == self._max_retries:
+                    self._stats.failed += 1
+                    logger.exception("Failed to deliver outbound message to chat %s", chat_id)
+                    return
+                self._stats.rate_limited += 1
+                logger.warning(
+                    "Rate limited for chat %s, retrying in %.1fs",
+                    chat_id,
+                    retry_after,
+                )
+                chat_bucket.block_for(retry_after)
+                continue
+            self._stats.sent += 1
+            return
+
+    def _get_chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate_per_second=self._chat_rate_per_second,
+                capacity=self._chat_burst,
+            )
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _get_retry_after(self, error: Exception) -> float | None:
+        if getattr(error, "error_code", None) != 429:
+            return None
+        result_json = getattr(error, "result_json", None) or {}
+        parameters = result_json.get("parameters") or {}
+        return float(parameters.get("retry_after", 1))
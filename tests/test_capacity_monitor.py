@@ -0,0 +1,50 @@
+import asyncio
+
+from src.bounded_context.agent_control.services.capacity_monitor import (
+    CapacityMonitor,
+    CapacityState,
+)
+
+
+def test_state_changes_with_hysteresis():
+    sessions = 0
+    monitor = CapacityMonitor(
+        active_sessions=lambda: sessions,
+        max_active_sessions=100,
+        max_load_per_cpu=None,
+    )
+
+    async def states(values: list[int]) -> list[CapacityState]:
+        nonlocal sessions
+        result: list[CapacityState] = []
+        for value in values:
+            sessions = value
+            result.append((await monitor.sample()).state)
+        return result
+
+    observed = asyncio.run(states([50, 80, 75, 69, 100, 95, 89, 60]))
+
+    assert observed == [
+        CapacityState.NORMAL,
+        CapacityState.CONSTRAINED,
+        CapacityState.CONSTRAINED,  # stays until below relax_pressure
+        CapacityState.NORMAL,
+        CapacityState.OVERLOADED,
+        CapacityState.OVERLOADED,  # stays until below recover_pressure
+        CapacityState.CONSTRAINED,
+        CapacityState.NORMAL,
+    ]
+
+
+def test_snapshot_reports_session_pressure():
+    monitor = CapacityMonitor(
+        active_sessions=lambda: 3,
+        max_active_sessions=4,
+        max_load_per_cpu=None,
+    )
+
+    snapshot = asyncio.run(monitor.sample())
+
+    assert snapshot.active_sessions == 3
+    assert snapshot.pressure == 0.75
+    assert monitor.get_last_snapshot() == snapshot
@@ -0,0 +1,62 @@
+import zlib
+from datetime import UTC, datetime
+
+import pytest
+
+from src.messaging import ClaudeResponse, JsonCodec, MessageSerializer, decode_message
+from src.messaging.codecs import CODECS_BY_NAME, DEFLATE_ENCODING
+
+
+def _response(text: str = "hello") -> ClaudeResponse:
+    return ClaudeResponse(
+        request_id="req-1",
+        client_type="bot",
+        user_id=42,
+        response_type="text",
+        text=text,
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.parametrize("codec_name", sorted(CODECS_BY_NAME))
+def test_round_trip(codec_name: str):
+    message = _response()
+    encoded = MessageSerializer.from_name(codec_name).encode(message)
+
+    decoded = decode_message(
+        encoded.body, encoded.content_type, encoded.content_encoding, ClaudeResponse
+    )
+
+    assert encoded.content_encoding is None
+    assert decoded == message
+
+
+def test_compresses_bodies_over_the_threshold():
+    serializer = MessageSerializer(JsonCodec(), compress_threshold=500)
+
+    small = serializer.encode(_response("x"))
+    large = serializer.encode(_response("x" * 1000))
+
+    assert small.content_encoding is None
+    assert large.content_encoding == DEFLATE_ENCODING
+    assert len(large.body) < 1000
+    assert decode_message(
+        large.body, large.content_type, large.content_encoding, ClaudeResponse
+    ) == _response("x" * 1000)
+
+
+def test_missing_content_type_defaults_to_json():
+    body = _response().model_dump_json().encode()
+
+    assert decode_message(body, None, None, ClaudeResponse) == _response()
+
+
+def test_rejects_unknown_encodings_and_types():
+    body = zlib.compress(b"{}")
+
+    with pytest.raises(ValueError, match="content encoding"):
+        decode_message(body, JsonCodec.content_type, "gzip", ClaudeResponse)
+    with pytest.raises(ValueError, match="content type"):
+        decode_message(b"{}", "text/plain", None, ClaudeResponse)
+    with pytest.raises(ValueError, match="Unknown message codec"):
+        MessageSerializer.from_name("xml")
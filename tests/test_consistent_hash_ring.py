@@ -0,0 +1,44 @@
+from src.bounded_context.agent_control.services.consistent_hash_ring import (
+    ConsistentHashRing,
+)
+
+KEYS = [f"project-{i}" for i in range(500)]
+
+
+def test_empty_ring_has_no_owner():
+    assert ConsistentHashRing().get_node("project-1") is None
+
+
+def test_assignment_is_stable_and_order_independent():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    same_nodes = ConsistentHashRing(["c", "a", "b"])
+
+    assert [ring.get_node(key) for key in KEYS] == [
+        same_nodes.get_node(key) for key in KEYS
+    ]
+    assert {ring.get_node(key) for key in KEYS} == {"a", "b", "c"}
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    before = {key: ring.get_node(key) for key in KEYS}
+
+    ring.set_nodes(["a", "b"])
+
+    for key, owner in before.items():
+        if owner != "c":
+            assert ring.get_node(key) == owner
+        else:
+            assert ring.get_node(key) in {"a", "b"}
+
+
+def test_adding_a_node_takes_a_fair_share():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    before = {key: ring.get_node(key) for key in KEYS}
+
+    ring.set_nodes(["a", "b", "c", "d"])
+    moved = [key for key in KEYS if ring.get_node(key) != before[key]]
+
+    assert all(ring.get_node(key) == "d" for key in moved)
+    assert len(KEYS) * 0.1 < len(moved) < len(KEYS) * 0.4
+    assert ring.nodes == frozenset({"a", "b", "c", "d"})
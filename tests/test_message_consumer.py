@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any
+
+import aio_pika
+from pydantic import BaseModel
+
+from src.messaging import MessageConsumer, PermanentMessageError
+from src.messaging.consumer import (
+    DEATH_REASON_HEADER,
+    ORIGINAL_EXCHANGE_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    RETRY_ATTEMPT_HEADER,
+)
+
+
+class Ping(BaseModel):
+    value: int
+
+
+class FakeExchange:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, aio_pika.Message]] = []
+
+    async def publish(self, message: aio_pika.Message, routing_key: str) -> None:
+        self.published.append((routing_key, message))
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.default_exchange = FakeExchange()
+
+
+class FakeIncomingMessage:
+    def __init__(self, headers: dict[str, Any] | None = None) -> None:
+        self.body = Ping(value=1).model_dump_json().encode()
+        self.headers = headers or {}
+        self.exchange = "pings"
+        self.routing_key = "ping"
+        self.content_type = "application/json"
+        self.content_encoding = None
+        self.priority = None
+        self.acked = False
+        self.rejected = False
+
+    async def ack(self) -> None:
+        self.acked = True
+
+    async def reject(self, requeue: bool = False) -> None:
+        self.rejected = True
+
+
+class FailingConsumer(MessageConsumer[Ping]):
+    def __init__(self, error: Exception, **kwargs: Any) -> None:
+        super().__init__(
+            connection=None,  # pyright: ignore[reportArgumentType]
+            message_type=Ping,
+            exchange_name="pings",
+            queue_name="pings.worker.1",
+            routing_key="ping",
+            **kwargs,
+        )
+        self.error = error
+        self.dead: list[Ping | None] = []
+        self._channel = FakeChannel()  # pyright: ignore[reportAttributeAccessIssue]
+
+    @property
+    def exchange(self) -> FakeExchange:
+        return self._channel.default_exchange  # pyright: ignore[reportOptionalMemberAccess, reportReturnType]
+
+    async def _handle_message(self, message: Ping) -> None:
+        raise self.error
+
+    async def _on_dead_letter(self, message: Ping | None, error: Exception) -> None:
+        self.dead.append(message)
+
+
+def _process(consumer: FailingConsumer, message: FakeIncomingMessage) -> None:
+    asyncio.run(consumer._process_message(message))  # pyright: ignore[reportArgumentType, reportPrivateUsage]
+
+
+def test_transient_failure_goes_to_next_retry_queue():
+    consumer = FailingConsumer(ConnectionError("down"), retry_delays_seconds=(1, 5))
+    message = FakeIncomingMessage()
+
+    _process(consumer, message)
+
+    [(routing_key, republished)] = consumer.exchange.published
+    assert routing_key == "pings.worker.1.retry.1"
+    assert republished.headers[RETRY_ATTEMPT_HEADER] == 1
+    assert republished.headers[ORIGINAL_EXCHANGE_HEADER] == "pings"
+    assert republished.headers[ORIGINAL_ROUTING_KEY_HEADER] == "ping"
+    assert message.acked
+    assert consumer.dead == []
+
+
+def test_exhausted_retries_are_dead_lettered():
+    consumer = FailingConsumer(ConnectionError("down"), retry_delays_seconds=(1, 5))
+    message = FakeIncomingMessage({RETRY_ATTEMPT_HEADER: 2})
+
+    _process(consumer, message)
+
+    [(routing_key, republished)] = consumer.exchange.published
+    assert routing_key == "pings.worker.1.dead"
+    assert republished.headers[DEATH_REASON_HEADER] == "ConnectionError: down"
+    assert consumer.dead == [Ping(value=1)]
+    assert message.acked
+
+
+def test_permanent_failure_skips_retries():
+    consumer = FailingConsumer(PermanentMessageError("bad"), retry_delays_seconds=(1,))
+
+    _process(consumer, FakeIncomingMessage())
+
+    assert [key for key, _ in consumer.exchange.published] == ["pings.worker.1.dead"]
+
+
+def test_shared_retry_target_records_it_as_origin():
+    consumer = FailingConsumer(
+        ConnectionError("down"),
+        retry_delays_seconds=(1,),
+        retry_target_queue="pings",
+    )
+
+    _process(consumer, FakeIncomingMessage())
+
+    [(routing_key, republished)] = consumer.exchange.published
+    assert routing_key == "pings.retry.1"
+    assert republished.headers[ORIGINAL_EXCHANGE_HEADER] == ""
+    assert republished.headers[ORIGINAL_ROUTING_KEY_HEADER] == "pings"
+
+
+def test_without_retries_the_message_is_rejected():
+    consumer = FailingConsumer(ConnectionError("down"))
+    message = FakeIncomingMessage()
+
+    _process(consumer, message)
+
+    assert message.rejected
+    assert consumer.exchange.published == []
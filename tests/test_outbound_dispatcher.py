@@ -0,0 +1,91 @@
+import asyncio
+
+from src.shared.services.outbound_dispatcher import OutboundDispatcher
+
+
+class RateLimitedError(Exception):
+    error_code = 429
+    result_json = {"parameters": {"retry_after": 0.01}}
+
+
+def _dispatcher() -> OutboundDispatcher:
+    return OutboundDispatcher(global_rate_per_second=1000, chat_rate_per_second=1000)
+
+
+def test_sends_in_order_and_resolves_after_delivery():
+    sent: list[str] = []
+
+    async def scenario() -> None:
+        dispatcher = _dispatcher()
+        first = dispatcher.submit(1, lambda: sent.append("a"))
+        second = dispatcher.submit(1, lambda: sent.append("b"))
+        await second
+        assert first.done()
+        await dispatcher.close()
+
+    asyncio.run(scenario())
+
+    assert sent == ["a", "b"]
+
+
+def test_collapsed_jobs_resolve_with_their_replacement():
+    sent: list[str] = []
+
+    async def scenario() -> None:
+        dispatcher = _dispatcher()
+        gate = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        blocker = dispatcher.submit(
+            1, lambda: asyncio.run_coroutine_threadsafe(gate.wait(), loop).result()
+        )
+        await asyncio.sleep(0.01)
+        edits = [
+            dispatcher.submit(
+                1, lambda text=text: sent.append(text), collapse_key="edit"
+            )
+            for text in ("v1", "v2", "v3")
+        ]
+        gate.set()
+        await asyncio.gather(blocker, *edits)
+        stats = dispatcher.get_stats()
+        await dispatcher.close()
+        assert stats.collapsed == 2
+        assert stats.sent == 2
+
+    asyncio.run(scenario())
+
+    assert sent == ["v3"]
+
+
+def test_retries_after_rate_limit():
+    attempts: list[int] = []
+
+    def action() -> None:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RateLimitedError()
+
+    async def scenario() -> None:
+        dispatcher = _dispatcher()
+        await dispatcher.submit(7, action)
+        stats = dispatcher.get_stats()
+        await dispatcher.close()
+        assert (stats.rate_limited, stats.sent, stats.failed) == (1, 1, 0)
+        assert stats.pending == 0
+
+    asyncio.run(scenario())
+
+    assert attempts == [0, 1]
+
+
+def test_failed_delivery_still_resolves():
+    def action() -> None:
+        raise RuntimeError("chat not found")
+
+    async def scenario() -> None:
+        dispatcher = _dispatcher()
+        await dispatcher.submit(7, action)
+        assert dispatcher.get_stats().failed == 1
+        await dispatcher.close()
+
+    asyncio.run(scenario())
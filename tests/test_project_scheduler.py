@@ -0,0 +1,144 @@
+import asyncio
+
+from src.bounded_context.agent_control.services.project_scheduler import (
+    FlowKey,
+    ProjectScheduler,
+)
+
+
+async def _noop() -> None:
+    pass
+
+
+async def _run_blocked(
+    scheduler: ProjectScheduler,
+    runs: list[tuple[str, str, int]],
+) -> list[str]:
+    # Hold the only slot while every run is queued, then let them drain one
+    # at a time so the dispatch order is observable.
+    started: list[str] = []
+    gate = asyncio.Event()
+    blocker = asyncio.create_task(scheduler.run("blocker", gate.wait))
+    await asyncio.sleep(0)
+
+    async def record(project_id: str) -> None:
+        started.append(project_id)
+
+    tasks = [
+        asyncio.create_task(
+            scheduler.run(
+                project_id,
+                lambda project_id=project_id: record(project_id),
+                client_type=client_type,
+                user_id=user_id,
+            )
+        )
+        for project_id, client_type, user_id in runs
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.waiting_count == len(runs)
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+    return started
+
+
+def test_client_types_share_slots_by_weight():
+    scheduler = ProjectScheduler(
+        max_concurrent=1, class_weights={"telegram": 2, "web": 1}
+    )
+    runs = [(f"tg-{i}", "telegram", 1) for i in range(6)]
+    runs += [(f"web-{i}", "web", 2) for i in range(3)]
+
+    started = asyncio.run(_run_blocked(scheduler, runs))
+
+    assert started == [
+        "tg-0", "web-0", "tg-1",
+        "tg-2", "web-1", "tg-3",
+        "tg-4", "web-2", "tg-5",
+    ]  # fmt: skip
+
+
+def test_users_within_a_client_type_take_turns():
+    scheduler = ProjectScheduler(max_concurrent=1)
+    runs = [(f"a-{i}", "telegram", 1) for i in range(3)]
+    runs += [(f"b-{i}", "telegram", 2) for i in range(2)]
+
+    started = asyncio.run(_run_blocked(scheduler, runs))
+
+    assert started == ["a-0", "b-0", "a-1", "b-1", "a-2"]
+
+
+def test_runs_without_a_flow_share_the_default_flow():
+    scheduler = ProjectScheduler(max_concurrent=1)
+
+    async def scenario() -> None:
+        await scheduler.run("p1", _noop)
+
+    asyncio.run(scenario())
+
+    [stats] = scheduler.get_flow_stats()
+    assert (stats.client_type, stats.user_id) == ProjectScheduler.DEFAULT_FLOW
+    assert stats.dispatched == 1
+
+
+def test_flow_and_project_accounting():
+    scheduler = ProjectScheduler(max_concurrent=1)
+
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        blocker = asyncio.create_task(
+            scheduler.run("p1", gate.wait, client_type="telegram", user_id=1)
+        )
+        same_project = asyncio.create_task(
+            scheduler.run("p1", _noop, client_type="telegram", user_id=1)
+        )
+        cancelled = asyncio.create_task(
+            scheduler.run("p2", _noop, client_type="web", user_id=2)
+        )
+        await asyncio.sleep(0)
+        assert scheduler.running_count == 1
+        assert scheduler.waiting_count == 2
+
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+        assert scheduler.waiting_count == 1
+
+        gate.set()
+        await asyncio.gather(blocker, same_project)
+
+    asyncio.run(scenario())
+
+    flows = {FlowKey(s.client_type, s.user_id): s for s in scheduler.get_flow_stats()}
+    assert flows[FlowKey("telegram", 1)].queued == 0
+    assert flows[FlowKey("telegram", 1)].dispatched == 2
+    assert flows[FlowKey("web", 2)].queued == 0
+    assert flows[FlowKey("web", 2)].dispatched == 0
+
+    p1 = scheduler.get_project_stats("p1")
+    assert p1 is not None
+    assert (p1.queued, p1.running, p1.completed) == (0, 0, 2)
+    p2 = scheduler.get_project_stats("p2")
+    assert p2 is not None
+    assert (p2.queued, p2.running, p2.completed) == (0, 0, 0)
+    assert scheduler.running_count == 0
+    assert scheduler.waiting_count == 0
+
+
+def test_concurrency_limit_caps_running_projects():
+    scheduler = ProjectScheduler(max_concurrent=3)
+
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        scheduler.set_concurrency_limit(1)
+        tasks = [
+            asyncio.create_task(scheduler.run(f"p{i}", gate.wait)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.running_count == 1
+
+        scheduler.set_concurrency_limit(None)
+        assert scheduler.running_count == 3
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
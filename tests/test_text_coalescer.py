@@ -0,0 +1,96 @@
+import asyncio
+
+from workers.claude_service.text_coalescer import TextCoalescer
+
+
+def _coalescer(
+    published: list[str],
+    flush_interval_seconds: float = 10.0,
+    max_chars: int = 100,
+) -> TextCoalescer:
+    async def publish(text: str) -> None:
+        published.append(text)
+
+    return TextCoalescer(
+        publish=publish,
+        flush_interval_seconds=flush_interval_seconds,
+        max_chars=max_chars,
+    )
+
+
+def test_joins_blocks_until_flushed():
+    published: list[str] = []
+
+    async def scenario() -> None:
+        coalescer = _coalescer(published)
+        await coalescer.add("one")
+        await coalescer.add("two")
+        assert published == []
+        await coalescer.flush()
+
+    asyncio.run(scenario())
+
+    assert published == ["one\n\ntwo"]
+
+
+def test_flushes_before_exceeding_max_chars():
+    published: list[str] = []
+
+    async def scenario() -> None:
+        coalescer = _coalescer(published, max_chars=10)
+        await coalescer.add("12345")
+        await coalescer.add("123456")
+        await coalescer.add("1234567890")
+        coalescer.cancel()
+
+    asyncio.run(scenario())
+
+    assert published == ["12345", "123456", "1234567890"]
+
+
+def test_timer_flushes_idle_text():
+    published: list[str] = []
+
+    async def scenario() -> None:
+        coalescer = _coalescer(published, flush_interval_seconds=0.01)
+        await coalescer.add("late")
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+
+    assert published == ["late"]
+
+
+def test_failed_publish_keeps_the_text():
+    published: list[str] = []
+    attempts = 0
+
+    async def publish(text: str) -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError("broker down")
+        published.append(text)
+
+    async def scenario() -> None:
+        coalescer = TextCoalescer(publish, flush_interval_seconds=0.01, max_chars=100)
+        await coalescer.add("kept")
+        await asyncio.sleep(0.05)
+        await coalescer.flush()
+
+    asyncio.run(scenario())
+
+    assert published == ["kept"]
+
+
+def test_zero_interval_publishes_immediately():
+    published: list[str] = []
+
+    async def scenario() -> None:
+        coalescer = _coalescer(published, flush_interval_seconds=0)
+        await coalescer.add("a")
+        await coalescer.add("b")
+
+    asyncio.run(scenario())
+
+    assert published == ["a", "b"]
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from src.shared.services.token_bucket import TokenBucket
+
+
+async def _timed_acquires(bucket: TokenBucket, count: int) -> float:
+    started = time.monotonic()
+    for _ in range(count):
+        await bucket.acquire()
+    return time.monotonic() - started
+
+
+def test_burst_up_to_capacity_then_refills_at_rate():
+    async def scenario() -> None:
+        bucket = TokenBucket(rate_per_second=20, capacity=3)
+
+        assert await _timed_acquires(bucket, 3) < 0.03
+        assert not bucket.is_full
+        assert await _timed_acquires(bucket, 2) >= 0.09
+
+    asyncio.run(scenario())
+
+
+def test_block_for_empties_the_bucket():
+    async def scenario() -> None:
+        bucket = TokenBucket(rate_per_second=1000, capacity=5)
+        bucket.block_for(0.1)
+
+        assert not bucket.is_full
+        assert await _timed_acquires(bucket, 1) >= 0.09
+
+    asyncio.run(scenario())
+
+
+def test_is_full_after_idle():
+    async def scenario() -> None:
+        bucket = TokenBucket(rate_per_second=100, capacity=2)
+        await _timed_acquires(bucket, 2)
+        await asyncio.sleep(0.05)
+
+        assert bucket.is_full
+
+    asyncio.run(scenario())
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match="rate_per_second"):
+        TokenBucket(rate_per_second=0, capacity=1)
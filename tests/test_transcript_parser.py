@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from src.bounded_context.claude_service.entities.session_log_stats import (
+    SessionLogStats,
+)
+from src.bounded_context.claude_service.session_logs import scan_transcript
+from workers.analytics.transcript_scanner import scan_transcript_file
+
+
+def _assistant(
+    message_id: str, timestamp: str, tool_use: bool = False
+) -> dict[str, Any]:
+    content = [{"type": "tool_use", "name": "Bash"}] if tool_use else [{"type": "text"}]
+    return {
+        "type": "assistant",
+        "timestamp": timestamp,
+        "message": {
+            "id": message_id,
+            "model": "claude-test",
+            "content": content,
+            "usage": {
+                "input_tokens": 10,
+                "cache_read_input_tokens": 100,
+                "output_tokens": 5,
+            },
+        },
+    }
+
+
+def _user(timestamp: str, content: Any = "hi") -> dict[str, Any]:
+    return {"type": "user", "timestamp": timestamp, "message": {"content": content}}
+
+
+ENTRIES = [
+    _user("2026-01-01T10:00:00+00:00"),
+    _assistant("msg-1", "2026-01-01T10:00:05+00:00"),
+    # The second content block of msg-1 repeats its usage.
+    _assistant("msg-1", "2026-01-01T10:00:06+00:00", tool_use=True),
+    _user("2026-01-01T10:00:07+00:00", [{"type": "tool_result"}]),
+    _assistant("msg-2", "2026-01-01T10:00:10+00:00"),
+    _user("2026-01-01T10:01:10+00:00", [{"type": "text", "text": "next"}]),
+]
+
+
+def _write(path: Path, entries: list[dict[str, Any]], tail: str = "") -> None:
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries) + tail)
+
+
+def _scan(path: Path, stats: SessionLogStats | None = None) -> SessionLogStats:
+    stats = stats or SessionLogStats(claude_session_id=path.stem, project_dir="proj")
+    return scan_transcript(path, stats, path.stat().st_size)
+
+
+def test_counts_usage_once_per_message(tmp_path: Path):
+    path = tmp_path / "session.jsonl"
+    _write(path, ENTRIES)
+
+    stats = _scan(path)
+
+    assert stats.assistant_messages == 2
+    assert stats.tool_uses == 1
+    assert (stats.input_tokens, stats.cache_read_input_tokens) == (20, 200)
+    assert stats.output_tokens == 10
+    assert stats.turns == 2
+    assert stats.human_pause_seconds == 60.0
+    assert stats.model == "claude-test"
+    assert stats.byte_offset == path.stat().st_size
+
+
+def test_resumes_from_offset_and_skips_partial_lines(tmp_path: Path):
+    path = tmp_path / "session.jsonl"
+    partial = json.dumps(ENTRIES[4])
+    _write(path, ENTRIES[:4], tail=partial[:20])
+
+    first = _scan(path)
+    assert first.assistant_messages == 1
+    assert first.byte_offset < path.stat().st_size
+
+    _write(path, ENTRIES)
+    second = _scan(path, first)
+
+    assert second.assistant_messages == 2
+    assert second.turns == 2
+
+
+def test_truncated_transcript_is_reindexed(tmp_path: Path):
+    path = tmp_path / "session.jsonl"
+    _write(path, ENTRIES)
+    stats = _scan(path)
+
+    _write(path, ENTRIES[:2])
+    reindexed = _scan(path, stats)
+
+    assert reindexed.assistant_messages == 1
+    assert reindexed.byte_offset == path.stat().st_size
+
+
+def test_malformed_lines_are_skipped(tmp_path: Path):
+    path = tmp_path / "session.jsonl"
+    path.write_text("not json\n\n" + json.dumps(ENTRIES[1]) + "\n")
+
+    assert _scan(path).assistant_messages == 1
+
+
+def test_bulk_scanner_matches_incremental_parser(tmp_path: Path):
+    path = tmp_path / "session.jsonl"
+    _write(path, ENTRIES)
+
+    stats = _scan(path)
+    columns = scan_transcript_file(path)
+
+    assert len(columns.input_tokens) == stats.assistant_messages
+    assert sum(columns.input_tokens) == stats.input_tokens
+    assert sum(columns.cache_read_input_tokens) == stats.cache_read_input_tokens
+    assert sum(columns.output_tokens) == stats.output_tokens
+    assert sum(columns.tool_uses) == stats.tool_uses
+    assert columns.models == ["claude-test"]
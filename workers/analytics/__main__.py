@@ -0,0 +1,181 @@
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from src.bounded_context.claude_service.repos import (
+    UsageRollupRepo,
+    create_connection_pool,
+)
+from workers.analytics.rollup_writer import (
+    SessionRollup,
+    group_by_project,
+    summarize,
+    write_rollups,
+)
+from workers.analytics.transcript_scanner import (
+    TranscriptColumns,
+    scan_transcript_file,
+)
+
+logger = logging.getLogger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m workers.analytics",
+        description="Bulk-scan Claude Code transcripts and write usage rollups",
+    )
+    parser.add_argument(
+        "--projects-dir",
+        type=Path,
+        default=Path(os.environ.get("CLAUDE_PROJECTS_DIR", "~/.claude/projects")),
+    )
+    parser.add_argument(
+        "--since",
+        type=lambda value: datetime.fromisoformat(value).replace(tzinfo=UTC),
+        help="only scan transcripts modified on or after this date (YYYY-MM-DD)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--database-url", default=os.environ.get("CLAUDE_SERVICE_DB_URL"))
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="print project usage from the rollup tables instead of scanning",
+    )
+    parser.add_argument("--project", help="limit --report to one project_id")
+    return parser.parse_args()
+
+
+def find_transcripts(projects_dir: Path, since: datetime | None) -> list[Path]:
+    paths = sorted(projects_dir.expanduser().glob("*/*.jsonl"))
+    if since is None:
+        return paths
+    cutoff = since.timestamp()
+    return [path for path in paths if path.stat().st_mtime >= cutoff]
+
+
+def report(database_url: str, project_id: str | None, since: datetime | None) -> None:
+    pool = create_connection_pool(database_url, name="analytics-report", max_size=1)
+    try:
+        repo = UsageRollupRepo(pool)
+        if project_id is None:
+            for summary in repo.get_all_project_summaries():
+                logger.info(
+                    "%s: %d jobs, %d sessions, %d input / %d output tokens, $%s",
+                    summary.project_id,
+                    summary.jobs,
+                    summary.sessions,
+                    summary.input_tokens,
+                    summary.output_tokens,
+                    summary.cost_usd,
+                )
+            return
+
+        if since is None:
+            summary = repo.get_project_summary(project_id)
+            if summary is None:
+                logger.info("%s: no usage recorded", project_id)
+                return
+        else:
+            until = datetime.now(UTC).date() + timedelta(days=1)
+            summary = repo.get_period_summary(project_id, since.date(), until)
+            for day in repo.get_daily_usage(project_id, since.date(), until):
+                logger.info(
+                    "%s %s: %d jobs, %d input / %d output tokens, $%s",
+                    day.day,
+                    day.status,
+                    day.jobs,
+                    day.input_tokens,
+                    day.output_tokens,
+                    day.cost_usd,
+                )
+        logger.info(
+            "%s total: %d jobs, %d sessions, %d input / %d output tokens, $%s",
+            summary.project_id,
+            summary.jobs,
+            summary.sessions,
+            summary.input_tokens,
+            summary.output_tokens,
+            summary.cost_usd,
+        )
+    finally:
+        pool.close()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    load_dotenv()
+    args = parse_args()
+
+    if args.report:
+        if not args.database_url:
+            raise SystemExit("CLAUDE_SERVICE_DB_URL or --database-url is required")
+        report(args.database_url, args.project, args.since)
+        return
+
+    paths = find_transcripts(args.projects_dir, args.since)
+    logger.info("Scanning %d transcripts with %d workers", len(paths), args.workers)
+
+    rollups: dict[str, SessionRollup] = {}
+    transcripts: dict[str, TranscriptColumns] = {}
+    bytes_scanned = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for columns in pool.map(scan_transcript_file, paths, chunksize=8):
+            bytes_scanned += columns.bytes_scanned
+            rollup = summarize(columns)
+            previous = rollups.get(rollup.claude_session_id)
+            if previous is None or rollup.messages > previous.messages:
+                rollups[rollup.claude_session_id] = rollup
+                transcripts[rollup.claude_session_id] = columns
+    elapsed = time.perf_counter() - started
+
+    megabytes = bytes_scanned / BYTES_PER_MB
+    logger.info(
+        "Scanned %.1f MB in %.2fs (%.1f MB/s)",
+        megabytes,
+        elapsed,
+        megabytes / elapsed if elapsed > 0 else 0.0,
+    )
+    for project in group_by_project(list(rollups.values())):
+        logger.info(
+            "%s: %d sessions, %d messages, %d input / %d output tokens, %d tool uses",
+            project.project_dir,
+            project.sessions,
+            project.messages,
+            project.input_tokens,
+            project.output_tokens,
+            project.tool_uses,
+        )
+
+    if args.dry_run:
+        return
+    if not args.database_url:
+        raise SystemExit("CLAUDE_SERVICE_DB_URL or --database-url is required")
+
+    started = time.perf_counter()
+    sessions_updated, jobs_updated = write_rollups(
+        args.database_url, list(transcripts.values())
+    )
+    logger.info(
+        "Updated %d sessions and %d jobs in %.2fs",
+        sessions_updated,
+        jobs_updated,
+        time.perf_counter() - started,
+    )
+
+
+if __name__ == "__main__":
+    main()
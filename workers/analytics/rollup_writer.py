@@ -0,0 +1,177 @@
+from datetime import UTC, datetime
+
+import psycopg
+from pydantic import BaseModel
+
+from workers.analytics.transcript_scanner import TranscriptColumns
+
+
+class SessionRollup(BaseModel):
+    claude_session_id: str
+    project_dir: str
+    messages: int
+    input_tokens: int
+    output_tokens: int
+    tool_uses: int
+    models: list[str]
+    first_message_at: datetime | None
+    last_message_at: datetime | None
+
+
+class ProjectRollup(BaseModel):
+    project_dir: str
+    sessions: int = 0
+    messages: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_uses: int = 0
+
+
+def summarize(columns: TranscriptColumns) -> SessionRollup:
+    timestamps = [ts for ts in columns.timestamps_ms if ts > 0]
+    return SessionRollup(
+        claude_session_id=columns.claude_session_id,
+        project_dir=columns.project_dir,
+        messages=len(columns.input_tokens),
+        input_tokens=(
+            sum(columns.input_tokens)
+            + sum(columns.cache_creation_input_tokens)
+            + sum(columns.cache_read_input_tokens)
+        ),
+        output_tokens=sum(columns.output_tokens),
+        tool_uses=sum(columns.tool_uses),
+        models=columns.models,
+        first_message_at=_from_ms(min(timestamps)) if timestamps else None,
+        last_message_at=_from_ms(max(timestamps)) if timestamps else None,
+    )
+
+
+def group_by_project(rollups: list[SessionRollup]) -> list[ProjectRollup]:
+    projects: dict[str, ProjectRollup] = {}
+    for rollup in rollups:
+        project = projects.setdefault(
+            rollup.project_dir,
+            ProjectRollup(project_dir=rollup.project_dir),
+        )
+        project.sessions += 1
+        project.messages += rollup.messages
+        project.input_tokens += rollup.input_tokens
+        project.output_tokens += rollup.output_tokens
+        project.tool_uses += rollup.tool_uses
+    return sorted(projects.values(), key=lambda p: p.input_tokens, reverse=True)
+
+
+def write_rollups(
+    database_url: str, transcripts: list[TranscriptColumns]
+) -> tuple[int, int]:
+    with psycopg.connect(database_url) as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE transcript_messages (
+                    claude_session_id VARCHAR(255) NOT NULL,
+                    message_at TIMESTAMPTZ,
+                    input_tokens BIGINT NOT NULL,
+                    output_tokens BIGINT NOT NULL
+                ) ON COMMIT DROP
+            """)
+            with cur.copy(
+                """
+                COPY transcript_messages (
+                    claude_session_id, message_at, input_tokens, output_tokens
+                ) FROM STDIN
+                """
+            ) as copy:
+                for columns in transcripts:
+                    for i, timestamp_ms in enumerate(columns.timestamps_ms):
+                        copy.write_row(
+                            (
+                                columns.claude_session_id,
+                                _from_ms(timestamp_ms) if timestamp_ms > 0 else None,
+                                columns.input_tokens[i]
+                                + columns.cache_creation_input_tokens[i]
+                                + columns.cache_read_input_tokens[i],
+                                columns.output_tokens[i],
+                            )
+                        )
+
+            # A resumed Claude session appends to the same transcript, so each
+            # sessions row only gets the messages written between its own
+            # start and the start of the next row sharing the claude_session_id.
+            # The first row also takes anything logged before it started, and
+            # messages without a timestamp go to the latest row.
+            cur.execute("""
+                UPDATE sessions SET
+                    input_tokens = usage.input_tokens,
+                    output_tokens = usage.output_tokens,
+                    ended_at = COALESCE(sessions.ended_at, usage.last_message_at)
+                FROM (
+                    SELECT
+                        w.id,
+                        w.started_at,
+                        SUM(m.input_tokens) AS input_tokens,
+                        SUM(m.output_tokens) AS output_tokens,
+                        MAX(m.message_at) AS last_message_at
+                    FROM (
+                        SELECT
+                            id,
+                            started_at,
+                            claude_session_id,
+                            CASE
+                                WHEN LAG(started_at) OVER w IS NULL
+                                THEN '-infinity'::timestamptz
+                                ELSE started_at
+                            END AS window_start,
+                            COALESCE(
+                                LEAD(started_at) OVER w, 'infinity'::timestamptz
+                            ) AS window_end
+                        FROM sessions
+                        WHERE claude_session_id IN (
+                            SELECT DISTINCT claude_session_id FROM transcript_messages
+                        )
+                        WINDOW w AS (
+                            PARTITION BY claude_session_id ORDER BY started_at, id
+                        )
+                    ) w
+                    JOIN transcript_messages m
+                        ON m.claude_session_id = w.claude_session_id
+                        AND COALESCE(m.message_at, 'infinity'::timestamptz)
+                            >= w.window_start
+                        AND COALESCE(m.message_at, 'infinity'::timestamptz)
+                            < w.window_end
+                    GROUP BY w.id, w.started_at
+                ) usage
+                WHERE sessions.id = usage.id AND sessions.started_at = usage.started_at
+            """)
+            sessions_updated = cur.rowcount
+
+            cur.execute("""
+                UPDATE jobs SET
+                    total_input_tokens = totals.input_tokens,
+                    total_output_tokens = totals.output_tokens,
+                    total_cost_usd = totals.cost_usd,
+                    total_sessions = totals.sessions
+                FROM (
+                    SELECT
+                        job_id,
+                        SUM(input_tokens) AS input_tokens,
+                        SUM(output_tokens) AS output_tokens,
+                        COALESCE(SUM(cost_usd), 0) AS cost_usd,
+                        COUNT(*) AS sessions
+                    FROM sessions
+                    WHERE job_id IN (
+                        SELECT s.job_id
+                        FROM sessions s
+                        WHERE s.claude_session_id IN (
+                            SELECT DISTINCT claude_session_id FROM transcript_messages
+                        )
+                    )
+                    GROUP BY job_id
+                ) totals
+                WHERE jobs.id = totals.job_id
+            """)
+            jobs_updated = cur.rowcount
+    return sessions_updated, jobs_updated
+
+
+def _from_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=UTC)
@@ -0,0 +1,89 @@
+import mmap
+from array import array
+from pathlib import Path
+from typing import Any
+
+from src.bounded_context.claude_service.session_logs.transcript_parser import (
+    parse_assistant_message,
+    parse_line,
+    parse_timestamp,
+)
+
+ASSISTANT_MARKER = b'"assistant"'
+
+
+class TranscriptColumns:
+    def __init__(self, claude_session_id: str, project_dir: str) -> None:
+        self.claude_session_id = claude_session_id
+        self.project_dir = project_dir
+        self.bytes_scanned = 0
+        self.models: list[str] = []
+        self.model_index: array[int] = array("H")
+        self.timestamps_ms: array[int] = array("q")
+        self.input_tokens: array[int] = array("q")
+        self.cache_creation_input_tokens: array[int] = array("q")
+        self.cache_read_input_tokens: array[int] = array("q")
+        self.output_tokens: array[int] = array("q")
+        self.tool_uses: array[int] = array("l")
+
+
+def scan_transcript_file(path: Path) -> TranscriptColumns:
+    columns = TranscriptColumns(path.stem, path.parent.name)
+    size = path.stat().st_size
+    if size == 0:
+        return columns
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        model_ids: dict[str, int] = {}
+        last_message_id: str | None = None
+        position = 0
+        while position < size:
+            end = mm.find(b"\n", position)
+            if end < 0:
+                end = size
+            if mm.find(ASSISTANT_MARKER, position, end) >= 0:
+                last_message_id = _append_assistant_line(
+                    columns, model_ids, mm[position:end], last_message_id
+                )
+            position = end + 1
+        columns.bytes_scanned = size
+    return columns
+
+
+def _append_assistant_line(
+    columns: TranscriptColumns,
+    model_ids: dict[str, int],
+    line: bytes,
+    last_message_id: str | None,
+) -> str | None:
+    entry = parse_line(line)
+    if entry is None or entry.get("type") != "assistant":
+        return last_message_id
+    message: Any = entry.get("message")
+    if not isinstance(message, dict):
+        return last_message_id
+    parsed = parse_assistant_message(message)  # pyright: ignore[reportUnknownArgumentType]
+
+    # Content blocks of one API response share an id and repeat its usage.
+    if (
+        parsed.message_id is not None
+        and parsed.message_id == last_message_id
+        and columns.tool_uses
+    ):
+        columns.tool_uses[-1] += parsed.tool_uses
+        return last_message_id
+
+    model = parsed.model or "unknown"
+    if model not in model_ids:
+        model_ids[model] = len(columns.models)
+        columns.models.append(model)
+
+    timestamp = parse_timestamp(entry.get("timestamp"))
+    columns.model_index.append(model_ids[model])
+    columns.timestamps_ms.append(int(timestamp.timestamp() * 1000) if timestamp else 0)
+    columns.input_tokens.append(parsed.input_tokens)
+    columns.cache_creation_input_tokens.append(parsed.cache_creation_input_tokens)
+    columns.cache_read_input_tokens.append(parsed.cache_read_input_tokens)
+    columns.output_tokens.append(parsed.output_tokens)
+    columns.tool_uses.append(parsed.tool_uses)
+    return parsed.message_id
@@ -5,14 +5,14 @@ from pathlib import Path
 from bot_framework.app.bot_application import BotApplication
 from dotenv import load_dotenv
 
-from src.bounded_context.claude_service.repos.job_repo import JobRepo
-from src.flows.ask_flow import AskFlowFactory, RedisPendingPromptStorage
+from src.bounded_context.claude_service.repos import JobRepo, create_connection_pool
+from src.flows.ask_flow import AskFlowFactory
 from src.flows.ask_flow.repos import RedisJobSessionStorage
 from src.flows.execution_control_flow import ExecutionControlFlowFactory
 from src.flows.project_selection_flow import ProjectSelectionFlowFactory
 from src.flows.welcome_flow import WelcomeMenuSender
-from src.messaging import SyncMessagePublisher
-from src.shared import RedisMessageForReplaceStorage, RedisProjectSelectionStateStorage
+from src.messaging import MessageSerializer, SyncMessagePublisher
+from src.shared import CachedPhraseRepo, RedisUserStateStorage, create_redis_client
 from workers.bot.repo_collection import RepoCollection
 
 logger = logging.getLogger(__name__)
@@ -49,24 +49,53 @@ def main() -> None:
 
     app.set_start_allowed_roles({"admin", "developer"})
 
-    project_state_storage = RedisProjectSelectionStateStorage(redis_url)
-    message_for_replace_storage = RedisMessageForReplaceStorage(redis_url)
-    pending_prompt_storage = RedisPendingPromptStorage(redis_url)
-
-    request_publisher = SyncMessagePublisher(rabbitmq_url, "claude.requests")
-    stop_publisher = SyncMessagePublisher(rabbitmq_url, "claude.requests")
+    redis_client = create_redis_client(
+        redis_url,
+        max_connections=int(os.environ.get("REDIS_MAX_CONNECTIONS", "16")),
+    )
+    phrase_repo = CachedPhraseRepo(
+        phrase_repo=app.phrase_repo,
+        redis_client=redis_client,
+        phrases_json_path=data_path / "phrases.json",
+        languages_json_path=data_path / "languages.json",
+    )
+    phrase_repo.preload()
+    phrase_repo.publish_if_changed()
+    phrase_repo.start()
+
+    user_state_storage = RedisUserStateStorage(redis_client)
+    project_state_storage = user_state_storage
+    message_for_replace_storage = user_state_storage
+    pending_prompt_storage = user_state_storage
+
+    compress_threshold = os.environ.get("MESSAGING_COMPRESS_THRESHOLD_BYTES")
+    request_publisher = SyncMessagePublisher(
+        rabbitmq_url,
+        "claude.requests",
+        confirm_delivery=os.environ.get("RABBITMQ_PUBLISHER_CONFIRMS", "1") == "1",
+        serializer=MessageSerializer.from_name(
+            os.environ.get("MESSAGING_CODEC", "json"),
+            compress_threshold=int(compress_threshold) if compress_threshold else None,
+        ),
+    )
 
-    job_repo = JobRepo(claude_service_db_url)
-    job_session_storage = RedisJobSessionStorage(redis_url)
+    claude_service_db_pool = create_connection_pool(
+        claude_service_db_url,
+        name="bot.claude_service",
+        max_size=int(os.environ.get("CLAUDE_SERVICE_DB_POOL_SIZE", "5")),
+    )
+    job_repo = JobRepo(claude_service_db_pool)
+    job_session_storage = RedisJobSessionStorage(redis_client)
 
     project_selection_factory = ProjectSelectionFlowFactory(
         callback_answerer=app.callback_answerer,
         message_service=app.message_service,
-        phrase_repo=app.phrase_repo,
+        phrase_repo=phrase_repo,
         project_repo=repos.project_repo,
         state_storage=project_state_storage,
         message_for_replace_storage=message_for_replace_storage,
         user_repo=app.user_repo,
+        user_state_scope=user_state_storage,
     )
     project_selection_factory.register_handlers(
         callback_registry=app.callback_handler_registry,
@@ -75,11 +104,11 @@ def main() -> None:
     execution_control_factory = ExecutionControlFlowFactory(
         callback_answerer=app.callback_answerer,
         message_service=app.message_service,
-        phrase_repo=app.phrase_repo,
+        phrase_repo=phrase_repo,
         user_repo=app.user_repo,
         project_repo=repos.project_repo,
         project_state_storage=project_state_storage,
-        stop_publisher=stop_publisher,
+        stop_publisher=request_publisher,
     )
     execution_control_factory.register_handlers(
         callback_registry=app.callback_handler_registry,
@@ -88,7 +117,7 @@ def main() -> None:
     ask_flow_factory = AskFlowFactory(
         callback_answerer=app.callback_answerer,
         message_service=app.message_service,
-        phrase_repo=app.phrase_repo,
+        phrase_repo=phrase_repo,
         user_repo=app.user_repo,
         project_repo=repos.project_repo,
         job_repo=job_repo,
@@ -97,6 +126,7 @@ def main() -> None:
         pending_prompt_storage=pending_prompt_storage,
         message_for_replace_storage=message_for_replace_storage,
         request_publisher=request_publisher,
+        user_state_scope=user_state_storage,
     )
     ask_flow_factory.register_handlers(
         callback_registry=app.callback_handler_registry,
@@ -117,7 +147,7 @@ def main() -> None:
 
     welcome_menu_sender = WelcomeMenuSender(
         message_service=app.message_service,
-        phrase_repo=app.phrase_repo,
+        phrase_repo=phrase_repo,
         project_repo=repos.project_repo,
         state_storage=project_state_storage,
         message_for_replace_storage=message_for_replace_storage,
@@ -131,7 +161,14 @@ def main() -> None:
     )
 
     logger.info("Bot started")
-    app.run()
+    try:
+        app.run()
+    finally:
+        request_publisher.close()
+        claude_service_db_pool.close()
+        phrase_repo.stop()
+        repos.project_repo.stop_watching()
+        redis_client.close()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import logging
+from functools import partial
 from typing import Protocol
 
 from src.messaging import ClaudeResponse, MessageConsumer
 from src.messaging.connection import RabbitMQConnection
+from src.shared.services import OutboundDispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -35,26 +37,31 @@ class IPlanReadyPresenter(Protocol):
 
 
 class ClaudeResponseConsumer(MessageConsumer[ClaudeResponse]):
+    PROGRESS_COLLAPSE_KEY = "progress_text"
+    MAX_COLLAPSIBLE_TEXT_LENGTH = 4000
+
     def __init__(
         self,
         connection: RabbitMQConnection,
         progress_presenter: IProgressPresenter,
         ask_question_presenter: IAskQuestionPresenter,
         plan_ready_presenter: IPlanReadyPresenter,
+        dispatcher: OutboundDispatcher,
     ) -> None:
         super().__init__(
             connection=connection,
+            message_type=ClaudeResponse,
             exchange_name="claude.responses",
             queue_name="claude.responses.bot",
             routing_key="response.bot.*",
-            prefetch_count=10,
+            # Messages stay unacked until Telegram delivery finishes, so the
+            # prefetch bounds how many sends can be queued in the dispatcher.
+            prefetch_count=100,
         )
         self._progress_presenter = progress_presenter
         self._ask_question_presenter = ask_question_presenter
         self._plan_ready_presenter = plan_ready_presenter
-
-    def _parse_message(self, body: bytes) -> ClaudeResponse:
-        return ClaudeResponse.model_validate_json(body)
+        self._dispatcher = dispatcher
 
     async def _handle_message(self, message: ClaudeResponse) -> None:
         logger.info(
@@ -67,34 +74,58 @@ class ClaudeResponseConsumer(MessageConsumer[ClaudeResponse]):
         match message.response_type:
             case "text":
                 if message.text:
-                    self._progress_presenter.send_text(
+                    collapse_key = None
+                    if len(message.text) <= self.MAX_COLLAPSIBLE_TEXT_LENGTH:
+                        collapse_key = self.PROGRESS_COLLAPSE_KEY
+                    await self._dispatcher.submit(
                         chat_id=message.user_id,
-                        text=message.text,
+                        action=partial(
+                            self._progress_presenter.send_text,
+                            chat_id=message.user_id,
+                            text=message.text,
+                        ),
+                        collapse_key=collapse_key,
                     )
             case "ask_question":
                 if message.questions and message.session_id:
-                    self._ask_question_presenter.send(
+                    await self._dispatcher.submit(
                         chat_id=message.user_id,
-                        request_id=message.request_id,
-                        questions=message.questions,
-                        session_id=message.session_id,
+                        action=partial(
+                            self._ask_question_presenter.send,
+                            chat_id=message.user_id,
+                            request_id=message.request_id,
+                            questions=message.questions,
+                            session_id=message.session_id,
+                        ),
                     )
             case "plan_ready":
                 if message.session_id:
-                    self._plan_ready_presenter.send(
+                    await self._dispatcher.submit(
                         chat_id=message.user_id,
-                        request_id=message.request_id,
-                        plan_content=message.plan_content,
-                        accumulated_text=message.accumulated_text,
-                        session_id=message.session_id,
+                        action=partial(
+                            self._plan_ready_presenter.send,
+                            chat_id=message.user_id,
+                            request_id=message.request_id,
+                            plan_content=message.plan_content,
+                            accumulated_text=message.accumulated_text,
+                            session_id=message.session_id,
+                        ),
                     )
             case "completed":
-                self._progress_presenter.send_completed(
+                await self._dispatcher.submit(
                     chat_id=message.user_id,
-                    language_code="ru",
+                    action=partial(
+                        self._progress_presenter.send_completed,
+                        chat_id=message.user_id,
+                        language_code="ru",
+                    ),
                 )
             case "error":
-                self._progress_presenter.send_error(
+                await self._dispatcher.submit(
                     chat_id=message.user_id,
-                    error=message.error_message or "Unknown error",
+                    action=partial(
+                        self._progress_presenter.send_error,
+                        chat_id=message.user_id,
+                        error=message.error_message or "Unknown error",
+                    ),
                 )
@@ -9,3 +9,4 @@ class RepoCollection:
         environments_path: Path,
     ) -> None:
         self.project_repo = ProjectRepo(environments_path)
+        self.project_repo.start_watching()
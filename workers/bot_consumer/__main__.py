@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+from pathlib import Path
 
 from bot_framework.language_management.providers.redis_phrase_provider import (
     RedisPhraseProvider,
@@ -17,7 +18,8 @@ from src.flows.ask_flow.presenters.execution_progress_presenter import (
 )
 from src.flows.ask_flow.presenters.plan_ready_presenter import PlanReadyPresenter
 from src.messaging import RabbitMQConnection
-from src.shared import RedisMessageForReplaceStorage
+from src.shared import CachedPhraseRepo, RedisUserStateStorage, create_redis_client
+from src.shared.services import OutboundDispatcher
 from workers.bot.consumers.claude_response_consumer import ClaudeResponseConsumer
 
 logger = logging.getLogger(__name__)
@@ -36,8 +38,21 @@ async def main() -> None:
 
     core = TelegramMessageCore(bot_token=bot_token, use_class_middlewares=False)
     message_service = TelegramMessageService(core)
-    phrase_repo = RedisPhraseProvider(redis_url)
-    message_for_replace_storage = RedisMessageForReplaceStorage(redis_url)
+    data_path = Path(__file__).parent.parent.parent / "data"
+
+    redis_client = create_redis_client(
+        redis_url,
+        max_connections=int(os.environ.get("REDIS_MAX_CONNECTIONS", "16")),
+    )
+    phrase_repo = CachedPhraseRepo(
+        phrase_repo=RedisPhraseProvider(redis_url),
+        redis_client=redis_client,
+        phrases_json_path=data_path / "phrases.json",
+        languages_json_path=data_path / "languages.json",
+    )
+    await asyncio.to_thread(phrase_repo.preload)
+    phrase_repo.start()
+    message_for_replace_storage = RedisUserStateStorage(redis_client)
 
     progress_presenter = ExecutionProgressPresenter(
         message_service=message_service,
@@ -53,6 +68,12 @@ async def main() -> None:
         phrase_repo=phrase_repo,
     )
 
+    dispatcher = OutboundDispatcher(
+        max_workers=int(os.environ.get("TELEGRAM_OUTBOUND_WORKERS", "4")),
+        global_rate_per_second=float(os.environ.get("TELEGRAM_GLOBAL_RATE", "25")),
+        chat_rate_per_second=float(os.environ.get("TELEGRAM_CHAT_RATE", "1")),
+    )
+
     connection = RabbitMQConnection(rabbitmq_url)
     await connection.connect()
 
@@ -61,12 +82,23 @@ async def main() -> None:
         progress_presenter=progress_presenter,
         ask_question_presenter=ask_question_presenter,
         plan_ready_presenter=plan_ready_presenter,
+        dispatcher=dispatcher,
     )
 
     await consumer.start()
 
     logger.info("Bot consumer started, waiting for responses...")
-    await asyncio.Event().wait()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        # Stop taking responses and let the delivered ones reach Telegram and
+        # be acked before the connection closes.
+        await consumer.pause()
+        await consumer.wait_idle()
+        await dispatcher.close()
+        await connection.close()
+        phrase_repo.stop()
+        redis_client.close()
 
 
 if __name__ == "__main__":
@@ -1,22 +1,54 @@
 import asyncio
 import logging
 import os
+import socket
+from pathlib import Path
 
 from dotenv import load_dotenv
 
+from src.bounded_context.agent_control.repos import AsyncRedisWorkerRegistry
 from src.bounded_context.agent_control.services.agent_session_manager import (
     AgentSessionManager,
 )
+from src.bounded_context.agent_control.services.capacity_monitor import (
+    CapacityMonitor,
+    CapacitySnapshot,
+    CapacityState,
+)
+from src.bounded_context.agent_control.services.claude_client_pool import (
+    ClaudeClientPool,
+)
 from src.bounded_context.claude_service.migrations.runner import apply_migrations
-from src.bounded_context.claude_service.repos.job_repo import JobRepo
-from src.bounded_context.claude_service.repos.session_repo import SessionRepo
-from src.messaging import MessagePublisher, RabbitMQConnection
+from src.bounded_context.claude_service.repos import (
+    AsyncJobRepo,
+    AsyncSessionFinalizer,
+    AsyncSessionLogStatsRepo,
+    AsyncSessionPartitionMaintainer,
+    AsyncSessionRepo,
+    create_async_connection_pool,
+)
+from src.bounded_context.claude_service.session_logs import SessionLogIndexer
+from src.flows.ask_flow.repos import AsyncRedisJobSessionStorage
+from src.messaging import MessagePublisher, MessageSerializer, RabbitMQConnection
+from src.shared import create_async_redis_client
 from workers.claude_service.request_consumer import ClaudeRequestConsumer
+from workers.claude_service.request_router import RequestRouterConsumer
 from workers.claude_service.stop_consumer import StopRequestConsumer
+from workers.claude_service.stop_router import StopRouterConsumer
 
 logger = logging.getLogger(__name__)
 
 
+def parse_client_map(value: str) -> dict[str, int]:
+    result: dict[str, int] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        client_type, _, number = item.partition("=")
+        result[client_type.strip()] = int(number)
+    return result
+
+
 async def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
@@ -27,19 +59,112 @@ async def main() -> None:
     redis_url = os.environ["REDIS_URL"]
     rabbitmq_url = os.environ["RABBITMQ_URL"]
     claude_service_db_url = os.environ["CLAUDE_SERVICE_DB_URL"]
+    worker_id = os.environ.get("WORKER_ID") or socket.gethostname()
+    publisher_confirms = os.environ.get("RABBITMQ_PUBLISHER_CONFIRMS", "1") == "1"
+    compress_threshold = os.environ.get("MESSAGING_COMPRESS_THRESHOLD_BYTES")
+    serializer = MessageSerializer.from_name(
+        os.environ.get("MESSAGING_CODEC", "json"),
+        compress_threshold=int(compress_threshold) if compress_threshold else None,
+    )
+    client_weights = parse_client_map(
+        os.environ.get("CLAUDE_CLIENT_WEIGHTS", "bot=3,taskmanager=1")
+    )
+    client_priorities = parse_client_map(
+        os.environ.get("CLAUDE_CLIENT_PRIORITIES", "bot=5,taskmanager=1")
+    )
+    worker_heartbeat_ttl = float(os.environ.get("WORKER_HEARTBEAT_TTL_SECONDS", "15"))
+    max_concurrent_sessions = int(os.environ.get("CLAUDE_MAX_CONCURRENT_SESSIONS", "4"))
+    retry_delays = [
+        float(delay)
+        for delay in os.environ.get("CLAUDE_RETRY_DELAYS_SECONDS", "5,30,120").split(",")
+        if delay.strip()
+    ]
+    fair_queue_depth = int(
+        os.environ.get("CLAUDE_FAIR_QUEUE_DEPTH", str(max_concurrent_sessions * 8))
+    )
+    text_flush_interval_seconds = float(
+        os.environ.get("CLAUDE_TEXT_FLUSH_INTERVAL_SECONDS", "0.5")
+    )
+    text_flush_max_chars = int(os.environ.get("CLAUDE_TEXT_FLUSH_MAX_CHARS", "3000"))
+    session_history_size = int(os.environ.get("CLAUDE_SESSION_HISTORY_SIZE", "500"))
+    session_history_ttl = os.environ.get("CLAUDE_SESSION_HISTORY_TTL_SECONDS")
+    claude_projects_dir = Path(
+        os.environ.get("CLAUDE_PROJECTS_DIR", "~/.claude/projects")
+    ).expanduser()
+    log_index_interval = float(os.environ.get("CLAUDE_LOG_INDEX_INTERVAL_SECONDS", "60"))
+    session_retention_months = os.environ.get("SESSION_RETENTION_MONTHS")
+    partition_maintenance_interval = float(
+        os.environ.get("SESSION_PARTITION_MAINTENANCE_INTERVAL_SECONDS", "21600")
+    )
+    max_child_rss_mb = os.environ.get("CLAUDE_MAX_CHILD_RSS_MB")
+    max_active_sessions = os.environ.get("CLAUDE_MAX_ACTIVE_SESSIONS")
+    max_load_per_cpu = float(os.environ.get("CLAUDE_MAX_LOAD_PER_CPU", "1.5"))
+    capacity_interval = float(os.environ.get("CLAUDE_CAPACITY_INTERVAL_SECONDS", "5"))
+    warm_pool_size = int(os.environ.get("CLAUDE_WARM_POOL_SIZE", "1"))
+    warm_pool_max_idle = int(os.environ.get("CLAUDE_WARM_POOL_MAX_IDLE", "8"))
+    warm_pool_idle_timeout = float(
+        os.environ.get("CLAUDE_WARM_POOL_IDLE_TIMEOUT_SECONDS", "600")
+    )
 
     logger.info("Applying database migrations...")
-    apply_migrations(claude_service_db_url)
+    await asyncio.to_thread(apply_migrations, claude_service_db_url)
     logger.info("Database migrations applied")
 
-    job_repo = JobRepo(claude_service_db_url)
-    session_repo = SessionRepo(claude_service_db_url)
+    db_pool = await create_async_connection_pool(
+        claude_service_db_url,
+        name="claude_service",
+        max_size=max_concurrent_sessions + 2,
+    )
+    job_repo = AsyncJobRepo(db_pool)
+    session_repo = AsyncSessionRepo(db_pool)
+    session_finalizer = AsyncSessionFinalizer(db_pool)
+    session_log_indexer = SessionLogIndexer(
+        projects_dir=claude_projects_dir,
+        repo=AsyncSessionLogStatsRepo(db_pool),
+    )
+    partition_maintainer = AsyncSessionPartitionMaintainer(
+        db_pool,
+        retention_months=int(session_retention_months)
+        if session_retention_months
+        else None,
+    )
+    await partition_maintainer.maintain()
+    redis_client = create_async_redis_client(redis_url)
+    job_session_storage = AsyncRedisJobSessionStorage(redis_client)
+    worker_registry = AsyncRedisWorkerRegistry(
+        redis_client,
+        worker_id=worker_id,
+        heartbeat_ttl_seconds=worker_heartbeat_ttl,
+    )
+    await worker_registry.heartbeat()
+    heartbeat_task = asyncio.create_task(worker_registry.run_heartbeat())
 
     connection = RabbitMQConnection(rabbitmq_url)
     await connection.connect()
 
-    response_publisher = MessagePublisher(connection, "claude.responses")
-    session_manager = AgentSessionManager()
+    response_publisher = MessagePublisher(
+        connection,
+        "claude.responses",
+        confirm_delivery=publisher_confirms,
+        serializer=serializer,
+    )
+    routing_publisher = MessagePublisher(
+        connection,
+        "claude.requests",
+        confirm_delivery=publisher_confirms,
+        serializer=serializer,
+    )
+    client_pool = ClaudeClientPool(
+        size_per_key=warm_pool_size,
+        max_idle_clients=warm_pool_max_idle,
+        idle_timeout_seconds=warm_pool_idle_timeout,
+    )
+    client_pool.start()
+    session_manager = AgentSessionManager(
+        history_size=session_history_size,
+        history_ttl_seconds=float(session_history_ttl) if session_history_ttl else None,
+        client_pool=client_pool,
+    )
 
     request_consumer = ClaudeRequestConsumer(
         connection=connection,
@@ -47,19 +172,81 @@ async def main() -> None:
         response_publisher=response_publisher,
         job_repo=job_repo,
         session_repo=session_repo,
-        redis_url=redis_url,
+        session_finalizer=session_finalizer,
+        job_session_storage=job_session_storage,
+        worker_registry=worker_registry,
+        max_concurrent_sessions=max_concurrent_sessions,
+        text_flush_interval_seconds=text_flush_interval_seconds,
+        text_flush_max_chars=text_flush_max_chars,
+        client_weights=client_weights,
+        fair_queue_depth=fair_queue_depth,
+        retry_delays_seconds=retry_delays,
     )
 
     stop_consumer = StopRequestConsumer(
         connection=connection,
         session_manager=session_manager,
+        worker_id=worker_id,
     )
 
+    request_router = RequestRouterConsumer(
+        connection=connection,
+        publisher=routing_publisher,
+        worker_registry=worker_registry,
+        client_priorities=client_priorities,
+        retry_delays_seconds=retry_delays,
+    )
+    stop_router = StopRouterConsumer(
+        connection=connection,
+        publisher=routing_publisher,
+        worker_registry=worker_registry,
+    )
+
+    capacity_monitor = CapacityMonitor(
+        active_sessions=lambda: session_manager.get_stats().active_sessions,
+        max_child_rss_bytes=int(max_child_rss_mb) * 1024 * 1024
+        if max_child_rss_mb
+        else None,
+        max_active_sessions=int(max_active_sessions) if max_active_sessions else None,
+        max_load_per_cpu=max_load_per_cpu or None,
+        interval_seconds=capacity_interval,
+    )
+
+    async def apply_capacity(snapshot: CapacitySnapshot) -> None:
+        if snapshot.state == CapacityState.OVERLOADED:
+            client_pool.pause_refill()
+        else:
+            client_pool.resume_refill()
+        await request_consumer.apply_capacity(snapshot)
+
     await request_consumer.start()
     await stop_consumer.start()
+    await request_router.start()
+    await stop_router.start()
+
+    indexer_task = None
+    if log_index_interval > 0:
+        indexer_task = asyncio.create_task(session_log_indexer.run(log_index_interval))
+
+    capacity_task = asyncio.create_task(capacity_monitor.run(apply_capacity))
+    partition_task = asyncio.create_task(
+        partition_maintainer.run(partition_maintenance_interval)
+    )
 
-    logger.info("Claude Service started, waiting for requests...")
-    await asyncio.Event().wait()
+    logger.info("Claude Service %s started, waiting for requests...", worker_id)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if indexer_task is not None:
+            indexer_task.cancel()
+        partition_task.cancel()
+        capacity_task.cancel()
+        heartbeat_task.cancel()
+        await session_manager.close()
+        await response_publisher.close()
+        await routing_publisher.close()
+        await worker_registry.deregister()
+        await redis_client.aclose()
 
 
 if __name__ == "__main__":
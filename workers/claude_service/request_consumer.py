@@ -1,59 +1,180 @@
-import json
+import asyncio
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 from uuid import UUID, uuid4
 
-import redis
-from claude_code_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock
+import psycopg
+import redis.exceptions
+from aio_pika.abc import AbstractIncomingMessage
+from claude_code_sdk import (
+    AssistantMessage,
+    CLIConnectionError,
+    CLINotFoundError,
+    ResultMessage,
+    SystemMessage,
+    TextBlock,
+    ToolUseBlock,
+)
 
+from src.bounded_context.agent_control.repos import AsyncRedisWorkerRegistry
 from src.bounded_context.agent_control.services.agent_session_manager import (
     AgentSessionManager,
 )
+from src.bounded_context.agent_control.services.capacity_monitor import (
+    CapacitySnapshot,
+    CapacityState,
+)
+from src.bounded_context.agent_control.services.project_scheduler import (
+    FlowQueueStats,
+    ProjectQueueStats,
+    ProjectScheduler,
+)
 from src.bounded_context.claude_service.entities.job import JobStatus
 from src.bounded_context.claude_service.entities.session import Session
-from src.bounded_context.claude_service.repos.job_repo import JobRepo
-from src.bounded_context.claude_service.repos.session_repo import SessionRepo
+from src.bounded_context.claude_service.repos.async_job_repo import AsyncJobRepo
+from src.bounded_context.claude_service.entities.session_usage import SessionUsage
+from src.bounded_context.claude_service.repos.async_session_finalizer import (
+    AsyncSessionFinalizer,
+)
+from src.bounded_context.claude_service.repos.async_session_repo import (
+    AsyncSessionRepo,
+)
+from src.flows.ask_flow.repos.async_redis_job_session_storage import (
+    AsyncRedisJobSessionStorage,
+)
 from src.messaging import (
     ClaudeRequest,
     ClaudeResponse,
     MessageConsumer,
     MessagePublisher,
+    TransientMessageError,
 )
 from src.messaging.connection import RabbitMQConnection
+from workers.claude_service.request_router import (
+    MAX_REQUEST_PRIORITY,
+    worker_request_routing_key,
+)
+from workers.claude_service.text_coalescer import TextCoalescer
 
 logger = logging.getLogger(__name__)
 
 
 class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
-    SESSION_STORAGE_KEY_PREFIX = "agent_fleet:job_session:"
-    SESSION_TTL_SECONDS = 3600
+    TRANSIENT_ERRORS = (
+        *MessageConsumer.TRANSIENT_ERRORS,
+        psycopg.OperationalError,
+        redis.exceptions.ConnectionError,
+        redis.exceptions.TimeoutError,
+        CLIConnectionError,
+    )
+
+    # Requests left in the queue of a worker that went away expire back to
+    # the router, which sends them to a live worker. The idle queue is only
+    # deleted after that, so it must outlive the TTL. Retries and dead letters
+    # go through the router's queues, which outlive any single worker.
+    QUEUED_REQUEST_TTL_SECONDS = 300
+    IDLE_QUEUE_EXPIRES_SECONDS = 3600
 
     def __init__(
         self,
         connection: RabbitMQConnection,
         session_manager: AgentSessionManager,
         response_publisher: MessagePublisher,
-        job_repo: JobRepo,
-        session_repo: SessionRepo,
-        redis_url: str,
+        job_repo: AsyncJobRepo,
+        session_repo: AsyncSessionRepo,
+        session_finalizer: AsyncSessionFinalizer,
+        job_session_storage: AsyncRedisJobSessionStorage,
+        worker_registry: AsyncRedisWorkerRegistry,
+        max_concurrent_sessions: int = 4,
+        text_flush_interval_seconds: float = 0.5,
+        text_flush_max_chars: int = 3000,
+        client_weights: dict[str, int] | None = None,
+        fair_queue_depth: int | None = None,
+        retry_delays_seconds: Sequence[float] = (),
     ) -> None:
         super().__init__(
             connection=connection,
+            message_type=ClaudeRequest,
             exchange_name="claude.requests",
-            queue_name="claude.requests",
-            routing_key="claude.request",
-            prefetch_count=5,
+            queue_name=f"claude.requests.worker.{worker_registry.worker_id}",
+            routing_key=worker_request_routing_key(worker_registry.worker_id),
+            prefetch_count=fair_queue_depth or max_concurrent_sessions * 2,
+            queue_arguments={
+                "x-message-ttl": self.QUEUED_REQUEST_TTL_SECONDS * 1000,
+                "x-dead-letter-exchange": "claude.requests",
+                "x-dead-letter-routing-key": "claude.request",
+                "x-expires": self.IDLE_QUEUE_EXPIRES_SECONDS * 1000,
+                "x-max-priority": MAX_REQUEST_PRIORITY,
+            },
+            retry_delays_seconds=retry_delays_seconds,
+            retry_target_queue="claude.requests",
         )
         self._session_manager = session_manager
         self._response_publisher = response_publisher
         self._job_repo = job_repo
         self._session_repo = session_repo
-        self._redis = redis.from_url(redis_url)  # pyright: ignore[reportUnknownMemberType]
+        self._session_finalizer = session_finalizer
+        self._job_session_storage = job_session_storage
+        self._worker_registry = worker_registry
+        self._text_flush_interval_seconds = text_flush_interval_seconds
+        self._text_flush_max_chars = text_flush_max_chars
+        self._max_concurrent_sessions = max_concurrent_sessions
+        self._full_prefetch = fair_queue_depth or max_concurrent_sessions * 2
+        self._scheduler = ProjectScheduler(
+            max_concurrent=max_concurrent_sessions,
+            class_weights=client_weights,
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def get_project_queue_stats(self) -> list[ProjectQueueStats]:
+        return self._scheduler.get_stats()
+
+    def get_flow_queue_stats(self) -> list[FlowQueueStats]:
+        return self._scheduler.get_flow_stats()
+
+    async def _process_message(self, message: AbstractIncomingMessage) -> None:
+        task = asyncio.create_task(super()._process_message(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
 
-    def _parse_message(self, body: bytes) -> ClaudeRequest:
-        return ClaudeRequest.model_validate_json(body)
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Request processing failed",
+                exc_info=task.exception(),
+            )
+
+    async def apply_capacity(self, snapshot: CapacitySnapshot) -> None:
+        match snapshot.state:
+            case CapacityState.OVERLOADED:
+                self._scheduler.set_concurrency_limit(1)
+                await self.pause()
+            case CapacityState.CONSTRAINED:
+                self._scheduler.set_concurrency_limit(None)
+                await self.set_prefetch(self._max_concurrent_sessions)
+                await self.resume()
+            case CapacityState.NORMAL:
+                self._scheduler.set_concurrency_limit(None)
+                await self.set_prefetch(self._full_prefetch)
+                await self.resume()
+
+    def _is_transient(self, error: Exception) -> bool:
+        if isinstance(error, CLINotFoundError):
+            return False
+        return super()._is_transient(error)
+
+    async def _on_dead_letter(
+        self, message: ClaudeRequest | None, error: Exception
+    ) -> None:
+        if message is None:
+            return
+        if message.job_id:
+            await self._job_repo.update_status(message.job_id, JobStatus.FAILED)
+        await self._publish_error(message, str(error.__cause__ or error))
 
     async def _handle_message(self, message: ClaudeRequest) -> None:
         logger.info(
@@ -63,64 +184,103 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
             message.project_id,
             message.permission_mode,
         )
-        await self._execute_request(message)
+        try:
+            await self._scheduler.run(
+                message.project_id,
+                lambda: self._execute_request(message),
+                client_type=message.client_type,
+                user_id=message.user_id,
+            )
+        finally:
+            await self._release_project(message.project_id)
+
+    async def _release_project(self, project_id: str) -> None:
+        try:
+            if await self._worker_registry.release_project(project_id):
+                logger.debug("Released project %s", project_id)
+        except Exception:
+            logger.warning("Failed to release project %s", project_id, exc_info=True)
 
     async def _execute_request(self, request: ClaudeRequest) -> None:
         agent_session = None
         db_session_id = uuid4()
+        db_session_started_at = datetime.now(tz=UTC)
+        db_session_created = False
+        query_sent = False
+        claude_session_id: str | None = None
+        text_coalescer = TextCoalescer(
+            publish=lambda text: self._publish_text(request, text),
+            flush_interval_seconds=self._text_flush_interval_seconds,
+            max_chars=self._text_flush_max_chars,
+        )
 
         try:
-            db_session = Session(
-                id=db_session_id,
-                job_id=request.job_id or uuid4(),
-                started_at=datetime.now(tz=UTC),
-            )
-            self._session_repo.create(db_session)
-
-            if request.job_id:
-                self._job_repo.update_status(request.job_id, JobStatus.RUNNING)
-
-            agent_session = self._session_manager.create_session(
+            agent_session = await self._session_manager.start_session(
                 project_id=request.project_id,
                 working_directory=request.project_path,
                 permission_mode=request.permission_mode,
                 resume_session_id=request.session_id,
             )
+            await self._worker_registry.register_session(
+                request.project_id, agent_session.id
+            )
 
             client = self._session_manager.get_client(agent_session.id)
             if not client:
+                if request.job_id:
+                    await self._job_repo.update_status(request.job_id, JobStatus.FAILED)
                 await self._publish_error(request, "Failed to create client session")
                 return
 
-            await client.connect()
-
             prompt = request.prompt
             if request.answer_to_question:
                 prompt = self._format_answer(request.answer_to_question)
 
+            # The sessions row is created only once the agent is ready, so a
+            # transient failure while starting it retries without leaving a
+            # row behind for every attempt.
+            db_session_started_at = datetime.now(tz=UTC)
+            await self._session_repo.create(
+                Session(
+                    id=db_session_id,
+                    job_id=request.job_id or uuid4(),
+                    started_at=db_session_started_at,
+                )
+            )
+            db_session_created = True
+
+            if request.job_id:
+                await self._job_repo.update_status(request.job_id, JobStatus.RUNNING)
+
+            query_sent = True
             await client.query(prompt)
 
             accumulated_text: list[str] = []
             result_message: ResultMessage | None = None
 
             async for msg in client.receive_messages():
+                if isinstance(msg, SystemMessage) and msg.subtype == "init":
+                    claude_session_id = msg.data.get("session_id", claude_session_id)
+                    continue
                 if isinstance(msg, ResultMessage):
                     result_message = msg
+                    claude_session_id = msg.session_id
                     break
                 if isinstance(msg, AssistantMessage):
                     for block in msg.content:
                         if isinstance(block, ToolUseBlock):
+                            await text_coalescer.flush()
                             if block.name == "AskUserQuestion":
                                 await self._handle_ask_question(
                                     request=request,
                                     session_id=agent_session.id,
                                     questions=block.input.get("questions", []),  # pyright: ignore[reportUnknownMemberType]
                                 )
-                                self._save_job_session(agent_session.id, request.job_id)
-                                self._update_session_metrics(
+                                await self._save_job_session(agent_session.id, request.job_id)
+                                await self._finalize_session(
                                     db_session_id=db_session_id,
-                                    claude_session_id=agent_session.id,
-                                    job_id=request.job_id,
+                                    started_at=db_session_started_at,
+                                    claude_session_id=claude_session_id,
                                     result=result_message,
                                 )
                                 return
@@ -132,11 +292,11 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
                                     plan_content=block.input.get("plan"),  # pyright: ignore[reportUnknownMemberType]
                                     accumulated_text="\n".join(accumulated_text),
                                 )
-                                self._save_job_session(agent_session.id, request.job_id)
-                                self._update_session_metrics(
+                                await self._save_job_session(agent_session.id, request.job_id)
+                                await self._finalize_session(
                                     db_session_id=db_session_id,
-                                    claude_session_id=agent_session.id,
-                                    job_id=request.job_id,
+                                    started_at=db_session_started_at,
+                                    claude_session_id=claude_session_id,
                                     result=result_message,
                                 )
                                 return
@@ -145,28 +305,60 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
                             if request.permission_mode == "plan":
                                 accumulated_text.append(block.text)
                             else:
-                                await self._publish_text(request, block.text)
+                                await text_coalescer.add(block.text)
 
-            self._update_session_metrics(
+            await text_coalescer.flush()
+            await self._finalize_session(
                 db_session_id=db_session_id,
-                claude_session_id=agent_session.id,
-                job_id=request.job_id,
+                started_at=db_session_started_at,
+                claude_session_id=claude_session_id,
                 result=result_message,
+                job_status=JobStatus.COMPLETED,
             )
 
-            if request.job_id:
-                self._job_repo.update_status(request.job_id, JobStatus.COMPLETED)
-
             await self._publish_completed(request, agent_session.id)
 
         except Exception as e:
+            if not query_sent and self._retry_delays_seconds and self._is_transient(e):
+                # Nothing has reached the agent or the user yet, so the request
+                # can safely go back through the retry queues.
+                logger.warning(
+                    "Transient error before request %s started: %s",
+                    request.request_id,
+                    e,
+                )
+                if db_session_created:
+                    await self._finalize_session(
+                        db_session_id=db_session_id,
+                        started_at=db_session_started_at,
+                        claude_session_id=claude_session_id,
+                        result=None,
+                        job_status=JobStatus.PENDING,
+                    )
+                raise TransientMessageError(str(e)) from e
+
             logger.exception("Error executing request %s", request.request_id)
-            if request.job_id:
-                self._job_repo.update_status(request.job_id, JobStatus.FAILED)
+            if db_session_created:
+                await self._finalize_session(
+                    db_session_id=db_session_id,
+                    started_at=db_session_started_at,
+                    claude_session_id=claude_session_id,
+                    result=None,
+                    job_status=JobStatus.FAILED,
+                )
+            elif request.job_id:
+                await self._job_repo.update_status(request.job_id, JobStatus.FAILED)
+            await text_coalescer.flush()
             await self._publish_error(request, str(e))
         finally:
+            text_coalescer.cancel()
             if agent_session:
-                await self._session_manager.close_session(agent_session.id)
+                try:
+                    await self._worker_registry.unregister_session(
+                        request.project_id, agent_session.id
+                    )
+                finally:
+                    await self._session_manager.close_session(agent_session.id)
 
     def _format_answer(self, answer: dict[str, str]) -> str:
         parts = []
@@ -174,44 +366,34 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
             parts.append(f"{question_id}: {answer_text}")
         return "\n".join(parts)
 
-    def _update_session_metrics(
+    async def _finalize_session(
         self,
         db_session_id: UUID,
-        claude_session_id: str,
-        job_id: UUID | None,
+        started_at: datetime,
+        claude_session_id: str | None,
         result: ResultMessage | None,
+        job_status: JobStatus | None = None,
     ) -> None:
-        if result is None:
-            return
-
-        input_tokens, output_tokens, cost_usd = self._extract_metrics(result)
-
-        self._session_repo.update_metrics(
+        await self._session_finalizer.finalize(
             session_id=db_session_id,
+            started_at=started_at,
             claude_session_id=claude_session_id,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_usd=cost_usd,
+            usage=self._extract_usage(result) if result else None,
+            job_status=job_status,
         )
 
-        if job_id:
-            self._job_repo.increment_metrics(
-                job_id=job_id,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost_usd=cost_usd,
-            )
-
-    def _extract_metrics(self, result: ResultMessage) -> tuple[int, int, Decimal]:
+    def _extract_usage(self, result: ResultMessage) -> SessionUsage:
         usage = result.usage or {}
         input_tokens = (
             usage.get("input_tokens", 0)
             + usage.get("cache_creation_input_tokens", 0)
             + usage.get("cache_read_input_tokens", 0)
         )
-        output_tokens = usage.get("output_tokens", 0)
-        cost_usd = Decimal(str(result.total_cost_usd or 0))
-        return input_tokens, output_tokens, cost_usd
+        return SessionUsage(
+            input_tokens=input_tokens,
+            output_tokens=usage.get("output_tokens", 0),
+            cost_usd=Decimal(str(result.total_cost_usd or 0)),
+        )
 
     async def _handle_ask_question(
         self,
@@ -231,6 +413,8 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
         await self._response_publisher.publish(
             message=response,
             routing_key=f"response.{request.client_type}.ask_question",
+            ordering_key=request.request_id,
+            wait_for_confirm=True,
         )
 
     async def _handle_plan_ready(
@@ -253,6 +437,8 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
         await self._response_publisher.publish(
             message=response,
             routing_key=f"response.{request.client_type}.plan_ready",
+            ordering_key=request.request_id,
+            wait_for_confirm=True,
         )
 
     async def _publish_text(self, request: ClaudeRequest, text: str) -> None:
@@ -267,6 +453,7 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
         await self._response_publisher.publish(
             message=response,
             routing_key=f"response.{request.client_type}.text",
+            ordering_key=request.request_id,
         )
 
     async def _publish_completed(
@@ -283,6 +470,8 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
         await self._response_publisher.publish(
             message=response,
             routing_key=f"response.{request.client_type}.completed",
+            ordering_key=request.request_id,
+            wait_for_confirm=True,
         )
 
     async def _publish_error(
@@ -299,11 +488,11 @@ class ClaudeRequestConsumer(MessageConsumer[ClaudeRequest]):
         await self._response_publisher.publish(
             message=response,
             routing_key=f"response.{request.client_type}.error",
+            ordering_key=request.request_id,
+            wait_for_confirm=True,
         )
 
-    def _save_job_session(self, session_id: str, job_id: UUID | None) -> None:
+    async def _save_job_session(self, session_id: str, job_id: UUID | None) -> None:
         if job_id is None:
             return
-        key = f"{self.SESSION_STORAGE_KEY_PREFIX}{session_id}"
-        data = json.dumps({"job_id": str(job_id)})
-        self._redis.set(key, data, ex=self.SESSION_TTL_SECONDS)
+        await self._job_session_storage.save_job_id(session_id, job_id)
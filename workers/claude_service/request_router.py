@@ -0,0 +1,106 @@
+import logging
+from collections.abc import Sequence
+
+import redis.exceptions
+from aio_pika.abc import AbstractIncomingMessage
+
+from src.bounded_context.agent_control.repos import AsyncRedisWorkerRegistry
+from src.bounded_context.agent_control.services.consistent_hash_ring import (
+    ConsistentHashRing,
+)
+from src.messaging import (
+    ClaudeRequest,
+    MessageConsumer,
+    MessagePublisher,
+    PermanentMessageError,
+)
+from src.messaging.connection import RabbitMQConnection
+
+logger = logging.getLogger(__name__)
+
+# Worker request queues are declared with this x-max-priority. It is fixed
+# because changing it on an existing queue fails the declare.
+MAX_REQUEST_PRIORITY = 10
+
+
+def worker_request_routing_key(worker_id: str) -> str:
+    return f"claude.request.worker.{worker_id}"
+
+
+def worker_stop_routing_key(worker_id: str) -> str:
+    return f"claude.stop.worker.{worker_id}"
+
+
+class RequestRouterConsumer(MessageConsumer[ClaudeRequest]):
+    TRANSIENT_ERRORS = (
+        *MessageConsumer.TRANSIENT_ERRORS,
+        redis.exceptions.ConnectionError,
+        redis.exceptions.TimeoutError,
+    )
+
+    def __init__(
+        self,
+        connection: RabbitMQConnection,
+        publisher: MessagePublisher,
+        worker_registry: AsyncRedisWorkerRegistry,
+        ring: ConsistentHashRing | None = None,
+        client_priorities: dict[str, int] | None = None,
+        retry_delays_seconds: Sequence[float] = (),
+    ) -> None:
+        super().__init__(
+            connection=connection,
+            message_type=ClaudeRequest,
+            exchange_name="claude.requests",
+            queue_name="claude.requests",
+            routing_key="claude.request",
+            prefetch_count=20,
+            retry_delays_seconds=retry_delays_seconds,
+        )
+        self._publisher = publisher
+        self._worker_registry = worker_registry
+        self._ring = ring or ConsistentHashRing()
+        self._client_priorities = {
+            client_type: max(0, min(priority, MAX_REQUEST_PRIORITY))
+            for client_type, priority in (client_priorities or {}).items()
+        }
+
+    async def _handle_message(self, message: ClaudeRequest) -> None:
+        worker_id = await self._select_worker(message.project_id)
+        logger.debug(
+            "Routing request %s for project %s to worker %s",
+            message.request_id,
+            message.project_id,
+            worker_id,
+        )
+        await self._publisher.publish(
+            message=message,
+            routing_key=worker_request_routing_key(worker_id),
+            wait_for_confirm=True,
+            priority=self._client_priorities.get(message.client_type),
+        )
+
+    def _parse_message(self, message: AbstractIncomingMessage) -> ClaudeRequest:
+        # Worker queues dead-letter back here so requests that expired in
+        # the queue of a worker that went away get routed again. A request a
+        # worker rejected would only fail again, so it is not re-routed.
+        deaths = message.headers.get("x-death")
+        if isinstance(deaths, list) and deaths:
+            reason = deaths[0].get("reason")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportAttributeAccessIssue]
+            if isinstance(reason, bytes):
+                reason = reason.decode("utf-8")
+            if reason != "expired":
+                raise PermanentMessageError(
+                    f"Request was dead-lettered by a worker queue ({reason})"
+                )
+        return super()._parse_message(message)
+
+    async def _select_worker(self, project_id: str) -> str:
+        owners = await self._worker_registry.get_session_owners(project_id)
+        if owners:
+            candidate = min(owners)
+        else:
+            self._ring.set_nodes(await self._worker_registry.get_live_workers())
+            candidate = self._ring.get_node(project_id) or self._worker_registry.worker_id
+        # Pins the project until its owner has drained every request routed
+        # to it, so a ring change does not split a project across workers.
+        return await self._worker_registry.claim_project(project_id, candidate)
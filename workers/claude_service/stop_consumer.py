@@ -5,6 +5,7 @@ from src.bounded_context.agent_control.services.agent_session_manager import (
 )
 from src.messaging import MessageConsumer, StopRequest
 from src.messaging.connection import RabbitMQConnection
+from workers.claude_service.request_router import worker_stop_routing_key
 
 logger = logging.getLogger(__name__)
 
@@ -14,19 +15,20 @@ class StopRequestConsumer(MessageConsumer[StopRequest]):
         self,
         connection: RabbitMQConnection,
         session_manager: AgentSessionManager,
+        worker_id: str,
     ) -> None:
         super().__init__(
             connection=connection,
+            message_type=StopRequest,
             exchange_name="claude.requests",
-            queue_name="claude.stop",
-            routing_key="claude.stop",
+            queue_name=f"claude.stop.worker.{worker_id}",
+            routing_key=worker_stop_routing_key(worker_id),
             prefetch_count=5,
+            durable=False,
+            auto_delete=True,
         )
         self._session_manager = session_manager
 
-    def _parse_message(self, body: bytes) -> StopRequest:
-        return StopRequest.model_validate_json(body)
-
     async def _handle_message(self, message: StopRequest) -> None:
         logger.info(
             "Processing stop request for user %s (project: %s)",
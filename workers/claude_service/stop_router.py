@@ -0,0 +1,39 @@
+import logging
+
+from src.bounded_context.agent_control.repos import AsyncRedisWorkerRegistry
+from src.messaging import MessageConsumer, MessagePublisher, StopRequest
+from src.messaging.connection import RabbitMQConnection
+from workers.claude_service.request_router import worker_stop_routing_key
+
+logger = logging.getLogger(__name__)
+
+
+class StopRouterConsumer(MessageConsumer[StopRequest]):
+    def __init__(
+        self,
+        connection: RabbitMQConnection,
+        publisher: MessagePublisher,
+        worker_registry: AsyncRedisWorkerRegistry,
+    ) -> None:
+        super().__init__(
+            connection=connection,
+            message_type=StopRequest,
+            exchange_name="claude.requests",
+            queue_name="claude.stop",
+            routing_key="claude.stop",
+            prefetch_count=5,
+        )
+        self._publisher = publisher
+        self._worker_registry = worker_registry
+
+    async def _handle_message(self, message: StopRequest) -> None:
+        owners = await self._worker_registry.get_session_owners(message.project_id)
+        if not owners:
+            logger.info("No worker owns an active session for project %s", message.project_id)
+            return
+        for worker_id in sorted(owners):
+            await self._publisher.publish(
+                message=message,
+                routing_key=worker_stop_routing_key(worker_id),
+                wait_for_confirm=True,
+            )
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class TextCoalescer:
+    SEPARATOR = "\n\n"
+
+    def __init__(
+        self,
+        publish: Callable[[str], Awaitable[None]],
+        flush_interval_seconds: float,
+        max_chars: int,
+    ) -> None:
+        self._publish = publish
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_chars = max_chars
+        self._buffer: list[str] = []
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._timer_flushing = False
+
+    async def add(self, text: str) -> None:
+        if self._flush_interval_seconds <= 0:
+            await self._publish(text)
+            return
+
+        async with self._lock:
+            if self._buffer and self._size + len(text) > self._max_chars:
+                await self._flush_locked()
+            self._buffer.append(text)
+            self._size += len(text)
+            if self._size >= self._max_chars:
+                await self._flush_locked()
+                return
+
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        self.cancel()
+        async with self._lock:
+            await self._flush_locked()
+
+    def cancel(self) -> None:
+        # A timer that is already publishing is left to finish; cancelling it
+        # mid-publish could deliver the text twice or not at all.
+        if self._timer is not None and not self._timer_flushing:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval_seconds)
+        self._timer_flushing = True
+        try:
+            async with self._lock:
+                await self._flush_locked()
+        except Exception:
+            logger.exception("Failed to publish coalesced text, keeping it buffered")
+        finally:
+            self._timer = None
+            self._timer_flushing = False
+
+    async def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        await self._publish(self.SEPARATOR.join(self._buffer))
+        # Only drop the text once it is published, so a failed publish leaves
+        # it for the next flush.
+        self._buffer.clear()
+        self._size = 0
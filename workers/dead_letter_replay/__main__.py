@@ -0,0 +1,128 @@
+import argparse
+import logging
+import os
+
+import pika
+from dotenv import load_dotenv
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import NackError, UnroutableError
+
+from src.messaging.consumer import (
+    DEATH_REASON_HEADER,
+    ORIGINAL_EXCHANGE_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    RETRY_ATTEMPT_HEADER,
+)
+
+logger = logging.getLogger(__name__)
+
+REPLAY_STRIPPED_HEADERS = (
+    RETRY_ATTEMPT_HEADER,
+    ORIGINAL_EXCHANGE_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    DEATH_REASON_HEADER,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m workers.dead_letter_replay",
+        description="Move dead-lettered messages back to their original exchange",
+    )
+    parser.add_argument("queue", help="dead-letter queue, e.g. claude.requests.dead")
+    parser.add_argument("--rabbitmq-url", default=os.environ.get("RABBITMQ_URL"))
+    parser.add_argument(
+        "--exchange",
+        help="publish to this exchange instead of the recorded original one",
+    )
+    parser.add_argument(
+        "--routing-key",
+        help="publish with this routing key instead of the recorded original one",
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="list messages and their failure reasons without moving them",
+    )
+    return parser.parse_args()
+
+
+def replay(channel: BlockingChannel, args: argparse.Namespace) -> int:
+    replayed = 0
+    held: list[int] = []
+    while args.limit is None or replayed < args.limit:
+        method, properties, body = channel.basic_get(args.queue, auto_ack=False)
+        if method is None:
+            break
+        headers = dict(properties.headers or {})
+        exchange = args.exchange or headers.get(ORIGINAL_EXCHANGE_HEADER)
+        routing_key = args.routing_key or headers.get(ORIGINAL_ROUTING_KEY_HEADER)
+        logger.info(
+            "%s -> %s/%s (%s)",
+            properties.message_id or method.delivery_tag,
+            exchange,
+            routing_key,
+            headers.get(DEATH_REASON_HEADER, "unknown reason"),
+        )
+
+        if args.dry_run:
+            held.append(method.delivery_tag)
+            replayed += 1
+            continue
+        if exchange is None or routing_key is None:
+            logger.warning("No original destination recorded, leaving message")
+            held.append(method.delivery_tag)
+            continue
+
+        for header in REPLAY_STRIPPED_HEADERS:
+            headers.pop(header, None)
+        properties.headers = headers
+        try:
+            channel.basic_publish(
+                exchange=exchange,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+                mandatory=True,
+            )
+        except UnroutableError:
+            logger.warning("No queue is bound for %s/%s, leaving message", exchange, routing_key)
+            held.append(method.delivery_tag)
+            continue
+        except NackError:
+            logger.warning("Broker rejected message for %s/%s, leaving message", exchange, routing_key)
+            held.append(method.delivery_tag)
+            continue
+        channel.basic_ack(method.delivery_tag)
+        replayed += 1
+
+    for delivery_tag in held:
+        channel.basic_nack(delivery_tag, requeue=True)
+    return replayed
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    load_dotenv()
+    args = parse_args()
+    if not args.rabbitmq_url:
+        raise SystemExit("RABBITMQ_URL is not set")
+
+    connection = pika.BlockingConnection(pika.URLParameters(args.rabbitmq_url))
+    try:
+        channel = connection.channel()
+        channel.confirm_delivery()
+        count = replay(channel, args)
+    finally:
+        connection.close()
+
+    action = "Found" if args.dry_run else "Replayed"
+    logger.info("%s %d message(s) from %s", action, count, args.queue)
+
+
+if __name__ == "__main__":
+    main()